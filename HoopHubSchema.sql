@@ -17,6 +17,7 @@ CREATE TABLE Team(
     Conference VARCHAR(10),
     Division VARCHAR(20),
     CoachID INTEGER NOT NULL,
+    INDEX idx_team_name (Name),
     FOREIGN KEY (CoachID) REFERENCES HeadCoach(CoachID)
 );
 
@@ -30,6 +31,9 @@ CREATE TABLE Player(
     Number INTEGER,
     HeightInches INTEGER,
     WeightPounds INTEGER,
+    FullName VARCHAR(41) GENERATED ALWAYS AS (CONCAT(FirstName, ' ', LastName)) STORED,
+    INDEX idx_player_fullname (FullName),
+    INDEX idx_player_team_name (TeamID, FullName),
     FOREIGN KEY (TeamID) REFERENCES Team(TeamID)
 );
 
@@ -50,6 +54,9 @@ CREATE TABLE Game(
     HomeTeamScore INTEGER,
     AwayTeamScore INTEGER,
     Attendance INTEGER,
+    INDEX idx_game_date (Date),
+    INDEX idx_game_home_date (HomeTeamID, Date),
+    INDEX idx_game_away_date (AwayTeamID, Date),
     FOREIGN KEY (HomeTeamID) REFERENCES Team(TeamID),
     FOREIGN KEY (AwayTeamID) REFERENCES Team(TeamID),
     FOREIGN KEY (VenueID) REFERENCES Venue(VenueID)
@@ -66,7 +73,135 @@ CREATE TABLE PlayerGameStats(
     Turnovers INTEGER,
     Fouls INTEGER,
     Minutes INTEGER,
+    -- team the player played for in this game (not their current team)
+    TeamID INTEGER,
     PRIMARY KEY (GameID, PlayerID),
+    INDEX idx_pgs_game_team (GameID, TeamID),
     FOREIGN KEY (GameID) REFERENCES Game(GameID),
+    FOREIGN KEY (PlayerID) REFERENCES Player(PlayerID),
+    FOREIGN KEY (TeamID) REFERENCES Team(TeamID)
+);
+
+-- single-row counter bumped by every write path; db_operations clears
+-- its read cache whenever the value changes
+CREATE TABLE DataVersion(
+    VersionID INTEGER PRIMARY KEY NOT NULL,
+    Version BIGINT NOT NULL DEFAULT 0
+);
+
+INSERT INTO DataVersion (VersionID, Version) VALUES (1, 0);
+
+
+-- per-team standings, kept up to date by the Game insert scripts
+-- (Stats_Scores/summary_tables.py) and rebuilt by RebuildSummaries.py
+CREATE TABLE TeamSeasonSummary(
+    TeamID INTEGER PRIMARY KEY NOT NULL,
+    Wins INTEGER NOT NULL DEFAULT 0,
+    Losses INTEGER NOT NULL DEFAULT 0,
+    HomeWins INTEGER NOT NULL DEFAULT 0,
+    HomeLosses INTEGER NOT NULL DEFAULT 0,
+    AwayWins INTEGER NOT NULL DEFAULT 0,
+    AwayLosses INTEGER NOT NULL DEFAULT 0,
+    PointsFor INTEGER NOT NULL DEFAULT 0,
+    PointsAgainst INTEGER NOT NULL DEFAULT 0,
+    GamesPlayed INTEGER NOT NULL DEFAULT 0,
+    WinPercentage DECIMAL(4,3) NOT NULL DEFAULT 0,
+    FOREIGN KEY (TeamID) REFERENCES Team(TeamID)
+);
+
+-- per-player season sums; averages are derived at read time.
+-- Kept up to date by the stats insert scripts and rebuilt by RebuildSummaries.py
+CREATE TABLE PlayerSeasonTotals(
+    PlayerID INTEGER PRIMARY KEY NOT NULL,
+    GamesPlayed INTEGER NOT NULL DEFAULT 0,
+    Points INTEGER NOT NULL DEFAULT 0,
+    Rebounds INTEGER NOT NULL DEFAULT 0,
+    Assists INTEGER NOT NULL DEFAULT 0,
+    Steals INTEGER NOT NULL DEFAULT 0,
+    Blocks INTEGER NOT NULL DEFAULT 0,
+    Turnovers INTEGER NOT NULL DEFAULT 0,
+    Fouls INTEGER NOT NULL DEFAULT 0,
+    Minutes INTEGER NOT NULL DEFAULT 0,
+    -- sort key for keyset pagination of the Players list
+    PointsPerGame DECIMAL(5,1) GENERATED ALWAYS AS (IF(GamesPlayed = 0, NULL, ROUND(Points / GamesPlayed, 1))) STORED,
+    INDEX idx_pst_points_per_game (PointsPerGame, PlayerID),
     FOREIGN KEY (PlayerID) REFERENCES Player(PlayerID)
-);
\ No newline at end of file
+);
+
+-- per ordered team pair results: one row for (TeamID, OpponentID) and one
+-- for (OpponentID, TeamID). Kept up to date by the Game insert scripts and
+-- rebuilt by RebuildSummaries.py
+CREATE TABLE HeadToHead(
+    TeamID INTEGER NOT NULL,
+    OpponentID INTEGER NOT NULL,
+    Wins INTEGER NOT NULL DEFAULT 0,
+    Losses INTEGER NOT NULL DEFAULT 0,
+    PointsFor INTEGER NOT NULL DEFAULT 0,
+    PointsAgainst INTEGER NOT NULL DEFAULT 0,
+    GamesPlayed INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (TeamID, OpponentID),
+    FOREIGN KEY (TeamID) REFERENCES Team(TeamID),
+    FOREIGN KEY (OpponentID) REFERENCES Team(TeamID)
+);
+
+-- per-player stat sums against each opponent; averages are derived at
+-- read time. Kept up to date by the stats insert scripts and rebuilt by
+-- RebuildSummaries.py
+CREATE TABLE PlayerOpponentSplit(
+    PlayerID INTEGER NOT NULL,
+    OpponentTeamID INTEGER NOT NULL,
+    GamesPlayed INTEGER NOT NULL DEFAULT 0,
+    Points INTEGER NOT NULL DEFAULT 0,
+    Rebounds INTEGER NOT NULL DEFAULT 0,
+    Assists INTEGER NOT NULL DEFAULT 0,
+    Steals INTEGER NOT NULL DEFAULT 0,
+    Blocks INTEGER NOT NULL DEFAULT 0,
+    Turnovers INTEGER NOT NULL DEFAULT 0,
+    Fouls INTEGER NOT NULL DEFAULT 0,
+    Minutes INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (PlayerID, OpponentTeamID),
+    FOREIGN KEY (PlayerID) REFERENCES Player(PlayerID),
+    FOREIGN KEY (OpponentTeamID) REFERENCES Team(TeamID)
+);
+
+-- games each pair of opposing players both played in, one row per ordered
+-- pair. Filled by the stats insert scripts and rebuilt by RebuildSummaries.py
+CREATE TABLE PlayerMatchup(
+    PlayerID INTEGER NOT NULL,
+    OpponentPlayerID INTEGER NOT NULL,
+    GameID INTEGER NOT NULL,
+    PRIMARY KEY (PlayerID, OpponentPlayerID, GameID),
+    INDEX idx_matchup_game (GameID),
+    FOREIGN KEY (PlayerID) REFERENCES Player(PlayerID),
+    FOREIGN KEY (OpponentPlayerID) REFERENCES Player(PlayerID),
+    FOREIGN KEY (GameID) REFERENCES Game(GameID)
+);
+
+-- how far Stats_Scores/ingest.py has got, one row per feed ('games', 'stats')
+CREATE TABLE IngestWatermark(
+    Feed VARCHAR(16) PRIMARY KEY NOT NULL,
+    LastDate DATE NOT NULL,
+    GameIDs JSON NOT NULL,
+    UpdatedAt DATETIME NOT NULL
+);
+
+-- migrations already contained in this file; migrate.py applies the rest
+CREATE TABLE SchemaMigrations(
+    Version INTEGER PRIMARY KEY NOT NULL,
+    Name VARCHAR(255) NOT NULL,
+    AppliedAt DATETIME NOT NULL
+);
+
+INSERT INTO SchemaMigrations (Version, Name, AppliedAt) VALUES
+    (1, 'data_version', NOW()),
+    (2, 'game_date_index', NOW()),
+    (3, 'player_fullname', NOW()),
+    (4, 'team_season_summary', NOW()),
+    (5, 'player_season_totals', NOW()),
+    (6, 'keyset_pagination', NOW()),
+    (7, 'head_to_head', NOW()),
+    (8, 'player_opponent_split', NOW()),
+    (9, 'player_matchup', NOW()),
+    (10, 'player_game_team', NOW()),
+    (11, 'secondary_indexes', NOW()),
+    (12, 'ingest_watermark', NOW());
@@ -0,0 +1,10 @@
+-- 001: DataVersion counter for the db_operations read cache.
+-- Every write path (db_operations writes and the Stats_Scores inserters)
+-- bumps Version in the same transaction as its data change.
+
+CREATE TABLE DataVersion(
+    VersionID INTEGER PRIMARY KEY NOT NULL,
+    Version BIGINT NOT NULL DEFAULT 0
+);
+
+INSERT INTO DataVersion (VersionID, Version) VALUES (1, 0);
@@ -0,0 +1,5 @@
+-- 002: index on Game(Date).
+-- Date lookups in db_operations use half-open ranges
+-- (Date >= day AND Date < day + 1) so they can range-scan this index.
+
+CREATE INDEX idx_game_date ON Game(Date);
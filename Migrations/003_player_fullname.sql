@@ -0,0 +1,7 @@
+-- 003: stored, indexed Player.FullName.
+-- Name lookups in db_operations match on FullName instead of
+-- CONCAT(FirstName, ' ', LastName), which could not use an index.
+
+ALTER TABLE Player
+    ADD COLUMN FullName VARCHAR(41) GENERATED ALWAYS AS (CONCAT(FirstName, ' ', LastName)) STORED,
+    ADD INDEX idx_player_fullname (FullName);
@@ -0,0 +1,56 @@
+-- 004: TeamSeasonSummary replaces the undefined vstandings view.
+-- Holds W/L, home/away W/L and points for/against per team. The Game insert
+-- scripts update it in the same transaction as each game; run
+-- Stats_Scores/RebuildSummaries.py to repair it.
+
+CREATE TABLE TeamSeasonSummary(
+    TeamID INTEGER PRIMARY KEY NOT NULL,
+    Wins INTEGER NOT NULL DEFAULT 0,
+    Losses INTEGER NOT NULL DEFAULT 0,
+    HomeWins INTEGER NOT NULL DEFAULT 0,
+    HomeLosses INTEGER NOT NULL DEFAULT 0,
+    AwayWins INTEGER NOT NULL DEFAULT 0,
+    AwayLosses INTEGER NOT NULL DEFAULT 0,
+    PointsFor INTEGER NOT NULL DEFAULT 0,
+    PointsAgainst INTEGER NOT NULL DEFAULT 0,
+    GamesPlayed INTEGER NOT NULL DEFAULT 0,
+    WinPercentage DECIMAL(4,3) NOT NULL DEFAULT 0,
+    FOREIGN KEY (TeamID) REFERENCES Team(TeamID)
+);
+
+INSERT INTO TeamSeasonSummary
+    (TeamID, Wins, Losses, HomeWins, HomeLosses, AwayWins, AwayLosses,
+     PointsFor, PointsAgainst, GamesPlayed, WinPercentage)
+SELECT
+    t.TeamID,
+    COALESCE(SUM(r.Win), 0),
+    COALESCE(SUM(r.Loss), 0),
+    COALESCE(SUM(IF(r.IsHome = 1, r.Win, 0)), 0),
+    COALESCE(SUM(IF(r.IsHome = 1, r.Loss, 0)), 0),
+    COALESCE(SUM(IF(r.IsHome = 0, r.Win, 0)), 0),
+    COALESCE(SUM(IF(r.IsHome = 0, r.Loss, 0)), 0),
+    COALESCE(SUM(r.PointsFor), 0),
+    COALESCE(SUM(r.PointsAgainst), 0),
+    COUNT(r.TeamID),
+    0
+FROM Team t
+LEFT JOIN (
+    SELECT HomeTeamID AS TeamID, 1 AS IsHome,
+           IF(HomeTeamScore > AwayTeamScore, 1, 0) AS Win,
+           IF(HomeTeamScore < AwayTeamScore, 1, 0) AS Loss,
+           HomeTeamScore AS PointsFor, AwayTeamScore AS PointsAgainst
+    FROM Game
+    WHERE HomeTeamScore IS NOT NULL AND AwayTeamScore IS NOT NULL
+    UNION ALL
+    SELECT AwayTeamID AS TeamID, 0 AS IsHome,
+           IF(AwayTeamScore > HomeTeamScore, 1, 0) AS Win,
+           IF(AwayTeamScore < HomeTeamScore, 1, 0) AS Loss,
+           AwayTeamScore AS PointsFor, HomeTeamScore AS PointsAgainst
+    FROM Game
+    WHERE HomeTeamScore IS NOT NULL AND AwayTeamScore IS NOT NULL
+) r ON r.TeamID = t.TeamID
+WHERE t.TeamID != 31
+GROUP BY t.TeamID;
+
+UPDATE TeamSeasonSummary
+SET WinPercentage = IF(Wins + Losses = 0, 0, Wins / (Wins + Losses));
@@ -0,0 +1,34 @@
+-- 005: PlayerSeasonTotals behind get_all_players.
+-- Stores stat sums and games played per player so the Players page reads
+-- precomputed rows instead of aggregating PlayerGameStats on every load.
+
+CREATE TABLE PlayerSeasonTotals(
+    PlayerID INTEGER PRIMARY KEY NOT NULL,
+    GamesPlayed INTEGER NOT NULL DEFAULT 0,
+    Points INTEGER NOT NULL DEFAULT 0,
+    Rebounds INTEGER NOT NULL DEFAULT 0,
+    Assists INTEGER NOT NULL DEFAULT 0,
+    Steals INTEGER NOT NULL DEFAULT 0,
+    Blocks INTEGER NOT NULL DEFAULT 0,
+    Turnovers INTEGER NOT NULL DEFAULT 0,
+    Fouls INTEGER NOT NULL DEFAULT 0,
+    Minutes INTEGER NOT NULL DEFAULT 0,
+    FOREIGN KEY (PlayerID) REFERENCES Player(PlayerID)
+);
+
+INSERT INTO PlayerSeasonTotals
+    (PlayerID, GamesPlayed, Points, Rebounds, Assists, Steals, Blocks,
+     Turnovers, Fouls, Minutes)
+SELECT
+    PlayerID,
+    COUNT(*),
+    COALESCE(SUM(Points), 0),
+    COALESCE(SUM(Rebounds), 0),
+    COALESCE(SUM(Assists), 0),
+    COALESCE(SUM(Steals), 0),
+    COALESCE(SUM(Blocks), 0),
+    COALESCE(SUM(Turnovers), 0),
+    COALESCE(SUM(Fouls), 0),
+    COALESCE(SUM(Minutes), 0)
+FROM PlayerGameStats
+GROUP BY PlayerID;
@@ -0,0 +1,11 @@
+-- 006: keys for keyset (seek) pagination.
+-- Pages continue from the last row's key instead of using OFFSET, so
+-- page N reads the same number of index entries as page 1.
+--  - game lists seek on (Date, GameID): idx_game_date already holds both,
+--    since InnoDB appends the primary key to every secondary index
+--  - the Players list seeks on (PointsPerGame, PlayerID)
+
+ALTER TABLE PlayerSeasonTotals
+    ADD COLUMN PointsPerGame DECIMAL(5,1)
+        GENERATED ALWAYS AS (IF(GamesPlayed = 0, NULL, ROUND(Points / GamesPlayed, 1))) STORED,
+    ADD INDEX idx_pst_points_per_game (PointsPerGame, PlayerID);
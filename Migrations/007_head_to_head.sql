@@ -0,0 +1,45 @@
+-- 007: HeadToHead behind the Teams page head-to-head grid.
+-- One row per ordered team pair with W/L and points for/against, so one
+-- primary-key range read returns a team's record against every opponent.
+-- The Game insert scripts update it in the same transaction as each game;
+-- run Stats_Scores/RebuildSummaries.py to repair it.
+
+CREATE TABLE HeadToHead(
+    TeamID INTEGER NOT NULL,
+    OpponentID INTEGER NOT NULL,
+    Wins INTEGER NOT NULL DEFAULT 0,
+    Losses INTEGER NOT NULL DEFAULT 0,
+    PointsFor INTEGER NOT NULL DEFAULT 0,
+    PointsAgainst INTEGER NOT NULL DEFAULT 0,
+    GamesPlayed INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (TeamID, OpponentID),
+    FOREIGN KEY (TeamID) REFERENCES Team(TeamID),
+    FOREIGN KEY (OpponentID) REFERENCES Team(TeamID)
+);
+
+INSERT INTO HeadToHead
+    (TeamID, OpponentID, Wins, Losses, PointsFor, PointsAgainst, GamesPlayed)
+SELECT
+    r.TeamID,
+    r.OpponentID,
+    SUM(r.Win),
+    SUM(r.Loss),
+    SUM(r.PointsFor),
+    SUM(r.PointsAgainst),
+    COUNT(*)
+FROM (
+    SELECT HomeTeamID AS TeamID, AwayTeamID AS OpponentID,
+           IF(HomeTeamScore > AwayTeamScore, 1, 0) AS Win,
+           IF(HomeTeamScore < AwayTeamScore, 1, 0) AS Loss,
+           HomeTeamScore AS PointsFor, AwayTeamScore AS PointsAgainst
+    FROM Game
+    WHERE HomeTeamScore IS NOT NULL AND AwayTeamScore IS NOT NULL
+    UNION ALL
+    SELECT AwayTeamID AS TeamID, HomeTeamID AS OpponentID,
+           IF(AwayTeamScore > HomeTeamScore, 1, 0) AS Win,
+           IF(AwayTeamScore < HomeTeamScore, 1, 0) AS Loss,
+           AwayTeamScore AS PointsFor, HomeTeamScore AS PointsAgainst
+    FROM Game
+    WHERE HomeTeamScore IS NOT NULL AND AwayTeamScore IS NOT NULL
+) r
+GROUP BY r.TeamID, r.OpponentID;
@@ -0,0 +1,48 @@
+-- 008: PlayerOpponentSplit behind the PlayerComparison "against a team" view.
+-- Stores stat sums and games played per (PlayerID, OpponentTeamID), so a
+-- player's numbers against one team are a primary-key lookup and against
+-- every team a single range read.
+-- The stats insert scripts take the opponent from the API's MATCHUP column,
+-- which stays right for traded players. PlayerGameStats does not record the
+-- player's team, so this backfill (and RebuildSummaries.py) infers it from
+-- Player.TeamID and skips games where the current team played neither side.
+
+CREATE TABLE PlayerOpponentSplit(
+    PlayerID INTEGER NOT NULL,
+    OpponentTeamID INTEGER NOT NULL,
+    GamesPlayed INTEGER NOT NULL DEFAULT 0,
+    Points INTEGER NOT NULL DEFAULT 0,
+    Rebounds INTEGER NOT NULL DEFAULT 0,
+    Assists INTEGER NOT NULL DEFAULT 0,
+    Steals INTEGER NOT NULL DEFAULT 0,
+    Blocks INTEGER NOT NULL DEFAULT 0,
+    Turnovers INTEGER NOT NULL DEFAULT 0,
+    Fouls INTEGER NOT NULL DEFAULT 0,
+    Minutes INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (PlayerID, OpponentTeamID),
+    FOREIGN KEY (PlayerID) REFERENCES Player(PlayerID),
+    FOREIGN KEY (OpponentTeamID) REFERENCES Team(TeamID)
+);
+
+INSERT INTO PlayerOpponentSplit
+    (PlayerID, OpponentTeamID, GamesPlayed, Points, Rebounds, Assists,
+     Steals, Blocks, Turnovers, Fouls, Minutes)
+SELECT
+    s.PlayerID,
+    IF(g.HomeTeamID = p.TeamID, g.AwayTeamID, g.HomeTeamID) AS OpponentTeamID,
+    COUNT(*),
+    COALESCE(SUM(s.Points), 0),
+    COALESCE(SUM(s.Rebounds), 0),
+    COALESCE(SUM(s.Assists), 0),
+    COALESCE(SUM(s.Steals), 0),
+    COALESCE(SUM(s.Blocks), 0),
+    COALESCE(SUM(s.Turnovers), 0),
+    COALESCE(SUM(s.Fouls), 0),
+    COALESCE(SUM(s.Minutes), 0)
+FROM PlayerGameStats s
+INNER JOIN Game g
+    ON s.GameID = g.GameID
+INNER JOIN Player p
+    ON s.PlayerID = p.PlayerID
+WHERE p.TeamID IN (g.HomeTeamID, g.AwayTeamID)
+GROUP BY s.PlayerID, OpponentTeamID;
@@ -0,0 +1,35 @@
+-- 009: PlayerMatchup behind the PlayerComparison player-vs-player view.
+-- One row per (PlayerID, OpponentPlayerID, GameID) for players on opposite
+-- sides of a game, so a pair's shared games are one primary-key range read
+-- and both players' head-to-head averages come back from a single query,
+-- however large PlayerGameStats grows.
+-- The stats insert scripts pair players using the API's team abbreviation.
+-- PlayerGameStats does not record the player's team, so this backfill (and
+-- RebuildSummaries.py) takes each side from Player.TeamID and skips players
+-- whose current team played neither side.
+
+CREATE TABLE PlayerMatchup(
+    PlayerID INTEGER NOT NULL,
+    OpponentPlayerID INTEGER NOT NULL,
+    GameID INTEGER NOT NULL,
+    PRIMARY KEY (PlayerID, OpponentPlayerID, GameID),
+    INDEX idx_matchup_game (GameID),
+    FOREIGN KEY (PlayerID) REFERENCES Player(PlayerID),
+    FOREIGN KEY (OpponentPlayerID) REFERENCES Player(PlayerID),
+    FOREIGN KEY (GameID) REFERENCES Game(GameID)
+);
+
+INSERT INTO PlayerMatchup (PlayerID, OpponentPlayerID, GameID)
+SELECT a.PlayerID, b.PlayerID, a.GameID
+FROM PlayerGameStats a
+INNER JOIN Game g
+    ON a.GameID = g.GameID
+INNER JOIN Player pa
+    ON a.PlayerID = pa.PlayerID
+INNER JOIN PlayerGameStats b
+    ON b.GameID = a.GameID
+INNER JOIN Player pb
+    ON b.PlayerID = pb.PlayerID
+WHERE pa.TeamID IN (g.HomeTeamID, g.AwayTeamID)
+  AND pb.TeamID IN (g.HomeTeamID, g.AwayTeamID)
+  AND pa.TeamID != pb.TeamID;
@@ -0,0 +1,20 @@
+-- 010: PlayerGameStats.TeamID, the team a player played for in that game.
+-- Boxscores and the opponent/matchup summaries read it instead of the
+-- player's current Player.TeamID, so trades no longer rewrite history.
+-- The stats insert scripts fill it from the API's TEAM_ABBREVIATION.
+-- This backfill can only use Player.TeamID where that team played the
+-- game; run Stats_Scores/BackfillStatTeams.py to fill the rest from the
+-- API, then Stats_Scores/RebuildSummaries.py.
+
+ALTER TABLE PlayerGameStats
+    ADD COLUMN TeamID INTEGER,
+    ADD INDEX idx_pgs_game_team (GameID, TeamID),
+    ADD FOREIGN KEY (TeamID) REFERENCES Team(TeamID);
+
+UPDATE PlayerGameStats s
+INNER JOIN Game g
+    ON s.GameID = g.GameID
+INNER JOIN Player p
+    ON s.PlayerID = p.PlayerID
+SET s.TeamID = p.TeamID
+WHERE p.TeamID IN (g.HomeTeamID, g.AwayTeamID);
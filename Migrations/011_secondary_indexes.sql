@@ -0,0 +1,18 @@
+-- 011: secondary indexes for the remaining db_operations filters and sorts.
+-- check_indexes.py runs EXPLAIN on every db_operations read and fails on
+-- full scans or filesorts over its row threshold, so keep it passing when
+-- adding queries.
+--  - Team(Name): name lookups in the record, roster and comparison queries
+--  - Player(TeamID, FullName): rosters filter on the team and sort by name
+--  - Game(HomeTeamID, Date) / Game(AwayTeamID, Date): a team's latest games
+--    read the newest entries of each index instead of sorting all its games
+-- PlayerGameStats(PlayerID) and Game(Date) are already indexed (foreign
+-- key index and 002).
+
+CREATE INDEX idx_team_name ON Team(Name);
+
+CREATE INDEX idx_player_team_name ON Player(TeamID, FullName);
+
+CREATE INDEX idx_game_home_date ON Game(HomeTeamID, Date);
+
+CREATE INDEX idx_game_away_date ON Game(AwayTeamID, Date);
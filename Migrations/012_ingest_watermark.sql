@@ -0,0 +1,25 @@
+-- 012: IngestWatermark, where Stats_Scores/ingest.py records how far each
+-- feed ('games', 'stats') has got. LastDate is the last date whose games
+-- (or stat lines) are all in; every date up to it is done. GameIDs lists
+-- games already finished on later dates, e.g. after a run that stopped at
+-- a game with an unknown arena, so the next run only redoes what is missing.
+-- Seeded from the data already loaded: the daily scripts only ever wrote
+-- whole days.
+
+CREATE TABLE IngestWatermark(
+    Feed VARCHAR(16) PRIMARY KEY NOT NULL,
+    LastDate DATE NOT NULL,
+    GameIDs JSON NOT NULL,
+    UpdatedAt DATETIME NOT NULL
+);
+
+INSERT INTO IngestWatermark (Feed, LastDate, GameIDs, UpdatedAt)
+SELECT 'games', DATE(MAX(Date)), JSON_ARRAY(), NOW()
+FROM Game
+HAVING MAX(Date) IS NOT NULL;
+
+INSERT INTO IngestWatermark (Feed, LastDate, GameIDs, UpdatedAt)
+SELECT 'stats', DATE(MAX(g.Date)), JSON_ARRAY(), NOW()
+FROM Game g
+WHERE EXISTS (SELECT 1 FROM PlayerGameStats s WHERE s.GameID = g.GameID)
+HAVING MAX(g.Date) IS NOT NULL;
@@ -1,10 +1,14 @@
 import streamlit as st
 import os
+import re
 import subprocess
 import sys
-from db_operations import db_operations
+from db_operations import db_operations, csv_lines
 db = db_operations()
 
+# where "Export Game History" writes: HoopHub/exports
+EXPORT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "exports")
+
 st.title("Admin Panel")
 
 # ---------------------------
@@ -64,6 +68,9 @@ def run_script(script_name: str):
             text=True,
         )
 
+        # the script wrote through its own connection, so drop cached reads now
+        db.invalidate_cache()
+
         if result.returncode == 0:
             st.success(f"{script_name} ran successfully")
         else:
@@ -90,18 +97,83 @@ if st.button("Logout"):
     st.rerun()
 
 st.write("Use the tools below to update your database from the NBA API.")
-st.write("You must update the games first, then the stats in order for the stats to be updated correctly.")
+st.write("You must update the games first, then the stats in order for the stats to be updated correctly. Each button also fills in any days a missed run skipped.")
 
 col1, col2 = st.columns(2)
 
 with col1:
-    if st.button("Insert Yesterday's Games"):
+    if st.button("Insert New Games"):
         run_script("DailyScoreInsert.py")
 
 with col2:
-    if st.button("Insert Yesterday's Stats"):
+    if st.button("Insert New Stats"):
         run_script("DailyStatsInsert.py")
 
+# Both scripts rewrite existing rows (the rebuild replaces the summary and
+# matchup tables; the backfill UPDATEs PlayerGameStats.TeamID and rebuilds
+# PlayerMatchup) instead of only inserting new ones. Each bumps DataVersion,
+# which makes the read replica copy every table again, so rewritten rows
+# reach it even when the script is run from the command line; syncing here
+# just does it before the next read.
+col1, col2 = st.columns(2)
+
+with col1:
+    if st.button("Rebuild Summary Tables"):
+        run_script("RebuildSummaries.py")
+        db.sync_replica()
+
+with col2:
+    if st.button("Backfill Stat Teams"):
+        run_script("BackfillStatTeams.py")
+        db.sync_replica()
+
+with st.expander("Read Replica"):
+    if db.replica is None:
+        st.caption("The local read replica is off. Set enabled = true under [replica] in secrets to use it.")
+    else:
+        st.json(db.replica_status())
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("Sync Replica Now"):
+                st.json(db.sync_replica())
+        with col2:
+            if st.button("Rebuild Replica"):
+                st.json(db.sync_replica(full=True))
+
+with st.expander("Export Game History"):
+    # exports only ever land in the project's exports/ folder; the name
+    # entered here is reduced to a plain file name
+    export_name = st.text_input("Export file name:", value = "game_history.csv")
+    export_name = re.sub(r"[^A-Za-z0-9._-]", "_", os.path.basename(export_name.strip())) or "game_history"
+    if not export_name.lower().endswith(".csv"):
+        export_name += ".csv"
+    export_path = os.path.join(EXPORT_DIR, export_name)
+    if st.button("Export All Games"):
+        try:
+            os.makedirs(EXPORT_DIR, exist_ok = True)
+            # rows are streamed from MySQL straight into the file
+            with open(export_path, "w", newline = "") as f:
+                f.writelines(csv_lines(["GameID", "Date", "Home", "Away", "HomeScore", "AwayScore"], db.stream_games()))
+            st.success(f"Game history written to exports/{export_name}")
+        except OSError as e:
+            st.error(f"Could not write exports/{export_name}: {e}")
+    if os.path.exists(export_path):
+        with open(export_path, "rb") as f:
+            st.download_button(label = "Download Game History", data = f, file_name = export_name, mime = "text/csv")
+
+with st.expander("Query Performance"):
+    if not db.query_stats.enabled:
+        st.caption("Query timing is off. Set enabled = true under [query_stats] in secrets to collect it.")
+    else:
+        timings = db.query_timings()
+        if timings:
+            st.dataframe(timings, hide_index = True)
+        else:
+            st.caption("No queries recorded yet.")
+        if st.button("Dump Query Timings"):
+            path = db.dump_query_timings()
+            st.success(f"Query timings appended to {path}")
+
 st.divider()
 
 with st.expander("Insert a New Player"):
@@ -133,8 +205,11 @@ with st.expander("Insert a New Player"):
                 st.error("Failed to insert player.")
 
 with st.expander("Change Player Details"):
-    player_name = st.selectbox("Player:", options = db.get_players(), index = None, placeholder = "Select a player")
-    if player_name:
+    # show names but keep PlayerIDs so players who share a name stay distinct
+    player_names = dict(db.get_player_options())
+    player_id = st.selectbox("Player:", options = list(player_names), format_func = lambda pid: player_names[pid], index = None, placeholder = "Select a player")
+    if player_id:
+        player_name = player_names[player_id]
         st.markdown(f"### Editing Player: {player_name}")
         
         col1, col2, col3 = st.columns([1, 2, 2])
@@ -147,7 +222,7 @@ with st.expander("Change Player Details"):
                 if not player_name or not player_team:
                     st.error("Please fill all required fields.")
                 else:
-                    success = db.change_player_team(player_name, player_team)
+                    success = db.change_player_team_by_id(player_id, player_team)
                     if success:
                         st.success("Player team changed successfully!")
                     else:
@@ -162,7 +237,7 @@ with st.expander("Change Player Details"):
                 if not player_name or not player_age:
                     st.error("Please fill all required fields.")
                 else:
-                    success = db.change_player_age(player_name, player_age)
+                    success = db.change_player_age_by_id(player_id, player_age)
                     if success:
                         st.success("Player age changed successfully!")
                     else:
@@ -177,7 +252,7 @@ with st.expander("Change Player Details"):
                 if not player_name or not player_position:
                     st.error("Please fill all required fields.")
                 else:
-                    success = db.change_player_position(player_name, player_position)
+                    success = db.change_player_position_by_id(player_id, player_position)
                     if success:
                         st.success("Player position changed successfully!")
                     else:
@@ -192,7 +267,7 @@ with st.expander("Change Player Details"):
                 if not player_name or not player_number:
                     st.error("Please fill all required fields.")
                 else:
-                    success = db.change_player_number(player_name, player_number)
+                    success = db.change_player_number_by_id(player_id, player_number)
                     if success:
                         st.success("Player number changed successfully!")
                     else:
@@ -207,7 +282,7 @@ with st.expander("Change Player Details"):
                 if not player_name or not player_height:
                     st.error("Please fill all required fields.")
                 else:
-                    success = db.change_player_height(player_name, player_height)
+                    success = db.change_player_height_by_id(player_id, player_height)
                     if success:
                         st.success("Player height changed successfully!")
                     else:
@@ -223,18 +298,20 @@ with st.expander("Change Player Details"):
                 if not player_name or not player_weight:
                     st.error("Please fill all required fields.")
                 else:
-                    success = db.change_player_weight(player_name, player_weight)
+                    success = db.change_player_weight_by_id(player_id, player_weight)
                     if success:
                         st.success("Player weight changed successfully!")
                     else:
                         st.error("Failed to change player weight.")
 
 with st.expander("Delete a Player"):
-    player_name = st.selectbox("Player:", options = db.get_players(), index = None, placeholder = "Select a player", key = "delete_player_name")
-    if player_name:
+    player_names = dict(db.get_player_options())
+    player_id = st.selectbox("Player:", options = list(player_names), format_func = lambda pid: player_names[pid], index = None, placeholder = "Select a player", key = "delete_player_name")
+    if player_id:
+        player_name = player_names[player_id]
         st.markdown(f"### Deleting Player: {player_name}")
         if st.button("Delete Player"):
-            success = db.delete_player(player_name)
+            success = db.delete_player_by_id(player_id)
             if success:
                 st.success("Player deleted successfully!")
             else:
@@ -1,7 +1,6 @@
 import streamlit as st
-import pandas as pd
 import datetime
-from db_operations import db_operations
+from db_operations import db_operations, app_today
 
 db = db_operations()
 
@@ -12,25 +11,28 @@ if "selected_box_game_id" not in st.session_state:
     st.session_state.selected_box_game_id = None
 if "selected_box_label" not in st.session_state:
     st.session_state.selected_box_label = ""
+# keys of the game history pages visited so far; None is the newest page
+if "game_history_keys" not in st.session_state:
+    st.session_state.game_history_keys = [None]
 
 
 def show_games_list():
     st.subheader("See the games played on a specific date")
     st.write("Select a date to see the games played on that date")
 
-    # Date picker (min 2025-10-21, max = yesterday)
+    # Date picker (min 2025-10-21, max = yesterday in the app timezone)
+    yesterday = app_today() - datetime.timedelta(days=1)
     date = st.date_input(
         "Game Date",
-        value=datetime.datetime.now() - datetime.timedelta(days=1),
+        value=yesterday,
         min_value=datetime.date(2025, 10, 21),
-        max_value=datetime.date.today() - datetime.timedelta(days=1),
+        max_value=yesterday,
     )
 
     if not date:
         return
 
-    game_date_string = date.strftime("%Y-%m-%d")
-    games = db.get_games_by_date(game_date_string)
+    games = db.get_games_by_date(date)
     st.markdown(f"### Games Played on {date.strftime('%m-%d-%Y')}")
 
     if games:
@@ -62,6 +64,31 @@ def show_games_list():
         st.write("No games found for that date")
 
 
+def show_game_history():
+    """Every game played, newest first, one page at a time."""
+    keys = st.session_state.game_history_keys
+    games, next_key = db.get_games_page(after=keys[-1])
+
+    with st.expander(f"Game History (page {len(keys)})"):
+        st.dataframe(
+            [
+                {"Date": game[1], "Away": game[3], "Home": game[2], "Score": f"{game[5]} - {game[4]}"}
+                for game in games
+            ],
+            use_container_width=True,
+            hide_index=True,
+        )
+        c1, c2 = st.columns(2)
+        with c1:
+            if len(keys) > 1 and st.button("Newer games"):
+                keys.pop()
+                st.rerun()
+        with c2:
+            if next_key is not None and st.button("Older games"):
+                keys.append(next_key)
+                st.rerun()
+
+
 def show_boxscore_view():
     """Full-page boxscore view, similar to team detail view."""
     game_id = st.session_state.selected_box_game_id
@@ -78,32 +105,13 @@ def show_boxscore_view():
         st.markdown(f"**{label}**")
     
 
-    boxscore = db.get_boxscore(game_id)
-
-    data = []
-    for player in boxscore:
-        data.append(
-            {
-                "Team": player[0],
-                "Player": player[1],
-                "Minutes": player[2],
-                "Points": player[3],
-                "Rebounds": player[4],
-                "Assists": player[5],
-                "Blocks": player[6],
-                "Steals": player[7],
-                "Turnovers": player[8],
-                "Fouls": player[9],
-            }
-        )
-
-    df = pd.DataFrame(data)
+    df = db.get_boxscore(game_id, fetch_mode="frame")
 
     st.download_button(label="Download Boxscore", data=df.to_csv(index=False), file_name=f"{label.replace(' @ ', '_')}_boxscore.csv", mime="text/csv")
 
     st.divider()
 
-    if not boxscore:
+    if df.empty:
         st.write("No boxscore found for that game.")
         return
     
@@ -131,5 +139,6 @@ def show_boxscore_view():
 # --- Main page logic (like Teams grid vs detail) ---
 if st.session_state.selected_box_game_id is None:
     show_games_list()
+    show_game_history()
 else:
     show_boxscore_view()
\ No newline at end of file
@@ -11,11 +11,15 @@ st.session_state.current_page = "player_comparison"
 
 st.write("This page allows you to see a players performance against another team or see how their performance compares to other players.")
 
+# selectboxes hold PlayerIDs and only display names, so players who share a name stay distinct
+player_names = dict(db.get_player_options())
+
 with st.expander("Compare Player Performance Against Another Team"):
-    player_name = st.selectbox("Select a Player:", options = db.get_players(), index = None, placeholder = "Select a player", key = "player_comparison_team_player")
+    player_id = st.selectbox("Select a Player:", options = list(player_names), format_func = lambda pid: player_names[pid], index = None, placeholder = "Select a player", key = "player_comparison_team_player")
     team_name = st.selectbox("Select a Team:", options = db.get_all_teams(), index = None, placeholder = "Select a team", key = "player_comparison_team_team")
-    if player_name and team_name:
-        player_team_performance = db.get_player_team_performance(player_name, team_name)
+    if player_id and team_name:
+        player_name = player_names[player_id]
+        player_team_performance = db.get_player_team_performance_by_id(player_id, team_name)
         if player_team_performance[0] != 0:
             st.markdown(f"### Here is {player_name}'s performance against {team_name} in {player_team_performance[0]} game(s):")
             st.write(f"Points: {player_team_performance[1]:.1f}")
@@ -27,18 +31,36 @@ with st.expander("Compare Player Performance Against Another Team"):
             st.write(f"Fouls: {player_team_performance[7]:.1f}")
         else:
             st.error(f"{player_name} has not played against {team_name} this season.")
+    elif player_id:
+        # no team picked yet: show the player's averages against every opponent
+        splits = db.get_player_opponent_splits(player_id, fetch_mode = "frame")
+        if splits.empty:
+            st.info(f"{player_names[player_id]} has no games recorded this season.")
+        else:
+            st.markdown(f"### {player_names[player_id]}'s averages against every opponent:")
+            st.dataframe(splits, use_container_width = True, hide_index = True)
     else:
         st.warning("A player and a team must be selected to compare performance.")
 
 with st.expander("Compare Player Performance to Another Player"):
-    player1_name = st.selectbox("Select Player 1:", options = db.get_players(), index = None, placeholder = "Select a player", key = "player1_comparison_player1")
-    player2_name = st.selectbox("Select Player 2:", options = db.get_players(), index = None, placeholder = "Select a player", key = "player2_comparison_player2")
-    if player1_name and player2_name:
+    player1_id = st.selectbox("Select Player 1:", options = list(player_names), format_func = lambda pid: player_names[pid], index = None, placeholder = "Select a player", key = "player1_comparison_player1")
+    player2_id = st.selectbox("Select Player 2:", options = list(player_names), format_func = lambda pid: player_names[pid], index = None, placeholder = "Select a player", key = "player2_comparison_player2")
+    if player1_id and player2_id:
+        player1_name = player_names[player1_id]
+        player2_name = player_names[player2_id]
         # player1_performance = db.get_player_performance(player1_name)
         # player2_performance = db.get_player_performance(player2_name)
         st.markdown(f"### {player1_name} vs {player2_name} Season Performance Comparison:")
-        player1_performance = db.get_player_stats(player1_name)
-        player2_performance = db.get_player_stats(player2_name)
+        # season stats and head-to-head numbers for both players load together
+        (
+            player1_performance,
+            player2_performance,
+            (player1_matchup, player2_matchup),
+        ) = db.fetch_many([
+            (db.get_player_stats_by_id, player1_id),
+            (db.get_player_stats_by_id, player2_id),
+            (db.get_player_matchup, player1_id, player2_id),
+        ])
         col1, col2 = st.columns(2)
         with col1:
             st.subheader(f"_{player1_name}_:")
@@ -133,8 +155,8 @@ with st.expander("Compare Player Performance to Another Player"):
                 else:
                     st.subheader(f"Fouls: {player2_performance[7]:.1f}")
         st.divider()
-        player1_performance = db.get_player_performance(player1_name, player2_name)
-        player2_performance = db.get_player_performance(player2_name, player1_name)
+        player1_performance = player1_matchup
+        player2_performance = player2_matchup
         st.markdown(f"### {player1_name} vs {player2_name} Performance in {player1_performance[0]} Games Against Each Other:")
         if player1_performance[0] != 0:
             col1, col2 = st.columns(2)
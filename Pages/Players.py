@@ -1,19 +1,16 @@
 import streamlit as st
-import pandas as pd
 from db_operations import db_operations
 
 db = db_operations()
 
 st.title("Players")
 
-players = db.get_all_players()
+df = db.get_all_players(fetch_mode="frame")
 
-if not players:
+if df.empty:
     st.write("No players found in the database.")
     st.stop()
 
-df = pd.DataFrame(players, columns=["PlayerID", "Name", "Team", "Position", "Points", "Rebounds", "Assists", "Blocks", "Steals", "Turnovers", "Fouls"])
-
 
 st.subheader("Browse & Filter Players")
 
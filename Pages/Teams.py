@@ -94,12 +94,19 @@ def show_team_detail():
         st.image(logo_path, width=240)
     st.divider()
 
+    # every section below comes from this one query
+    team_id = db.get_team_ids().get(abbr)
+    dashboard = db.get_team_dashboard(team_id) if team_id is not None else None
+    if dashboard is None:
+        st.write("Team information not available.")
+        return
+
     col_info, col_record = st.columns(2)
     
     with col_info:
         st.subheader("Team Information")
 
-        bio = db.get_team_bio(team_name)
+        bio = dashboard.bio
 
         if bio:
             (
@@ -124,9 +131,9 @@ def show_team_detail():
     
     with col_record:
         st.subheader("Team Record")
-        team_record = db.get_team_record(team_name)
-        home_record = db.get_team_home_record(team_name)
-        away_record = db.get_team_away_record(team_name)
+        team_record = dashboard.record
+        home_record = dashboard.home_record
+        away_record = dashboard.away_record
         if team_record:
             st.write(f"**Record:** {team_record[0]} - {team_record[1]}")
             st.write(f"**Home Record:** {home_record[0]} - {home_record[1]}")
@@ -136,7 +143,7 @@ def show_team_detail():
 
     st.divider()
 
-    avc_scores = db.get_team_score(team_name)
+    avc_scores = dashboard.scores
     if avc_scores:
         ppg = avc_scores[0]
         opp_ppg = avc_scores[1]
@@ -157,7 +164,7 @@ def show_team_detail():
     # Placeholder for future DB data (roster, recent games, etc.)
     st.subheader("Roster")
 
-    players = db.get_team_roster(team_name)
+    players = dashboard.roster
     if players:
         roster = []
         for player in players:
@@ -177,7 +184,7 @@ def show_team_detail():
         st.write("No players found for this team.")
     
     st.subheader("Recent Games")
-    games = db.get_team_recent_games(team_name)
+    games = dashboard.recent_games
     if games:
         for game in games:
             game_date = game[0]      # e.g., date or string
@@ -216,23 +223,21 @@ def show_team_detail():
         st.write("No recent games found for this team.")
 
     st.subheader("Head-to-Head Record")
-    opponents = db.get_all_teams(team_name)
-    selected_opponent = st.selectbox("Select an opponent", opponents, index = None, placeholder = "Select an opponent")
-    if selected_opponent:
-        record = db.get_head_to_head_record(team_name, selected_opponent)
-
-        # record should be a tuple like (wins, losses)
-        if not record:
-            st.info(f"No games played between {team_name} and {selected_opponent} yet this season.")
-        else:
-            wins, losses = record
-
-            # If SUM() returns NULL when there are no matching games
-            if wins is None and losses is None:
-                st.info(f"No games played between {team_name} and {selected_opponent} yet this season.")
-            else:
-                st.markdown(f"### {team_name} vs {selected_opponent}")
-                st.write(f"**Record:** {wins} – {losses}")
+    # every opponent at once, straight from the HeadToHead table
+    head_to_head = db.get_head_to_head(team_id, fetch_mode = "frame")
+    if head_to_head.empty or head_to_head["GamesPlayed"].sum() == 0:
+        st.info("No games played against other teams yet this season.")
+    else:
+        st.dataframe(
+            head_to_head,
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                "GamesPlayed": st.column_config.NumberColumn("Games"),
+                "PointsFor": st.column_config.NumberColumn("Avg Points For", format="%.1f"),
+                "PointsAgainst": st.column_config.NumberColumn("Avg Points Against", format="%.1f"),
+            },
+        )
 
 # --- Main page logic ---
 if st.session_state.selected_team_abbr is None:
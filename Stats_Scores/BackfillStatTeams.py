@@ -0,0 +1,122 @@
+"""
+PlayerGameStats Team Backfill
+-----------------------------
+Sets PlayerGameStats.TeamID from the NBA API's TEAM_ABBREVIATION for stat
+lines that have no team yet or the wrong one (e.g. rows loaded before the
+column existed, for players traded since).
+Then rebuilds PlayerOpponentSplit and PlayerMatchup, which read that column.
+
+These are UPDATEs and rewrites, not inserts. The DataVersion bump at the end
+makes the app's read replica copy every table again on its next check; the
+Admin page's "Backfill Stat Teams" button also syncs it right away.
+
+Usage:
+python Stats_Scores/BackfillStatTeams.py
+"""
+
+from nba_api.stats.endpoints import playergamelogs
+import mysql.connector
+from datetime import datetime
+from zoneinfo import ZoneInfo
+import streamlit as st
+import certifi
+
+from ingest import call_endpoint, season_for, yesterday
+from summary_tables import rebuild_player_opponent_splits, rebuild_player_matchups
+
+# ==================== CONFIGURATION ====================
+cfg = st.secrets["db"]
+
+DB_CONFIG = {
+    "host": cfg["host"],
+    "port": int(cfg["port"]),
+    "user": cfg["user"],
+    "password": cfg["password"],
+    "database": cfg["database"],
+    "ssl_ca": certifi.where(),  # Aiven requires SSL; this keeps Streamlit happy
+}
+
+SEASON = season_for(yesterday())
+TIMEZONE = ZoneInfo("America/Los_Angeles")
+now = datetime.now(TIMEZONE)
+
+# ==================== CONNECT TO DATABASE ====================
+try:
+    db = mysql.connector.connect(**DB_CONFIG)
+    db.autocommit = False
+    cursor = db.cursor()
+    print("✓ Connected to database")
+except Exception as e:
+    print(f"✗ Database connection failed: {e}")
+    exit(1)
+
+# ==================== BUILD MAPPINGS ====================
+cursor.execute("SELECT PlayerID, FirstName, LastName FROM Player")
+player_name_to_db_id = {
+    f"{first} {last}".strip().lower(): player_id
+    for player_id, first, last in cursor.fetchall()
+}
+
+cursor.execute("SELECT TeamID, Abbreviation FROM Team")
+team_abbr_to_db_id = {abbr: team_id for team_id, abbr in cursor.fetchall()}
+
+cursor.execute("SELECT GameID, PlayerID, TeamID FROM PlayerGameStats")
+stat_teams = {(game_id, player_id): team_id for game_id, player_id, team_id in cursor.fetchall()}
+print(f"✓ Loaded {len(stat_teams)} stat lines")
+
+# ==================== FETCH GAME LOGS FROM API ====================
+try:
+    df = call_endpoint(
+        playergamelogs.PlayerGameLogs, None,
+        season_nullable=SEASON,
+        season_type_nullable='Regular Season'
+    )["PlayerGameLogs"]
+    print(f"✓ API returned {len(df)} player game log entries")
+except Exception as e:
+    print(f"✗ API fetch failed: {e}")
+    cursor.close()
+    db.close()
+    exit(1)
+
+# ==================== MATCH ROWS ====================
+updates = []
+for _, row in df.iterrows():
+    player_id = player_name_to_db_id.get(str(row['PLAYER_NAME']).strip().lower())
+    team_id = team_abbr_to_db_id.get(str(row['TEAM_ABBREVIATION']).strip())
+    game_id = int(str(row['GAME_ID']).lstrip('0') or 0)
+    key = (game_id, player_id)
+    if player_id is None or team_id is None or key not in stat_teams:
+        continue
+    if stat_teams[key] != team_id:
+        updates.append((team_id, game_id, player_id))
+
+missing = sum(1 for team_id in stat_teams.values() if team_id is None)
+print(f"✓ {len(updates)} stat lines need a team ({missing} currently have none)")
+
+# ==================== UPDATE ====================
+try:
+    if updates:
+        cursor.executemany(
+            "UPDATE PlayerGameStats SET TeamID = %s WHERE GameID = %s AND PlayerID = %s",
+            updates
+        )
+    rebuild_player_opponent_splits(cursor)
+    print("✓ Rebuilt PlayerOpponentSplit")
+    rebuild_player_matchups(cursor)
+    print("✓ Rebuilt PlayerMatchup")
+
+    # Tell the app's read cache and read replica that stats changed
+    cursor.execute("UPDATE DataVersion SET Version = Version + 1 WHERE VersionID = 1")
+    db.commit()
+    print(f"{now.strftime('%Y-%m-%d %H:%M:%S')} - Updated TeamID on {len(updates)} stat lines")
+except Exception as e:
+    db.rollback()
+    print("🚨 ERROR: Rolling back, no stat lines changed.")
+    print(f"Details: {e}")
+    cursor.close()
+    db.close()
+    exit(1)
+
+# ==================== CLEANUP ====================
+cursor.close()
+db.close()
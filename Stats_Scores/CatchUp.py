@@ -0,0 +1,40 @@
+"""
+Ingest Catch-Up
+---------------
+Brings the games feed and then the stats feed up to date through
+yesterday, starting after each feed's watermark in IngestWatermark.
+Safe to run at any time: dates already ingested are not fetched again,
+and after an outage one run fills in every missed day.
+
+Usage:
+python Stats_Scores/CatchUp.py                        games, then stats
+python Stats_Scores/CatchUp.py --feed stats           one feed only
+python Stats_Scores/CatchUp.py --through 2025-12-01   stop at a date
+python Stats_Scores/CatchUp.py --since 2025-10-21     first date for a feed without a watermark
+python Stats_Scores/CatchUp.py --no-cache             ask the API again instead of the disk cache
+python Stats_Scores/CatchUp.py --status               show the watermarks
+"""
+
+import argparse
+from datetime import date
+
+from api_cache import get_api_cache
+from ingest import FEEDS, run, print_status
+
+# ==================== RUN ====================
+parser = argparse.ArgumentParser(description="Ingest every date after the HoopHub watermarks.")
+parser.add_argument("--feed", choices=FEEDS, help="run one feed instead of both")
+parser.add_argument("--through", type=date.fromisoformat, help="last date to ingest (default: yesterday)")
+parser.add_argument("--since", type=date.fromisoformat, help="first date for a feed that has no watermark yet")
+parser.add_argument("--no-cache", action="store_true", help="skip cached NBA API replies (fresh ones are still stored)")
+parser.add_argument("--status", action="store_true", help="print the watermarks and exit")
+args = parser.parse_args()
+
+if args.no_cache:
+    get_api_cache().bypass = True
+
+if args.status:
+    print_status()
+    exit(0)
+
+exit(run([args.feed] if args.feed else FEEDS, through=args.through, since=args.since))
@@ -0,0 +1,78 @@
+"""
+Summary Table Rebuild
+---------------------
+Recomputes the precomputed summary tables from the raw data.
+The insert scripts keep these tables up to date incrementally; run this
+to repair them after manual edits or a failed load.
+
+Usage:
+python Stats_Scores/RebuildSummaries.py
+"""
+
+import mysql.connector
+from datetime import datetime
+from zoneinfo import ZoneInfo
+import streamlit as st
+import certifi
+
+from summary_tables import (
+    rebuild_team_season_summary,
+    rebuild_head_to_head,
+    rebuild_player_season_totals,
+    rebuild_player_opponent_splits,
+    rebuild_player_matchups,
+)
+
+# ==================== CONFIGURATION ====================
+cfg = st.secrets["db"]
+
+DB_CONFIG = {
+    "host": cfg["host"],
+    "port": int(cfg["port"]),
+    "user": cfg["user"],
+    "password": cfg["password"],
+    "database": cfg["database"],
+    "ssl_ca": certifi.where(),  # Aiven requires SSL; this keeps Streamlit happy
+}
+
+TIMEZONE = ZoneInfo("America/Los_Angeles")
+now = datetime.now(TIMEZONE)
+
+# ==================== CONNECT TO DATABASE ====================
+try:
+    db = mysql.connector.connect(**DB_CONFIG)
+    db.autocommit = False
+    cursor = db.cursor()
+    print("✓ Connected to database")
+except Exception as e:
+    print(f"✗ Database connection failed: {e}")
+    exit(1)
+
+# ==================== REBUILD ====================
+try:
+    rebuild_team_season_summary(cursor)
+    print("✓ Rebuilt TeamSeasonSummary")
+    rebuild_head_to_head(cursor)
+    print("✓ Rebuilt HeadToHead")
+    rebuild_player_season_totals(cursor)
+    print("✓ Rebuilt PlayerSeasonTotals")
+    rebuild_player_opponent_splits(cursor)
+    print("✓ Rebuilt PlayerOpponentSplit")
+    rebuild_player_matchups(cursor)
+    print("✓ Rebuilt PlayerMatchup")
+
+    # Tell the app's read cache that summary data changed
+    cursor.execute("UPDATE DataVersion SET Version = Version + 1 WHERE VersionID = 1")
+    db.commit()
+    print(f"{now.strftime('%Y-%m-%d %H:%M:%S')} - Summary tables rebuilt")
+except Exception as e:
+    db.rollback()
+    print("🚨 ERROR: Rolling back, summary tables left unchanged.")
+    print(f"Details: {e}")
+    cursor.close()
+    db.close()
+    exit(1)
+
+# ==================== CLEANUP ====================
+cursor.close()
+db.close()
@@ -0,0 +1,182 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import streamlit as st
+
+# module keeps NBA API responses on disk so reruns, retries and backfills
+# of the ingest scripts are served locally instead of asking stats.nba.com
+# again. Entries are content-addressed: the file name is the SHA-256 of the
+# endpoint name and its parameters, and the file holds the raw JSON reply.
+#  - requests whose dates are all settled (older than SETTLED_DAYS) keep
+#    their entry for past_ttl; anything newer, where games or stat
+#    corrections may still be coming in, for current_ttl
+#  - when the files pass max_mb the least recently used are deleted
+#  - bypass skips reads but still stores the fresh reply
+#    (CatchUp.py --no-cache)
+#
+# Configured from an optional [api_cache] section in Streamlit secrets:
+#   enabled = true
+#   path = "cache/nba_api"
+#   max_mb = 200
+#   past_ttl = 2592000
+#   current_ttl = 600
+
+DEFAULT_PATH = "cache/nba_api"
+DEFAULT_MAX_MB = 200
+PAST_TTL = 30 * 24 * 3600   # seconds an entry for settled dates stays valid
+CURRENT_TTL = 10 * 60       # seconds an entry touching recent dates stays valid
+SETTLED_DAYS = 2            # dates at least this many days old are settled
+TIMEZONE = ZoneInfo("America/Los_Angeles")
+
+_api_cache = None
+_api_cache_lock = threading.Lock()
+
+
+# function returns the cache key for one endpoint call
+def cache_key(endpoint, params):
+    payload = json.dumps([endpoint, params], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# function turns a raw reply into {result set name: (headers, rows)}
+def result_sets(response):
+    sets = response.get("resultSets", response.get("resultSet", []))
+    if isinstance(sets, dict):
+        sets = [sets]
+    return {rs["name"]: (rs["headers"], rs["rowSet"]) for rs in sets}
+
+
+class APICache():
+    def __init__(self, path=DEFAULT_PATH, max_mb=DEFAULT_MAX_MB, past_ttl=PAST_TTL,
+                 current_ttl=CURRENT_TTL, enabled=True):
+        self.path = path
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.past_ttl = past_ttl
+        self.current_ttl = current_ttl
+        self.enabled = enabled
+        self.bypass = False
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        if enabled:
+            os.makedirs(path, exist_ok=True)
+
+    # function picks the TTL for a request covering dates up to latest_date
+    def ttl_for(self, latest_date):
+        settled = datetime.now(TIMEZONE).date() - timedelta(days=SETTLED_DAYS)
+        if latest_date is not None and latest_date <= settled:
+            return self.past_ttl
+        return self.current_ttl
+
+    def _file(self, key):
+        return os.path.join(self.path, key[:2], key + ".json")
+
+    # returns the stored reply, or None on a miss, an expired entry or bypass
+    def get(self, endpoint, params):
+        if not self.enabled or self.bypass:
+            return None
+        file = self._file(cache_key(endpoint, params))
+        try:
+            with open(file, encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+        if entry["expires_at"] < time.time():
+            self._remove(file)
+            with self._lock:
+                self.misses += 1
+            return None
+        # the modification time is the LRU clock. A concurrent evict() may
+        # have deleted the file since it was read; the reply is still good.
+        try:
+            os.utime(file)
+        except OSError:
+            pass
+        with self._lock:
+            self.hits += 1
+        return entry["response"]
+
+    def put(self, endpoint, params, response, latest_date):
+        if not self.enabled:
+            return
+        file = self._file(cache_key(endpoint, params))
+        os.makedirs(os.path.dirname(file), exist_ok=True)
+        entry = {
+            "endpoint": endpoint,
+            "params": params,
+            "stored_at": time.time(),
+            "expires_at": time.time() + self.ttl_for(latest_date),
+            "response": response,
+        }
+        # write then rename, so a reader never sees half a file
+        temp = f"{file}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp, "w", encoding="utf-8") as f:
+            json.dump(entry, f, default=str)
+        os.replace(temp, file)
+        self.evict()
+
+    # function deletes the least recently used entries until the cache
+    # fits in max_bytes again
+    def evict(self):
+        with self._lock:
+            files = []
+            total = 0
+            for folder, _, names in os.walk(self.path):
+                for name in names:
+                    if not name.endswith(".json"):
+                        continue
+                    file = os.path.join(folder, name)
+                    try:
+                        info = os.stat(file)
+                    except OSError:
+                        continue
+                    files.append((info.st_mtime, info.st_size, file))
+                    total += info.st_size
+            files.sort()
+            for _, size, file in files:
+                if total <= self.max_bytes:
+                    break
+                self._remove(file)
+                total -= size
+
+    @staticmethod
+    def _remove(file):
+        try:
+            os.remove(file)
+        except OSError:
+            pass
+
+    def clear(self):
+        for folder, _, names in os.walk(self.path):
+            for name in names:
+                self._remove(os.path.join(folder, name))
+
+    def stats(self):
+        with self._lock:
+            return {"enabled": self.enabled, "bypass": self.bypass,
+                    "hits": self.hits, "misses": self.misses}
+
+
+# function returns the process-wide cache, creating it on first use.
+# On unless [api_cache] sets enabled = false.
+def get_api_cache():
+    global _api_cache
+    if _api_cache is None:
+        with _api_cache_lock:
+            if _api_cache is None:
+                cfg = st.secrets.get("api_cache", {})
+                _api_cache = APICache(
+                    path=cfg.get("path", DEFAULT_PATH),
+                    max_mb=float(cfg.get("max_mb", DEFAULT_MAX_MB)),
+                    past_ttl=float(cfg.get("past_ttl", PAST_TTL)),
+                    current_ttl=float(cfg.get("current_ttl", CURRENT_TTL)),
+                    enabled=bool(cfg.get("enabled", True)),
+                )
+    return _api_cache
@@ -0,0 +1,713 @@
+"""
+Incremental Ingest Engine
+-------------------------
+Loads NBA games and player stats from the NBA API into the database, one
+date at a time, and records how far each feed has got in IngestWatermark:
+  - 'games' fills Game (with TeamSeasonSummary and HeadToHead)
+  - 'stats' fills PlayerGameStats (with PlayerSeasonTotals,
+    PlayerOpponentSplit and PlayerMatchup)
+A run fetches only the dates after the feed's LastDate, so days a missed
+cron run skipped are picked up by the next one. Every date is committed
+on its own together with the watermark, so a run that fails part way
+keeps what it finished and the next run starts where it stopped.
+
+A date only moves LastDate once all of it is in: every game the API lists
+for it (stats: every regular season game the Game table has for it).
+Dates without games count as done once the fetched window has games after
+them. Games finished on later dates are kept in the watermark's GameIDs
+and skipped until LastDate catches up.
+Requests to the API carry the window's date bounds, so a daily run only
+downloads one day of games and player logs, and replies are kept in the
+disk cache in api_cache.py, so a rerun is mostly served locally.
+
+CatchUp.py, DailyScoreInsert.py, DailyStatsInsert.py and
+HistoricalScoreInsert.py are the entry points.
+"""
+
+from nba_api.stats.endpoints import leaguegamefinder, playergamelogs, scoreboardv2
+import pandas as pd
+import mysql.connector
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
+import streamlit as st
+import certifi
+
+from api_cache import get_api_cache, result_sets
+from nba_client import get_nba_client
+from summary_tables import (
+    apply_game_to_team_summary,
+    apply_game_to_head_to_head,
+    apply_stats_to_player_totals,
+    apply_stats_to_opponent_split,
+    apply_game_to_player_matchups,
+    matchup_opponent,
+)
+
+# ==================== CONFIGURATION ====================
+cfg = st.secrets["db"]
+
+DB_CONFIG = {
+    "host": cfg["host"],
+    "port": int(cfg["port"]),
+    "user": cfg["user"],
+    "password": cfg["password"],
+    "database": cfg["database"],
+    "ssl_ca": certifi.where(),  # Aiven requires SSL; this keeps Streamlit happy
+}
+
+TIMEZONE = ZoneInfo("America/Los_Angeles")
+
+# ScoreboardV2 lookups run on API_WORKERS threads; rate limits and
+# retries are the shared client's (nba_client.py)
+API_WORKERS = 4
+
+GAMES = "games"
+STATS = "stats"
+FEEDS = (GAMES, STATS)
+
+GAME_INSERT = """
+    INSERT INTO Game (GameID, Date, HomeTeamID, AwayTeamID, VenueID, HomeTeamScore, AwayTeamScore, Attendance)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
+STAT_INSERT = """
+    INSERT INTO PlayerGameStats (GameID, PlayerID, Points, Rebounds, Assists, Steals, Blocks, Turnovers, Fouls, Minutes, TeamID)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
+WATERMARK_UPSERT = """
+    INSERT INTO IngestWatermark (Feed, LastDate, GameIDs, UpdatedAt)
+    VALUES (%s, %s, %s, %s) AS new
+    ON DUPLICATE KEY UPDATE
+        LastDate = new.LastDate,
+        GameIDs = new.GameIDs,
+        UpdatedAt = new.UpdatedAt
+"""
+
+VS_PAT = re.compile(r"\svs\.?\s", flags=re.IGNORECASE)
+AT_PAT = re.compile(r"\s@\s")
+STAT_COLUMNS = ["PTS", "REB", "AST", "STL", "BLK", "TOV", "PF", "MIN"]
+
+# GameIDs are the API's "00" + season type digit + 7 digits, so the type is
+# GameID // GAME_TYPE_DIVISOR (1 preseason, 2 regular season, 4 playoffs)
+GAME_TYPE_DIVISOR = 10_000_000
+REGULAR_SEASON = 2
+
+
+# ==================== HELPERS ====================
+def connect():
+    db = mysql.connector.connect(**DB_CONFIG)
+    db.autocommit = False
+    return db, db.cursor()
+
+
+# the last date whose games are over, in league time
+def yesterday():
+    return datetime.now(TIMEZONE).date() - timedelta(days=1)
+
+
+# function returns the NBA season a date belongs to, e.g. "2025-26".
+# Seasons are counted from August so the summer belongs to the next one.
+def season_for(day):
+    start_year = day.year if day.month >= 8 else day.year - 1
+    return f"{start_year}-{(start_year + 1) % 100:02d}"
+
+
+def dates_between(start, end):
+    day = start
+    while day <= end:
+        yield day
+        day += timedelta(days=1)
+
+
+# API game IDs are zero-padded strings ("0022500123"); ours are ints
+def api_game_id(gid):
+    return int(str(gid).lstrip('0') or 0)
+
+
+# ==================== WATERMARKS ====================
+class Watermark():
+    def __init__(self, feed, last_date, game_dates):
+        self.feed = feed
+        self.last_date = last_date
+        # {GameID: date} for games done on dates after last_date
+        self.game_dates = game_dates
+
+    def is_done(self, game_id):
+        return game_id in self.game_dates
+
+    # function records a date's finished games and moves last_date when the
+    # date is complete and directly follows it
+    def advance(self, day, done_game_ids, complete):
+        for game_id in done_game_ids:
+            self.game_dates[game_id] = day
+        if complete and day == self.last_date + timedelta(days=1):
+            self.last_date = day
+            self.game_dates = {
+                game_id: game_day for game_id, game_day in self.game_dates.items()
+                if game_day > day
+            }
+
+    def save(self, cursor):
+        cursor.execute(WATERMARK_UPSERT, (
+            self.feed,
+            self.last_date,
+            json.dumps(sorted(self.game_dates)),
+            datetime.now(),
+        ))
+
+
+# function returns the feed's Watermark, or None when the feed has never run
+def load_watermark(cursor, feed):
+    cursor.execute("SELECT LastDate, GameIDs FROM IngestWatermark WHERE Feed = %s", (feed,))
+    row = cursor.fetchone()
+    if row is None:
+        return None
+    last_date, game_ids = row
+    game_ids = json.loads(game_ids) if game_ids else []
+    game_dates = {}
+    if game_ids:
+        placeholders = ", ".join(["%s"] * len(game_ids))
+        cursor.execute(f"SELECT GameID, Date FROM Game WHERE GameID IN ({placeholders})", tuple(game_ids))
+        game_dates = {game_id: game_date.date() for game_id, game_date in cursor.fetchall()}
+    return Watermark(feed, last_date, game_dates)
+
+
+# ==================== LOOKUPS ====================
+def load_team_map(cursor):
+    cursor.execute("SELECT TeamID, Abbreviation FROM Team")
+    return {abbr: team_id for team_id, abbr in cursor.fetchall()}
+
+
+def load_venue_map(cursor):
+    cursor.execute("SELECT VenueID, Name FROM Venue")
+    return {name.strip(): venue_id for venue_id, name in cursor.fetchall()}
+
+
+def load_player_map(cursor):
+    cursor.execute("SELECT PlayerID, FirstName, LastName FROM Player")
+    return {f"{first} {last}".strip().lower(): player_id for player_id, first, last in cursor.fetchall()}
+
+
+# function returns {date: {GameID}} for the games already stored in the window
+def stored_games(cursor, start, end):
+    cursor.execute(
+        "SELECT GameID, Date FROM Game WHERE Date >= %s AND Date < %s",
+        (start, end + timedelta(days=1)),
+    )
+    games = {}
+    for game_id, game_date in cursor.fetchall():
+        games.setdefault(game_date.date(), set()).add(game_id)
+    return games
+
+
+# function returns {(GameID, PlayerID)} for the stat lines already stored in the window
+def stored_stats(cursor, start, end):
+    cursor.execute("""
+        SELECT s.GameID, s.PlayerID
+        FROM Game g
+        INNER JOIN PlayerGameStats s ON s.GameID = g.GameID
+        WHERE g.Date >= %s AND g.Date < %s
+    """, (start, end + timedelta(days=1)))
+    return set(cursor.fetchall())
+
+
+# ==================== NBA API ====================
+# function splits a window into [(season, first date, last date)] so every
+# request stays inside one season
+def season_windows(start, end):
+    windows = []
+    for day in dates_between(start, end):
+        season = season_for(day)
+        if windows and windows[-1][0] == season:
+            windows[-1] = (season, windows[-1][1], day)
+        else:
+            windows.append((season, day, day))
+    return windows
+
+
+# the API takes its date bounds as MM/DD/YYYY
+def api_date(day):
+    return day.strftime("%m/%d/%Y")
+
+
+# function normalizes GAME_DATE to "YYYY-MM-DD" and checks the API kept to
+# the requested bounds; a response outside them means the filter was ignored
+def check_window(frame, start, end, endpoint):
+    if frame.empty:
+        return frame
+    frame["GAME_DATE"] = pd.to_datetime(frame["GAME_DATE"]).dt.date.astype(str)
+    outside = frame[(frame["GAME_DATE"] < start.isoformat()) | (frame["GAME_DATE"] > end.isoformat())]
+    if not outside.empty:
+        raise ValueError(
+            f"{endpoint} returned {len(outside)} row(s) outside {start} to {end} "
+            f"({outside['GAME_DATE'].min()} to {outside['GAME_DATE'].max()})"
+        )
+    return frame
+
+
+# function returns {result set name: DataFrame} for one NBA API call,
+# served from the disk cache when it holds a fresh reply.
+# latest_date is the newest date the request covers; it sets the TTL.
+def call_endpoint(endpoint, latest_date, **params):
+    cache = get_api_cache()
+    name = endpoint.__name__
+    response = cache.get(name, params)
+    if response is None:
+        response = get_nba_client().request(endpoint, **params)
+        cache.put(name, params, response, latest_date)
+    return {
+        set_name: pd.DataFrame(rows, columns=headers)
+        for set_name, (headers, rows) in result_sets(response).items()
+    }
+
+
+# function returns the LeagueGameFinder rows (two per game) dated within the
+# window, with GAME_DATE as "YYYY-MM-DD", and the latest date among them
+def fetch_games(start, end):
+    frames = []
+    for season, first, last in season_windows(start, end):
+        frame = call_endpoint(
+            leaguegamefinder.LeagueGameFinder, last,
+            season_nullable=season,
+            league_id_nullable="00",
+            date_from_nullable=api_date(first),
+            date_to_nullable=api_date(last)
+        )["LeagueGameFinderResults"]
+        frames.append(check_window(frame, first, last, "LeagueGameFinder"))
+    games = pd.concat(frames, ignore_index=True)
+    if games.empty:
+        return games, None
+    return games, date.fromisoformat(games["GAME_DATE"].max())
+
+
+# function returns the regular season PlayerGameLogs rows dated within the
+# window, with GAME_DATE as "YYYY-MM-DD"
+def fetch_stats(start, end):
+    frames = []
+    for season, first, last in season_windows(start, end):
+        frame = call_endpoint(
+            playergamelogs.PlayerGameLogs, last,
+            season_nullable=season,
+            season_type_nullable='Regular Season',
+            date_from_nullable=api_date(first),
+            date_to_nullable=api_date(last)
+        )["PlayerGameLogs"]
+        frames.append(check_window(frame, first, last, "PlayerGameLogs"))
+    return pd.concat(frames, ignore_index=True)
+
+
+# function returns ({GameID: VenueID}, {GameID: attendance}, {GameID: unknown arena})
+# from the ScoreboardV2 header for one date
+def fetch_venues(day, venue_name_to_id):
+    gh = call_endpoint(scoreboardv2.ScoreboardV2, day, game_date=day.isoformat())["GameHeader"]
+
+    venue_id_map = {}
+    attendance_map = {}
+    missing_arena_by_game = {}
+    if gh.empty or "GAME_ID" not in gh.columns:
+        return venue_id_map, attendance_map, missing_arena_by_game
+
+    for _, ghr in gh.iterrows():
+        game_id = api_game_id(ghr.get("GAME_ID"))
+        arena = str(ghr.get("ARENA_NAME") or "").strip() or None
+        if arena:
+            venue_id = venue_name_to_id.get(arena)
+            if venue_id:
+                venue_id_map[game_id] = venue_id
+            else:
+                missing_arena_by_game[game_id] = arena
+        att = ghr.get("ATTENDANCE")
+        if pd.notna(att) and att > 0:
+            attendance_map[game_id] = int(att)
+    return venue_id_map, attendance_map, missing_arena_by_game
+
+
+# function looks up the venues of many dates at once on API_WORKERS threads.
+# The shared client retries a failing date inside its own worker while the
+# others carry on. Returns {date: fetch_venues result, or the exception}.
+def fetch_all_venues(days, venue_name_to_id):
+    results = {}
+    with ThreadPoolExecutor(max_workers=API_WORKERS) as pool:
+        futures = {pool.submit(fetch_venues, day, venue_name_to_id): day for day in days}
+        for future in as_completed(futures):
+            try:
+                results[futures[future]] = future.result()
+            except Exception as e:
+                results[futures[future]] = e
+    return results
+
+
+# ==================== GAMES ====================
+# function turns one date's LeagueGameFinder rows into game records.
+# Returns (games, skipped); skipped names the games left out, e.g.
+# exhibitions against teams outside the league.
+def pair_games(rows, team_abbr_to_db_id):
+    games = []
+    skipped = []
+    for gid, grp in rows.groupby("GAME_ID"):
+        game_id = api_game_id(gid)
+        if len(grp) < 2:
+            skipped.append(f"game {game_id}: only {len(grp)} team record(s)")
+            continue
+
+        home_cand = grp[grp["MATCHUP"].str.contains(VS_PAT, na=False)]
+        away_cand = grp[grp["MATCHUP"].str.contains(AT_PAT, na=False)]
+        if len(home_cand) == 1 and len(away_cand) == 1:
+            home_row = home_cand.iloc[0]
+            away_row = away_cand.iloc[0]
+        else:
+            r0, r1 = grp.iloc[0], grp.iloc[1]
+            if "@" in str(r0["MATCHUP"]):
+                away_row, home_row = r0, r1
+            elif "vs" in str(r0["MATCHUP"]).lower():
+                home_row, away_row = r0, r1
+            else:
+                skipped.append(f"game {game_id}: could not tell home from away")
+                continue
+
+        home_abbr = str(home_row["TEAM_ABBREVIATION"]).strip()
+        away_abbr = str(away_row["TEAM_ABBREVIATION"]).strip()
+        db_home_id = team_abbr_to_db_id.get(home_abbr)
+        db_away_id = team_abbr_to_db_id.get(away_abbr)
+        if not db_home_id or not db_away_id:
+            skipped.append(f"game {game_id}: team {away_abbr} @ {home_abbr} not in database")
+            continue
+
+        games.append({
+            "game_id": game_id,
+            "game_date": str(home_row["GAME_DATE"]),
+            "home_team_id": db_home_id,
+            "away_team_id": db_away_id,
+            "home_score": int(home_row["PTS"]) if pd.notna(home_row.get("PTS")) else None,
+            "away_score": int(away_row["PTS"]) if pd.notna(away_row.get("PTS")) else None,
+            "venue_id": None,
+            "attendance": None,
+        })
+    return games, skipped
+
+
+def insert_game(cursor, game):
+    cursor.execute(GAME_INSERT, (
+        game["game_id"],
+        game["game_date"],
+        game["home_team_id"],
+        game["away_team_id"],
+        game["venue_id"],
+        game["home_score"],
+        game["away_score"],
+        game["attendance"]
+    ))
+    # Keep the standings summaries in the same transaction as the game
+    apply_game_to_team_summary(
+        cursor,
+        game["home_team_id"],
+        game["away_team_id"],
+        game["home_score"],
+        game["away_score"]
+    )
+    apply_game_to_head_to_head(
+        cursor,
+        game["home_team_id"],
+        game["away_team_id"],
+        game["home_score"],
+        game["away_score"]
+    )
+
+
+# function loads the games of every date in the window. A date with a
+# problem (arena not in Venue, ScoreboardV2 down) is rolled back as a whole,
+# unless default_venue allows games with an unknown arena to use the
+# first Venue row. Returns a report dict.
+def ingest_games(db, cursor, start, end, watermark, default_venue=False):
+    report = {"feed": GAMES, "inserted": 0, "failed_dates": [], "pending_dates": []}
+    team_abbr_to_db_id = load_team_map(cursor)
+    venue_name_to_id = load_venue_map(cursor)
+    cursor.execute("SELECT VenueID FROM Venue ORDER BY VenueID LIMIT 1")
+    default_venue_id = cursor.fetchone()[0]
+    existing = stored_games(cursor, start, end)
+
+    print(f"Fetching games from NBA API for {start} to {end}...")
+    all_games, api_latest = fetch_games(start, end)
+    print(f"✓ API returned {len(all_games)} game records ({len(all_games) // 2} games)")
+
+    days = {}
+    for day in dates_between(start, end):
+        rows = all_games[all_games["GAME_DATE"] == day.isoformat()]
+        games, skipped = pair_games(rows, team_abbr_to_db_id)
+        stored = existing.get(day, set())
+        new_games = [
+            game for game in games
+            if game["game_id"] not in stored and not watermark.is_done(game["game_id"])
+        ]
+        days[day] = (rows, games, skipped, stored, new_games)
+
+    lookup_days = [day for day, plan in days.items() if plan[4]]
+    venues = {}
+    if lookup_days:
+        print(f"Fetching arena and attendance data for {len(lookup_days)} date(s) "
+              f"({API_WORKERS} workers)...")
+        venues = fetch_all_venues(lookup_days, venue_name_to_id)
+
+    for day, (rows, games, skipped, stored, new_games) in days.items():
+        problems = []
+        if new_games:
+            venue_lookup = venues[day]
+            if isinstance(venue_lookup, Exception):
+                venue_id_map, attendance_map, missing_arena_by_game = {}, {}, {}
+                problems.append(f"ScoreboardV2 failed: {venue_lookup}")
+            else:
+                venue_id_map, attendance_map, missing_arena_by_game = venue_lookup
+            for game in new_games:
+                game["venue_id"] = venue_id_map.get(game["game_id"])
+                game["attendance"] = attendance_map.get(game["game_id"])
+                if game["venue_id"] is None:
+                    if default_venue:
+                        game["venue_id"] = default_venue_id
+                    else:
+                        arena = missing_arena_by_game.get(game["game_id"])
+                        problems.append(f"game {game['game_id']}: arena '{arena}' not found in Venue table"
+                                        if arena else f"game {game['game_id']}: no matching arena found")
+
+        # a date without games is only over once the window has later games
+        published = not rows.empty or (api_latest is not None and day < api_latest)
+        inserted = 0
+        try:
+            if not problems:
+                for game in new_games:
+                    insert_game(cursor, game)
+                    inserted += 1
+            done = {game["game_id"] for game in games} if not problems else stored
+            watermark.advance(day, done, complete=published and not problems)
+            watermark.save(cursor)
+            if inserted:
+                # Tell the app's read cache that game data changed
+                cursor.execute("UPDATE DataVersion SET Version = Version + 1 WHERE VersionID = 1")
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            inserted = 0
+            problems.append(f"insert failed: {e}")
+
+        report["inserted"] += inserted
+        for note in skipped:
+            print(f"  ⏭️  {day}: skipped {note}")
+        if problems:
+            report["failed_dates"].append(day)
+            print(f"  🚨 {day}: rolled back, no games inserted")
+            for problem in problems:
+                print(f"    - {problem}")
+        elif not published:
+            report["pending_dates"].append(day)
+            print(f"  ⏳ {day}: no games published yet")
+        elif games:
+            print(f"  ✓ {day}: inserted {inserted} of {len(games)} game(s)")
+    return report
+
+
+# ==================== STATS ====================
+def stat_values(row):
+    return tuple(int(row[col]) if pd.notna(row.get(col)) else 0 for col in STAT_COLUMNS)
+
+
+# function loads the player stat lines of every date in the window. Stats
+# follow the games feed: a date is complete once the games watermark has
+# passed it and every stored game of that date has stat lines. A date with
+# a player missing from the Player table is rolled back as a whole.
+def ingest_stats(db, cursor, start, end, watermark, games_watermark):
+    report = {"feed": STATS, "inserted": 0, "failed_dates": [], "pending_dates": []}
+    player_name_to_db_id = load_player_map(cursor)
+    team_abbr_to_db_id = load_team_map(cursor)
+    games_by_date = stored_games(cursor, start, end)
+    existing_stats = stored_stats(cursor, start, end)
+
+    print(f"Fetching player game logs from NBA API for {start} to {end}...")
+    logs = fetch_stats(start, end)
+    print(f"✓ API returned {len(logs)} player game log entries")
+
+    if not logs.empty:
+        logs["PlayerID"] = logs["PLAYER_NAME"].str.strip().str.lower().map(player_name_to_db_id)
+        logs["GameID"] = logs["GAME_ID"].map(api_game_id)
+
+    for day in dates_between(start, end):
+        rows = logs[logs["GAME_DATE"] == day.isoformat()] if not logs.empty else logs
+        # the logs only cover the regular season, so only its games need stats
+        day_games = {g for g in games_by_date.get(day, set()) if g // GAME_TYPE_DIVISOR == REGULAR_SEASON}
+        problems = []
+
+        unmapped = rows[rows["PlayerID"].isna()]["PLAYER_NAME"].unique() if not rows.empty else []
+        for player_name in unmapped:
+            problems.append(f"player '{player_name}' not in Player table")
+
+        with_stats = {game_id for game_id, _ in existing_stats if game_id in day_games}
+        inserted = 0
+        # games that got new stat lines, for the player matchup index
+        inserted_games = set()
+        try:
+            if not problems:
+                for _, row in rows.iterrows():
+                    game_id = int(row["GameID"])
+                    player_id = int(row["PlayerID"])
+                    if watermark.is_done(game_id) or (game_id, player_id) in existing_stats:
+                        continue
+                    if game_id not in day_games:
+                        # the games feed has not stored this game yet
+                        continue
+
+                    values = (game_id, player_id) + stat_values(row)
+                    # Team and opponent come from the game itself, so traded players stay correct
+                    team_id = team_abbr_to_db_id.get(str(row["TEAM_ABBREVIATION"]).strip())
+                    opponent_id = team_abbr_to_db_id.get(matchup_opponent(row["MATCHUP"]))
+                    if team_id is None or opponent_id is None:
+                        raise ValueError(f"Unknown team in '{row['MATCHUP']}' for game {game_id}")
+
+                    cursor.execute(STAT_INSERT, values + (team_id,))
+                    # Keep the season totals and opponent splits in the same transaction as the stat line
+                    apply_stats_to_player_totals(cursor, *values[1:])
+                    apply_stats_to_opponent_split(cursor, player_id, opponent_id, *values[2:])
+                    inserted_games.add(game_id)
+                    inserted += 1
+
+                for game_id in inserted_games:
+                    apply_game_to_player_matchups(cursor, game_id)
+
+            done = with_stats | inserted_games | {g for g in day_games if watermark.is_done(g)}
+            complete = (not problems
+                        and games_watermark.last_date >= day
+                        and day_games <= done)
+            watermark.advance(day, done if not problems else with_stats, complete)
+            watermark.save(cursor)
+            if inserted:
+                # Tell the app's read cache that stats changed
+                cursor.execute("UPDATE DataVersion SET Version = Version + 1 WHERE VersionID = 1")
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            inserted = 0
+            complete = False
+            problems.append(f"insert failed: {e}")
+
+        report["inserted"] += inserted
+        if problems:
+            report["failed_dates"].append(day)
+            print(f"  🚨 {day}: rolled back, no stats inserted")
+            for problem in problems:
+                print(f"    - {problem}")
+        elif not complete:
+            report["pending_dates"].append(day)
+            if games_watermark.last_date < day:
+                print(f"  ⏳ {day}: waiting on the games feed")
+            else:
+                print(f"  ⏳ {day}: no stats published yet for {len(day_games - done)} game(s)")
+        elif day_games:
+            print(f"  ✓ {day}: inserted {inserted} stat line(s) for {len(day_games)} game(s)")
+    return report
+
+
+# ==================== CATCH-UP ====================
+# function brings one feed up to `through` (default yesterday), starting
+# the day after its watermark. `since` is the first date for a feed that
+# has no watermark yet.
+def catch_up(db, cursor, feed, through=None, since=None, default_venue=False):
+    through = through or yesterday()
+    watermark = load_watermark(cursor, feed)
+    if watermark is None:
+        if since is None:
+            raise ValueError(f"The {feed} feed has no watermark yet; pass a start date (--since)")
+        watermark = Watermark(feed, since - timedelta(days=1), {})
+    start = watermark.last_date + timedelta(days=1)
+    if start > through:
+        print(f"✓ {feed}: up to date through {watermark.last_date}")
+        return {"feed": feed, "inserted": 0, "failed_dates": [], "pending_dates": []}
+    return ingest_window(db, cursor, feed, start, through, watermark, default_venue)
+
+
+# function loads an explicit window. Dates right after the feed's watermark
+# move it forward; later ones only record their finished games.
+def ingest_window(db, cursor, feed, start, end, watermark=None, default_venue=False):
+    if watermark is None:
+        watermark = load_watermark(cursor, feed) or Watermark(feed, start - timedelta(days=1), {})
+    print(f"\n{feed}: ingesting {start} to {end} (watermark {watermark.last_date})")
+    if feed == GAMES:
+        return ingest_games(db, cursor, start, end, watermark, default_venue)
+    games_watermark = load_watermark(cursor, GAMES) or Watermark(GAMES, date.min, {})
+    return ingest_stats(db, cursor, start, end, watermark, games_watermark)
+
+
+# function connects, runs each feed in order and prints a summary.
+# window=(start, end) loads those dates instead of catching up.
+# Returns the process exit code: 1 when a date failed.
+def run(feeds=FEEDS, through=None, since=None, window=None, default_venue=False):
+    print(f"Current time: {datetime.now(TIMEZONE).strftime('%Y-%m-%d %H:%M:%S %Z')}")
+    try:
+        db, cursor = connect()
+        print("✓ Connected to database")
+    except Exception as e:
+        print(f"✗ Database connection failed: {e}")
+        return 1
+
+    reports = []
+    try:
+        for feed in feeds:
+            try:
+                if window:
+                    reports.append(ingest_window(db, cursor, feed, *window, default_venue=default_venue))
+                else:
+                    reports.append(catch_up(db, cursor, feed, through, since, default_venue))
+            except Exception as e:
+                db.rollback()
+                print(f"✗ {feed}: {e}")
+                reports.append({"feed": feed, "inserted": 0, "failed_dates": [], "pending_dates": [], "error": str(e)})
+    finally:
+        print("\n" + "=" * 60)
+        for report in reports:
+            watermark = load_watermark(cursor, report["feed"])
+            line = f"SUMMARY {report['feed']}: inserted {report['inserted']}"
+            if watermark is not None:
+                line += f", complete through {watermark.last_date}"
+            if report["failed_dates"]:
+                line += f", {len(report['failed_dates'])} failed date(s)"
+            if report["pending_dates"]:
+                line += f", {len(report['pending_dates'])} pending date(s)"
+            if report.get("error"):
+                line += ", stopped by an error"
+            print(line)
+        cache = get_api_cache().stats()
+        if cache["enabled"]:
+            print(f"NBA API cache: {cache['hits']} hit(s), {cache['misses']} miss(es)"
+                  + (" (bypassed)" if cache["bypass"] else ""))
+        client = get_nba_client()
+        endpoint_stats = client.summary()
+        for row in endpoint_stats:
+            print(f"NBA API {row['endpoint']}: {row['calls']} call(s), {row['errors']} error(s), "
+                  f"{row['retries']} retries ({row['throttled']} throttled, {row['timeouts']} timeouts), "
+                  f"p50 {row['p50_ms']} ms, p95 {row['p95_ms']} ms")
+        if endpoint_stats:
+            # keep a history of API health across runs
+            try:
+                print(f"NBA API stats appended to {client.dump()}")
+            except OSError as e:
+                print(f"✗ Could not write NBA API stats: {e}")
+        print("=" * 60)
+        cursor.close()
+        db.close()
+    return 1 if any(report["failed_dates"] or report.get("error") for report in reports) else 0
+
+
+# function prints each feed's watermark
+def print_status():
+    db, cursor = connect()
+    try:
+        for feed in FEEDS:
+            watermark = load_watermark(cursor, feed)
+            if watermark is None:
+                print(f"  {feed:<6} no watermark yet")
+            else:
+                print(f"  {feed:<6} complete through {watermark.last_date}, "
+                      f"{len(watermark.game_dates)} game(s) done past it")
+    finally:
+        cursor.close()
+        db.close()
@@ -0,0 +1,250 @@
+import json
+import math
+import os
+import random
+import threading
+import time
+from collections import deque
+
+import requests
+import streamlit as st
+from requests.adapters import HTTPAdapter
+from nba_api.stats.library.http import NBAStatsHTTP
+
+# module holds the one stats.nba.com client the Stats_Scores scripts share.
+#  - requests go out over a requests.Session with a keep-alive connection
+#    pool instead of a new connection per nba_api call
+#  - a token bucket spaces them out. It is adaptive: a 429 halves the rate
+#    and every success wins back a little of it, up to the configured rate
+#  - 429s, 5xx replies, timeouts and dropped connections are retried with
+#    exponential backoff and full jitter (a 429's Retry-After wins)
+#  - every endpoint's latency, retries and errors are recorded; summary()
+#    returns them, and the ingest runs print them at the end and append
+#    them to dump_path with dump()
+# nba_api endpoint classes still build the request parameters; the client
+# only replaces the HTTP call.
+#
+# Configured from an optional [nba_api] section in Streamlit secrets:
+#   rate = 2.0
+#   burst = 4
+#   max_retries = 5
+#   timeout = 15
+#   pool_size = 8
+#   dump_path = "logs/nba_api_stats.jsonl"
+
+DEFAULT_RATE = 2.0          # requests per second
+MIN_RATE = 0.2              # the bucket never slows below this after 429s
+RATE_RECOVERY = 0.05        # requests per second won back per success
+DEFAULT_BURST = 4
+DEFAULT_MAX_RETRIES = 5
+DEFAULT_TIMEOUT = 15        # seconds
+DEFAULT_POOL_SIZE = 8
+BACKOFF_BASE = 1.0          # seconds; doubled on every attempt
+BACKOFF_MAX = 60.0
+RETRY_STATUS = {429, 500, 502, 503, 504}
+# latencies kept per endpoint for the percentiles; older samples roll off
+SAMPLE_WINDOW = 1024
+DEFAULT_DUMP_PATH = "logs/nba_api_stats.jsonl"
+
+_nba_client = None
+_nba_client_lock = threading.Lock()
+
+
+class APIRequestError(Exception):
+    pass
+
+
+# function returns the nearest-rank percentile of an already sorted list
+def _percentile(ordered, pct):
+    if not ordered:
+        return None
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return round(ordered[rank - 1], 3)
+
+
+class TokenBucket():
+    def __init__(self, rate=DEFAULT_RATE, burst=DEFAULT_BURST):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    # blocks until a token is free and takes it
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+    # the server pushed back: halve the rate and drop any saved-up burst
+    def throttled(self):
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = max(MIN_RATE, self.rate / 2)
+            self.tokens = min(self.tokens, 0.0)
+
+    def succeeded(self):
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + RATE_RECOVERY)
+
+
+class EndpointStats():
+    def __init__(self, window=SAMPLE_WINDOW):
+        self.calls = 0
+        self.errors = 0
+        self.retries = 0
+        self.throttled = 0
+        self.timeouts = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.samples = deque(maxlen=window)
+
+    # one HTTP attempt; failed attempts count their latency too
+    def record(self, elapsed_ms):
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.samples.append(elapsed_ms)
+
+    def summary(self):
+        ordered = sorted(self.samples)
+        attempts = len(ordered)
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "retries": self.retries,
+            "throttled": self.throttled,
+            "timeouts": self.timeouts,
+            "avg_ms": round(sum(ordered) / attempts, 3) if attempts else 0,
+            "p50_ms": _percentile(ordered, 50),
+            "p95_ms": _percentile(ordered, 95),
+            "max_ms": round(self.max_ms, 3),
+        }
+
+
+class NBAClient():
+    def __init__(self, rate=DEFAULT_RATE, burst=DEFAULT_BURST, max_retries=DEFAULT_MAX_RETRIES,
+                 timeout=DEFAULT_TIMEOUT, pool_size=DEFAULT_POOL_SIZE, dump_path=DEFAULT_DUMP_PATH):
+        self.bucket = TokenBucket(rate, burst)
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.dump_path = dump_path
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.headers.update(NBAStatsHTTP.headers)
+        self._endpoints = {}
+        self._lock = threading.Lock()
+
+    def _stats(self, name):
+        with self._lock:
+            stats = self._endpoints.get(name)
+            if stats is None:
+                stats = self._endpoints[name] = EndpointStats()
+            return stats
+
+    # function returns the sleep before retry number `attempt` (1 = first
+    # retry): full jitter over an exponentially growing cap
+    @staticmethod
+    def backoff(attempt, retry_after=None):
+        if retry_after is not None:
+            return min(BACKOFF_MAX, retry_after)
+        return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+
+    # function calls one nba_api endpoint, e.g.
+    # request(scoreboardv2.ScoreboardV2, game_date="2025-11-08"),
+    # and returns the raw JSON reply as a dict
+    def request(self, endpoint, **params):
+        name = endpoint.__name__
+        # the endpoint class only builds the parameters; the client sends them
+        call = endpoint(**params, get_request=False)
+        url = NBAStatsHTTP.base_url.format(endpoint=call.endpoint)
+        stats = self._stats(name)
+        with self._lock:
+            stats.calls += 1
+
+        attempt = 0
+        while True:
+            self.bucket.acquire()
+            retry_after = None
+            start = time.perf_counter()
+            try:
+                response = self.session.get(url, params=call.parameters, timeout=self.timeout)
+                status = response.status_code
+                error = None if status == 200 else f"HTTP {status}"
+                if status == 429:
+                    value = response.headers.get("Retry-After", "")
+                    retry_after = float(value) if value.isdigit() else None
+            except requests.Timeout as e:
+                status, error = None, f"timeout: {e}"
+            except requests.ConnectionError as e:
+                status, error = None, f"connection error: {e}"
+            elapsed_ms = (time.perf_counter() - start) * 1000
+
+            with self._lock:
+                stats.record(elapsed_ms)
+                stats.throttled += 1 if status == 429 else 0
+                stats.timeouts += 1 if error and error.startswith("timeout") else 0
+
+            if error is None:
+                self.bucket.succeeded()
+                return response.json()
+
+            if status == 429:
+                self.bucket.throttled()
+            retryable = status is None or status in RETRY_STATUS
+            if not retryable or attempt >= self.max_retries:
+                with self._lock:
+                    stats.errors += 1
+                raise APIRequestError(f"{name} failed after {attempt + 1} attempt(s): {error}")
+
+            attempt += 1
+            with self._lock:
+                stats.retries += 1
+            time.sleep(self.backoff(attempt, retry_after))
+
+    # function returns one summary dict per endpoint, busiest first
+    def summary(self):
+        with self._lock:
+            rows = [dict(endpoint=name, **stats.summary()) for name, stats in self._endpoints.items()]
+        return sorted(rows, key=lambda row: row["calls"], reverse=True)
+
+    # function appends the current summary to a JSON-lines file, one line
+    # per endpoint, all stamped with the same dump time. Returns the path.
+    def dump(self, path=None):
+        path = path or self.dump_path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        dumped_at = time.strftime("%Y-%m-%dT%H:%M:%S")
+        with open(path, "a", encoding="utf-8") as f:
+            for row in self.summary():
+                f.write(json.dumps(dict(dumped_at=dumped_at, **row)) + "\n")
+        return path
+
+
+# function returns the process-wide client, creating it on first use
+def get_nba_client():
+    global _nba_client
+    if _nba_client is None:
+        with _nba_client_lock:
+            if _nba_client is None:
+                cfg = st.secrets.get("nba_api", {})
+                _nba_client = NBAClient(
+                    rate=float(cfg.get("rate", DEFAULT_RATE)),
+                    burst=int(cfg.get("burst", DEFAULT_BURST)),
+                    max_retries=int(cfg.get("max_retries", DEFAULT_MAX_RETRIES)),
+                    timeout=float(cfg.get("timeout", DEFAULT_TIMEOUT)),
+                    pool_size=int(cfg.get("pool_size", DEFAULT_POOL_SIZE)),
+                    dump_path=cfg.get("dump_path", DEFAULT_DUMP_PATH),
+                )
+    return _nba_client
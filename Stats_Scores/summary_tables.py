@@ -0,0 +1,360 @@
+"""
+Summary Table Maintenance
+-------------------------
+Keeps the precomputed summary tables in step with the raw Game and
+PlayerGameStats rows.
+The insert scripts call these helpers with their own cursor, so every
+summary change lands in the same transaction as the row that caused it.
+RebuildSummaries.py uses the rebuild_* functions to repair a table from scratch.
+"""
+
+# ==================== TEAM SEASON SUMMARY ====================
+TEAM_SUMMARY_UPSERT = """
+    INSERT INTO TeamSeasonSummary
+        (TeamID, Wins, Losses, HomeWins, HomeLosses, AwayWins, AwayLosses,
+         PointsFor, PointsAgainst, GamesPlayed, WinPercentage)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, 1, %s) AS new
+    ON DUPLICATE KEY UPDATE
+        Wins = TeamSeasonSummary.Wins + new.Wins,
+        Losses = TeamSeasonSummary.Losses + new.Losses,
+        HomeWins = TeamSeasonSummary.HomeWins + new.HomeWins,
+        HomeLosses = TeamSeasonSummary.HomeLosses + new.HomeLosses,
+        AwayWins = TeamSeasonSummary.AwayWins + new.AwayWins,
+        AwayLosses = TeamSeasonSummary.AwayLosses + new.AwayLosses,
+        PointsFor = TeamSeasonSummary.PointsFor + new.PointsFor,
+        PointsAgainst = TeamSeasonSummary.PointsAgainst + new.PointsAgainst,
+        GamesPlayed = TeamSeasonSummary.GamesPlayed + 1,
+        WinPercentage = TeamSeasonSummary.Wins / (TeamSeasonSummary.Wins + TeamSeasonSummary.Losses)
+"""
+
+# One row per team (free agents excluded) built from every scored game
+TEAM_SUMMARY_REBUILD = [
+    "DELETE FROM TeamSeasonSummary",
+    """
+    INSERT INTO TeamSeasonSummary
+        (TeamID, Wins, Losses, HomeWins, HomeLosses, AwayWins, AwayLosses,
+         PointsFor, PointsAgainst, GamesPlayed, WinPercentage)
+    SELECT
+        t.TeamID,
+        COALESCE(SUM(r.Win), 0),
+        COALESCE(SUM(r.Loss), 0),
+        COALESCE(SUM(IF(r.IsHome = 1, r.Win, 0)), 0),
+        COALESCE(SUM(IF(r.IsHome = 1, r.Loss, 0)), 0),
+        COALESCE(SUM(IF(r.IsHome = 0, r.Win, 0)), 0),
+        COALESCE(SUM(IF(r.IsHome = 0, r.Loss, 0)), 0),
+        COALESCE(SUM(r.PointsFor), 0),
+        COALESCE(SUM(r.PointsAgainst), 0),
+        COUNT(r.TeamID),
+        0
+    FROM Team t
+    LEFT JOIN (
+        SELECT HomeTeamID AS TeamID, 1 AS IsHome,
+               IF(HomeTeamScore > AwayTeamScore, 1, 0) AS Win,
+               IF(HomeTeamScore < AwayTeamScore, 1, 0) AS Loss,
+               HomeTeamScore AS PointsFor, AwayTeamScore AS PointsAgainst
+        FROM Game
+        WHERE HomeTeamScore IS NOT NULL AND AwayTeamScore IS NOT NULL
+        UNION ALL
+        SELECT AwayTeamID AS TeamID, 0 AS IsHome,
+               IF(AwayTeamScore > HomeTeamScore, 1, 0) AS Win,
+               IF(AwayTeamScore < HomeTeamScore, 1, 0) AS Loss,
+               AwayTeamScore AS PointsFor, HomeTeamScore AS PointsAgainst
+        FROM Game
+        WHERE HomeTeamScore IS NOT NULL AND AwayTeamScore IS NOT NULL
+    ) r ON r.TeamID = t.TeamID
+    WHERE t.TeamID != 31
+    GROUP BY t.TeamID
+    """,
+    """
+    UPDATE TeamSeasonSummary
+    SET WinPercentage = IF(Wins + Losses = 0, 0, Wins / (Wins + Losses))
+    """,
+]
+
+
+def apply_game_to_team_summary(cursor, home_team_id, away_team_id, home_score, away_score):
+    """Add one finished game to both teams' TeamSeasonSummary rows.
+    Games without both scores have no result yet and are skipped."""
+    if home_score is None or away_score is None:
+        return
+
+    home_win = 1 if home_score > away_score else 0
+    away_win = 1 if away_score > home_score else 0
+    home_loss, away_loss = away_win, home_win
+
+    for team_id, win, loss, is_home, points_for, points_against in (
+        (home_team_id, home_win, home_loss, True, home_score, away_score),
+        (away_team_id, away_win, away_loss, False, away_score, home_score),
+    ):
+        win_pct = win / (win + loss) if win + loss else 0
+        cursor.execute(TEAM_SUMMARY_UPSERT, (
+            team_id,
+            win,
+            loss,
+            win if is_home else 0,
+            loss if is_home else 0,
+            0 if is_home else win,
+            0 if is_home else loss,
+            points_for,
+            points_against,
+            win_pct,
+        ))
+
+
+def rebuild_team_season_summary(cursor):
+    """Recompute TeamSeasonSummary from the Game table."""
+    for query in TEAM_SUMMARY_REBUILD:
+        cursor.execute(query)
+
+
+
+# ==================== HEAD TO HEAD ====================
+HEAD_TO_HEAD_UPSERT = """
+    INSERT INTO HeadToHead
+        (TeamID, OpponentID, Wins, Losses, PointsFor, PointsAgainst, GamesPlayed)
+    VALUES (%s, %s, %s, %s, %s, %s, 1) AS new
+    ON DUPLICATE KEY UPDATE
+        Wins = HeadToHead.Wins + new.Wins,
+        Losses = HeadToHead.Losses + new.Losses,
+        PointsFor = HeadToHead.PointsFor + new.PointsFor,
+        PointsAgainst = HeadToHead.PointsAgainst + new.PointsAgainst,
+        GamesPlayed = HeadToHead.GamesPlayed + 1
+"""
+
+# One row per ordered team pair that has played a scored game
+HEAD_TO_HEAD_REBUILD = [
+    "DELETE FROM HeadToHead",
+    """
+    INSERT INTO HeadToHead
+        (TeamID, OpponentID, Wins, Losses, PointsFor, PointsAgainst, GamesPlayed)
+    SELECT
+        r.TeamID,
+        r.OpponentID,
+        SUM(r.Win),
+        SUM(r.Loss),
+        SUM(r.PointsFor),
+        SUM(r.PointsAgainst),
+        COUNT(*)
+    FROM (
+        SELECT HomeTeamID AS TeamID, AwayTeamID AS OpponentID,
+               IF(HomeTeamScore > AwayTeamScore, 1, 0) AS Win,
+               IF(HomeTeamScore < AwayTeamScore, 1, 0) AS Loss,
+               HomeTeamScore AS PointsFor, AwayTeamScore AS PointsAgainst
+        FROM Game
+        WHERE HomeTeamScore IS NOT NULL AND AwayTeamScore IS NOT NULL
+        UNION ALL
+        SELECT AwayTeamID AS TeamID, HomeTeamID AS OpponentID,
+               IF(AwayTeamScore > HomeTeamScore, 1, 0) AS Win,
+               IF(AwayTeamScore < HomeTeamScore, 1, 0) AS Loss,
+               AwayTeamScore AS PointsFor, HomeTeamScore AS PointsAgainst
+        FROM Game
+        WHERE HomeTeamScore IS NOT NULL AND AwayTeamScore IS NOT NULL
+    ) r
+    GROUP BY r.TeamID, r.OpponentID
+    """,
+]
+
+
+def apply_game_to_head_to_head(cursor, home_team_id, away_team_id, home_score, away_score):
+    """Add one finished game to the HeadToHead rows of both ordered pairs.
+    Games without both scores have no result yet and are skipped."""
+    if home_score is None or away_score is None:
+        return
+
+    home_win = 1 if home_score > away_score else 0
+    away_win = 1 if away_score > home_score else 0
+
+    for team_id, opponent_id, win, loss, points_for, points_against in (
+        (home_team_id, away_team_id, home_win, away_win, home_score, away_score),
+        (away_team_id, home_team_id, away_win, home_win, away_score, home_score),
+    ):
+        cursor.execute(HEAD_TO_HEAD_UPSERT, (
+            team_id,
+            opponent_id,
+            win,
+            loss,
+            points_for,
+            points_against,
+        ))
+
+
+def rebuild_head_to_head(cursor):
+    """Recompute HeadToHead from the Game table."""
+    for query in HEAD_TO_HEAD_REBUILD:
+        cursor.execute(query)
+
+# ==================== PLAYER SEASON TOTALS ====================
+PLAYER_TOTALS_UPSERT = """
+    INSERT INTO PlayerSeasonTotals
+        (PlayerID, GamesPlayed, Points, Rebounds, Assists, Steals, Blocks,
+         Turnovers, Fouls, Minutes)
+    VALUES (%s, 1, %s, %s, %s, %s, %s, %s, %s, %s) AS new
+    ON DUPLICATE KEY UPDATE
+        GamesPlayed = PlayerSeasonTotals.GamesPlayed + 1,
+        Points = PlayerSeasonTotals.Points + new.Points,
+        Rebounds = PlayerSeasonTotals.Rebounds + new.Rebounds,
+        Assists = PlayerSeasonTotals.Assists + new.Assists,
+        Steals = PlayerSeasonTotals.Steals + new.Steals,
+        Blocks = PlayerSeasonTotals.Blocks + new.Blocks,
+        Turnovers = PlayerSeasonTotals.Turnovers + new.Turnovers,
+        Fouls = PlayerSeasonTotals.Fouls + new.Fouls,
+        Minutes = PlayerSeasonTotals.Minutes + new.Minutes
+"""
+
+PLAYER_TOTALS_REBUILD = [
+    "DELETE FROM PlayerSeasonTotals",
+    """
+    INSERT INTO PlayerSeasonTotals
+        (PlayerID, GamesPlayed, Points, Rebounds, Assists, Steals, Blocks,
+         Turnovers, Fouls, Minutes)
+    SELECT
+        PlayerID,
+        COUNT(*),
+        COALESCE(SUM(Points), 0),
+        COALESCE(SUM(Rebounds), 0),
+        COALESCE(SUM(Assists), 0),
+        COALESCE(SUM(Steals), 0),
+        COALESCE(SUM(Blocks), 0),
+        COALESCE(SUM(Turnovers), 0),
+        COALESCE(SUM(Fouls), 0),
+        COALESCE(SUM(Minutes), 0)
+    FROM PlayerGameStats
+    GROUP BY PlayerID
+    """,
+]
+
+
+def apply_stats_to_player_totals(cursor, player_id, points, rebounds, assists,
+                                 steals, blocks, turnovers, fouls, minutes):
+    """Add one PlayerGameStats line to the player's PlayerSeasonTotals row.
+    Arguments follow the PlayerGameStats insert column order."""
+    cursor.execute(PLAYER_TOTALS_UPSERT, (
+        player_id,
+        points or 0,
+        rebounds or 0,
+        assists or 0,
+        steals or 0,
+        blocks or 0,
+        turnovers or 0,
+        fouls or 0,
+        minutes or 0,
+    ))
+
+
+def rebuild_player_season_totals(cursor):
+    """Recompute PlayerSeasonTotals from the PlayerGameStats table."""
+    for query in PLAYER_TOTALS_REBUILD:
+        cursor.execute(query)
+
+
+# ==================== PLAYER OPPONENT SPLITS ====================
+PLAYER_SPLIT_UPSERT = """
+    INSERT INTO PlayerOpponentSplit
+        (PlayerID, OpponentTeamID, GamesPlayed, Points, Rebounds, Assists,
+         Steals, Blocks, Turnovers, Fouls, Minutes)
+    VALUES (%s, %s, 1, %s, %s, %s, %s, %s, %s, %s, %s) AS new
+    ON DUPLICATE KEY UPDATE
+        GamesPlayed = PlayerOpponentSplit.GamesPlayed + 1,
+        Points = PlayerOpponentSplit.Points + new.Points,
+        Rebounds = PlayerOpponentSplit.Rebounds + new.Rebounds,
+        Assists = PlayerOpponentSplit.Assists + new.Assists,
+        Steals = PlayerOpponentSplit.Steals + new.Steals,
+        Blocks = PlayerOpponentSplit.Blocks + new.Blocks,
+        Turnovers = PlayerOpponentSplit.Turnovers + new.Turnovers,
+        Fouls = PlayerOpponentSplit.Fouls + new.Fouls,
+        Minutes = PlayerOpponentSplit.Minutes + new.Minutes
+"""
+
+# The opponent is whichever side of the game the player's TeamID was not;
+# stat lines without a TeamID are skipped
+PLAYER_SPLIT_REBUILD = [
+    "DELETE FROM PlayerOpponentSplit",
+    """
+    INSERT INTO PlayerOpponentSplit
+        (PlayerID, OpponentTeamID, GamesPlayed, Points, Rebounds, Assists,
+         Steals, Blocks, Turnovers, Fouls, Minutes)
+    SELECT
+        s.PlayerID,
+        IF(g.HomeTeamID = s.TeamID, g.AwayTeamID, g.HomeTeamID) AS OpponentTeamID,
+        COUNT(*),
+        COALESCE(SUM(s.Points), 0),
+        COALESCE(SUM(s.Rebounds), 0),
+        COALESCE(SUM(s.Assists), 0),
+        COALESCE(SUM(s.Steals), 0),
+        COALESCE(SUM(s.Blocks), 0),
+        COALESCE(SUM(s.Turnovers), 0),
+        COALESCE(SUM(s.Fouls), 0),
+        COALESCE(SUM(s.Minutes), 0)
+    FROM PlayerGameStats s
+    INNER JOIN Game g
+        ON s.GameID = g.GameID
+    WHERE s.TeamID IN (g.HomeTeamID, g.AwayTeamID)
+    GROUP BY s.PlayerID, OpponentTeamID
+    """,
+]
+
+
+def matchup_opponent(matchup):
+    """Return the opponent abbreviation from an API MATCHUP value
+    ("LAL vs. GSW" or "LAL @ GSW" -> "GSW")."""
+    return str(matchup).split()[-1].strip()
+
+
+def apply_stats_to_opponent_split(cursor, player_id, opponent_team_id, points, rebounds,
+                                  assists, steals, blocks, turnovers, fouls, minutes):
+    """Add one PlayerGameStats line to the player's row against that opponent.
+    Stat arguments follow the PlayerGameStats insert column order."""
+    cursor.execute(PLAYER_SPLIT_UPSERT, (
+        player_id,
+        opponent_team_id,
+        points or 0,
+        rebounds or 0,
+        assists or 0,
+        steals or 0,
+        blocks or 0,
+        turnovers or 0,
+        fouls or 0,
+        minutes or 0,
+    ))
+
+
+def rebuild_player_opponent_splits(cursor):
+    """Recompute PlayerOpponentSplit from PlayerGameStats and Game."""
+    for query in PLAYER_SPLIT_REBUILD:
+        cursor.execute(query)
+
+
+# ==================== PLAYER MATCHUPS ====================
+# Every ordered pair of players on opposite teams in one game
+PLAYER_MATCHUP_INSERT = """
+    INSERT IGNORE INTO PlayerMatchup (PlayerID, OpponentPlayerID, GameID)
+    SELECT a.PlayerID, b.PlayerID, a.GameID
+    FROM PlayerGameStats a
+    INNER JOIN PlayerGameStats b
+        ON b.GameID = a.GameID AND b.TeamID != a.TeamID
+    WHERE a.GameID = %s
+"""
+
+PLAYER_MATCHUP_REBUILD = [
+    "DELETE FROM PlayerMatchup",
+    """
+    INSERT INTO PlayerMatchup (PlayerID, OpponentPlayerID, GameID)
+    SELECT a.PlayerID, b.PlayerID, a.GameID
+    FROM PlayerGameStats a
+    INNER JOIN PlayerGameStats b
+        ON b.GameID = a.GameID AND b.TeamID != a.TeamID
+    """,
+]
+
+
+def apply_game_to_player_matchups(cursor, game_id):
+    """Record every opposing pair of players in one game, in both orders.
+    Call after the game's PlayerGameStats rows (with TeamID) are inserted;
+    pairs already indexed are left alone."""
+    cursor.execute(PLAYER_MATCHUP_INSERT, (game_id,))
+
+
+def rebuild_player_matchups(cursor):
+    """Recompute PlayerMatchup from PlayerGameStats."""
+    for query in PLAYER_MATCHUP_REBUILD:
+        cursor.execute(query)
@@ -0,0 +1,87 @@
+"""
+Query Path Micro-Benchmark
+--------------------------
+Times get_all_players and get_boxscore on the old fetch path (text
+protocol, a fresh cursor per call, generic type conversion) against the
+current one (prepared statements cached per pooled connection, and raw
+fetch with per-column conversion for get_all_players).
+The result cache is off, so every call goes to MySQL.
+
+Usage:
+python benchmark_queries.py [iterations] [game_id]
+"""
+
+import statistics
+import sys
+import time
+
+from db_operations import db_operations
+
+
+class LegacyPathOperations(db_operations):
+    # the read path before prepared statements and raw fetch. types is
+    # ignored (no raw fetch); width reads still return one list per column,
+    # transposed from the fetched rows as the columnar mode used to do.
+    def _run_select(self, query, params=None, types=None, width=None):
+        with self._get_pool().connection() as connection:
+            cursor = connection.cursor()
+            try:
+                cursor.execute(query, params)
+                rows = cursor.fetchall()
+            finally:
+                cursor.close()
+        if width:
+            return [list(column) for column in zip(*rows)] if rows else [[] for _ in range(width)]
+        return rows
+
+
+# ==================== CONFIGURATION ====================
+ITERATIONS = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+WARMUP = 5
+
+legacy = LegacyPathOperations(use_cache=False)
+current = db_operations(use_cache=False)
+
+if len(sys.argv) > 2:
+    GAME_ID = int(sys.argv[2])
+else:
+    GAME_ID = current._fetchone("SELECT MAX(GameID) FROM PlayerGameStats;")[0]
+
+
+def time_calls(fn, iterations):
+    for _ in range(WARMUP):
+        fn()
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        "median": statistics.median(samples),
+        "p95": samples[int(len(samples) * 0.95) - 1],
+        "rows": len(fn()),
+    }
+
+
+# ==================== RUN ====================
+print("=" * 72)
+print(f"Query path benchmark - {ITERATIONS} iterations, boxscore GameID {GAME_ID}")
+print("=" * 72)
+
+cases = [
+    ("get_all_players", lambda db: db.get_all_players()),
+    ("get_boxscore", lambda db: db.get_boxscore(GAME_ID)),
+]
+
+for name, call in cases:
+    old = time_calls(lambda: call(legacy), ITERATIONS)
+    new = time_calls(lambda: call(current), ITERATIONS)
+    speedup = old["median"] / new["median"] if new["median"] else float("inf")
+    print(f"\n{name} ({new['rows']} rows)")
+    print(f"  legacy : median {old['median']:8.3f} ms   p95 {old['p95']:8.3f} ms")
+    print(f"  current: median {new['median']:8.3f} ms   p95 {new['p95']:8.3f} ms")
+    print(f"  speedup: {speedup:.2f}x")
+
+# ==================== CLEANUP ====================
+current._get_pool().close_all()
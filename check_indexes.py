@@ -0,0 +1,186 @@
+"""
+Index Coverage Check
+--------------------
+Calls every db_operations read method (get_* and stream_*) against the
+MySQL database in [db] secrets, captures each SELECT it sends, and runs
+EXPLAIN on it. A query fails the check when any step of its plan reads a
+whole table or index (type ALL / index) or sorts with a filesort over more
+than MAX_ROWS estimated rows. Exits with code 1 on any failure, so new
+queries cannot drop off the indexes unnoticed.
+
+Sample arguments (a game, a player, a pair of opponents, ...) are read
+from the database, so seed it with at least a season of data first:
+  mysql < HoopHubSchema.sql, load the HoopHub_Dump.sql data, then
+  python migrate.py
+A read method with a parameter SAMPLES does not know also fails the
+check; add a sample for it.
+
+Usage:
+python check_indexes.py [max_rows]
+"""
+
+import inspect
+import sys
+
+from db_operations import db_operations
+
+# ==================== CONFIGURATION ====================
+MAX_ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+FULL_SCAN_TYPES = ("ALL", "index")
+
+
+class CapturingOperations(db_operations):
+    def __init__(self):
+        super().__init__(use_cache=False)
+        self.replica = None     # the plans have to come from MySQL
+        self.method = None
+        self.captured = []
+
+    def _run_select(self, query, params=None, types=None, width=None):
+        self.captured.append((self.method, query, params))
+        return super()._run_select(query, params, types, width)
+
+    # streams are only captured, never started
+    def _stream(self, query, params=None, batch_size=None):
+        self.captured.append((self.method, query, params))
+        return iter(())
+
+
+db = CapturingOperations()
+
+
+# function returns {parameter name: sample value} read from the seeded data
+def load_samples():
+    game_id, game_date = db._fetchone("""
+        SELECT s.GameID, g.Date
+        FROM PlayerGameStats s
+        INNER JOIN Game g ON s.GameID = g.GameID
+        ORDER BY s.GameID DESC
+        LIMIT 1;
+    """)
+    player1_id, player2_id = db._fetchone("""
+        SELECT PlayerID, OpponentPlayerID
+        FROM PlayerMatchup
+        ORDER BY GameID DESC
+        LIMIT 1;
+    """)
+    player1_name, team_id, team_name, conference, division = db._fetchone("""
+        SELECT p.FullName, t.TeamID, t.Name, t.Conference, t.Division
+        FROM Player p
+        INNER JOIN Team t ON p.TeamID = t.TeamID
+        WHERE p.PlayerID = %s;
+    """, (player1_id,))
+    player2_name, opponent_name = db._fetchone("""
+        SELECT p.FullName, t.Name
+        FROM Player p
+        INNER JOIN Team t ON p.TeamID = t.TeamID
+        WHERE p.PlayerID = %s;
+    """, (player2_id,))
+    return {
+        "game_id": game_id,
+        "date": game_date.date(),
+        "team_id": team_id,
+        "team_name": team_name,
+        "opponent_name": opponent_name,
+        "conference": conference,
+        "division": division,
+        "player_id": player1_id,
+        "player_name": player1_name,
+        "player1_id": player1_id,
+        "player2_id": player2_id,
+        "player1_name": player1_name,
+        "player2_name": player2_name,
+    }
+
+
+# function calls one read method with sample arguments. Paged methods are
+# called again with the first page's key so the seek query is covered too.
+def exercise(name, samples):
+    method = getattr(db, name)
+    kwargs = {}
+    for param in inspect.signature(method).parameters.values():
+        if param.default is not inspect.Parameter.empty:
+            continue
+        if param.name not in samples:
+            raise KeyError(f"no sample value for parameter '{param.name}'")
+        kwargs[param.name] = samples[param.name]
+
+    db.method = name
+    result = method(**kwargs)
+    if "after" in inspect.signature(method).parameters:
+        _, next_key = result
+        if next_key is not None:
+            method(**kwargs, after=next_key)
+
+
+# function returns the plan steps that break the rules, as text
+def plan_problems(query, params):
+    problems = []
+    with db._get_pool().connection() as connection:
+        cursor = connection.cursor(dictionary=True)
+        try:
+            cursor.execute("EXPLAIN " + query, params)
+            plan = cursor.fetchall()
+        finally:
+            cursor.close()
+    for step in plan:
+        rows = step.get("rows") or 0
+        extra = step.get("Extra") or ""
+        if rows <= MAX_ROWS:
+            continue
+        if step.get("type") in FULL_SCAN_TYPES:
+            problems.append(f"full scan of {step.get('table')} (type {step.get('type')}, ~{rows} rows)")
+        if "Using filesort" in extra:
+            problems.append(f"filesort on {step.get('table')} (~{rows} rows)")
+    return problems
+
+
+# ==================== RUN ====================
+print("=" * 72)
+print(f"Index coverage check - fail above {MAX_ROWS} rows")
+print("=" * 72)
+
+samples = load_samples()
+methods = sorted(
+    name for name, _ in inspect.getmembers(db_operations, inspect.isfunction)
+    if name.startswith(("get_", "stream_"))
+)
+
+failures = 0
+for name in methods:
+    db.captured.clear()
+    try:
+        exercise(name, samples)
+    except Exception as e:
+        print(f"✗ {name}: could not run ({type(e).__name__}: {e})")
+        failures += 1
+        continue
+
+    seen = set()
+    problems = []
+    for _, query, params in db.captured:
+        key = (query, repr(params))
+        if key in seen:
+            continue
+        seen.add(key)
+        for problem in plan_problems(query, params):
+            problems.append((problem, " ".join(query.split())))
+
+    if problems:
+        failures += 1
+        print(f"✗ {name}")
+        for problem, sql in problems:
+            print(f"    {problem}")
+            print(f"    SQL: {sql[:160]}")
+    else:
+        print(f"✓ {name} ({len(seen)} quer{'y' if len(seen) == 1 else 'ies'})")
+
+print("-" * 72)
+if failures:
+    print(f"🚨 {failures} method(s) failed the index check")
+else:
+    print(f"✓ All {len(methods)} read methods stay on indexes")
+
+# ==================== CLEANUP ====================
+db._get_pool().close_all()
+sys.exit(1 if failures else 0)
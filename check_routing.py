@@ -0,0 +1,39 @@
+"""
+Read/Write Routing Check
+------------------------
+Shows which MySQL server db_operations reads from before and after a
+write. Point [db] and [db.replica] in secrets at two local MySQL
+instances (e.g. ports 3306 and 3307) and run:
+
+python check_routing.py
+
+Expected: reads go to the replica, the write goes to the primary, reads
+right after it go to the primary, and after READ_YOUR_WRITES_SECONDS
+they return to the replica.
+"""
+
+import time
+
+from db_operations import db_operations, READ_YOUR_WRITES_SECONDS
+
+ENDPOINT_QUERY = "SELECT @@hostname, @@port;"
+
+db = db_operations(use_cache=False)
+
+
+def show(step):
+    host, port = db._fetchone(ENDPOINT_QUERY)
+    print(f"{step:<32} read from {host}:{port}")
+
+
+# ==================== RUN ====================
+show("Before write")
+
+# an empty write only bumps DataVersion, on the primary
+db._write([])
+print(f"{'Write':<32} sent to primary")
+
+show("Right after write")
+
+time.sleep(READ_YOUR_WRITES_SECONDS + 0.5)
+show(f"{READ_YOUR_WRITES_SECONDS}s after write")
@@ -1,80 +1,568 @@
 import mysql.connector
+import numpy as np
+import pandas as pd
 from helper import helper
 import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+import csv
+import datetime
+import io
+import json
+import sqlite3
+import sys
+import time
+from dataclasses import dataclass
+from zoneinfo import ZoneInfo
+from db_pool import get_executor, get_pool, get_read_pool
+from query_cache import get_result_cache, get_single_flight, read_through
+from query_stats import get_query_stats
+from read_replica import get_replica
+
+# timezone "today" and "yesterday" are measured in; matches the ingest scripts
+TIMEZONE = ZoneInfo("America/Los_Angeles")
+# seconds a session keeps reading from the primary after it wrote, so it
+# sees its own changes even while the MySQL replica is catching up
+READ_YOUR_WRITES_SECONDS = 5
+_PRIMARY_UNTIL_KEY = "db_read_primary_until"
+# rows per keyset page, and rows pulled per round trip when streaming
+DEFAULT_PAGE_SIZE = 50
+STREAM_BATCH_SIZE = 500
+
+
+# function returns today's date in the app's timezone (not the DB server's)
+def app_today():
+    return datetime.datetime.now(TIMEZONE).date()
+
+
+# function turns a date (or "YYYY-MM-DD" string) into the half-open range
+# [day 00:00, next day 00:00) so date lookups can use the Game(Date) index
+# instead of wrapping the column in DATE()
+def day_bounds(day):
+    if isinstance(day, str):
+        day = datetime.date.fromisoformat(day)
+    elif isinstance(day, datetime.datetime):
+        day = day.date()
+    start = datetime.datetime.combine(day, datetime.time.min)
+    return start, start + datetime.timedelta(days=1)
+
+
+# converter for raw-fetched text columns (see _run_raw_select)
+def _raw_str(value):
+    return value.decode("utf-8")
+
+
+# column converters for get_all_players: PlayerID, Name, Team, Position,
+# then the seven per-game averages
+ALL_PLAYERS_TYPES = (int, _raw_str, _raw_str, _raw_str) + (float,) * 7
+
+
+# column specs for the columnar fetch modes: (name, dtype) per selected
+# column. Repeated labels are categoricals; counting stats are small ints.
+ALL_PLAYERS_COLUMNS = [
+    ("PlayerID", "int32"), ("Name", "object"), ("Team", "category"), ("Position", "category"),
+    ("Points", "float64"), ("Rebounds", "float64"), ("Assists", "float64"), ("Blocks", "float64"),
+    ("Steals", "float64"), ("Turnovers", "float64"), ("Fouls", "float64"),
+]
+BOXSCORE_COLUMNS = [
+    ("Team", "category"), ("Player", "object"), ("Minutes", "int16"), ("Points", "int16"),
+    ("Rebounds", "int16"), ("Assists", "int16"), ("Blocks", "int16"), ("Steals", "int16"),
+    ("Turnovers", "int16"), ("Fouls", "int16"),
+]
+STANDINGS_COLUMNS = [
+    ("Team", "object"), ("Wins", "int16"), ("Losses", "int16"), ("WinPercentage", "float64"),
+]
+PLAYER_SPLIT_COLUMNS = [
+    ("Opponent", "object"), ("GamesPlayed", "int16"), ("Points", "float64"), ("Rebounds", "float64"),
+    ("Assists", "float64"), ("Blocks", "float64"), ("Steals", "float64"), ("Turnovers", "float64"),
+    ("Fouls", "float64"),
+]
+HEAD_TO_HEAD_COLUMNS = [
+    ("Opponent", "object"), ("Wins", "int16"), ("Losses", "int16"), ("GamesPlayed", "int16"),
+    ("PointsFor", "float64"), ("PointsAgainst", "float64"),
+]
+
+
+# function builds one typed column. Integer columns holding NULLs become
+# pandas nullable ints ("Int16") in a DataFrame and float NaN in NumPy.
+def _column(values, dtype, as_numpy):
+    if dtype == "category":
+        return np.asarray(values, dtype=object) if as_numpy else pd.Categorical(values)
+    if dtype != "object" and np.dtype(dtype).kind in "iu" and None in values:
+        if as_numpy:
+            return np.array([np.nan if v is None else v for v in values], dtype="float64")
+        return pd.array(values, dtype=dtype.capitalize())
+    return np.asarray(values, dtype=dtype)
+
+
+# function raises for a fetch_mode other than "rows", "frame" or "numpy"
+def _check_fetch_mode(fetch_mode):
+    if fetch_mode not in ("rows", "frame", "numpy"):
+        raise ValueError(f"Unknown fetch_mode {fetch_mode!r}; use 'rows', 'frame' or 'numpy'")
+
+
+# function turns per-column value lists (see _read_columns) into typed
+# columns: "frame" returns a DataFrame, "numpy" a dict of NumPy arrays
+def _columnar(values, columns, fetch_mode):
+    as_numpy = fetch_mode == "numpy"
+    data = {name: _column(col, dtype, as_numpy) for (name, dtype), col in zip(columns, values)}
+    return data if as_numpy else pd.DataFrame(data, copy=False)
+
+
+# function drains a cursor into one list per column, batch_size rows per
+# fetchmany, so the full list of row tuples is never built
+def _read_columns(cursor, width, batch_size=STREAM_BATCH_SIZE):
+    values = [[] for _ in range(width)]
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            return values
+        for column, batch in zip(values, zip(*rows)):
+            column.extend(batch)
+
+
+# everything the Teams detail view shows for one team, fetched together
+# by db_operations.get_team_dashboard. Each section keeps the row shape of
+# the single-section method it replaces (get_team_bio, get_team_record, ...).
+@dataclass(frozen=True)
+class TeamDashboard:
+    team_id: int
+    bio: tuple               # (Name, Abbreviation, City, State, Conference, Division, Coach, Venue)
+    record: tuple | None     # (Wins, Losses); None before the first game
+    home_record: tuple | None
+    away_record: tuple | None
+    scores: tuple | None     # (PPG, OppPPG)
+    roster: list             # [(PlayerName, Age, Position, JerseyNumber)] by name
+    recent_games: list       # [(GameDate, HomeTeam, AwayTeam, HomeScore, AwayScore)] newest first
+
+
+# function turns a JSON_ARRAYAGG column into a Python list ([] for NULL)
+def _json_rows(value):
+    if value is None:
+        return []
+    return json.loads(value)
+
+
+# internal helpers that sit between a public method and the cursor; the
+# query instrumentation skips them when naming the calling method
+_QUERY_HELPERS = {"_fetchall", "_fetchone", "_fetch_columns", "_fetch_columnar", "_execute_select",
+                  "_run_select", "_run_select_on", "_run_prepared_select", "_run_raw_select",
+                  "_write", "_run_write"}
+
+
+# function returns the current Streamlit session state, or None outside a
+# script run (ingest scripts, benchmarks, fetch_many worker threads)
+def _session_state():
+    try:
+        if get_script_run_ctx() is None:
+            return None
+        return st.session_state
+    except Exception:
+        return None
+
+
+# function splits a keyset page fetched with limit + 1 rows into the rows
+# to show and the key to continue from (None on the last page). The last
+# key_width columns of each row are the sort key and are not returned.
+def _keyset_page(rows, limit, key_width):
+    next_key = tuple(rows[limit - 1][-key_width:]) if len(rows) > limit else None
+    return [row[:-key_width] for row in rows[:limit]], next_key
+
+
+# function turns rows into CSV text one line at a time, header first,
+# so an export never holds the whole file in memory
+def csv_lines(header, rows):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(header)
+        yield buffer.getvalue()
+    for row in rows:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerow(row)
+        yield buffer.getvalue()
+
+
+# function walks up the call stack to the db_operations method that issued
+# the current query. Only called while query stats are enabled.
+def _calling_method():
+    frame = sys._getframe(2)
+    methods = vars(db_operations)
+    while frame is not None:
+        name = frame.f_code.co_name
+        if name in methods and name not in _QUERY_HELPERS:
+            return name
+        frame = frame.f_back
+    return "<unknown>"
 
-class db_operations():
-    # constructor with MySQL connection parameters (matches connector.py)
-    # You can either pass your own connection or use default parameters
-    import mysql.connector
-import streamlit as st
 
 class db_operations():
-    def __init__(self):
-        # Load DB credentials from Streamlit secrets
-        cfg = st.secrets["db"]
-
-        self.connection = mysql.connector.connect(
-            host=cfg["host"],
-            port=int(cfg["port"]),   # port is often stored as a string in secrets
-            user=cfg["user"],
-            password=cfg["password"],
-            database=cfg["database"],
-            # Remove ssl_mode – mysql.connector doesn't support that kwarg
-            # If Aiven later requires cert-based SSL, we can add ssl_ca here.
-        )
-        self.cursor = self.connection.cursor()
-        print("connection made...")
+    # constructor no longer opens its own connection. Every query borrows
+    # a connection from the process-wide pool in db_pool and returns it
+    # right after, so one instance is safe to share between threads.
+    def __init__(self, use_cache=True):
+        # writes always use the primary pool; reads use read_pool, which is
+        # the [db.replica] endpoint when one is configured (see db_pool.py)
+        self.pool = None
+        self.read_pool = None
+        # reads go to the primary until this time (time.monotonic) because
+        # this session wrote recently; carried across reruns in session state
+        session = _session_state()
+        self.primary_until = session.get(_PRIMARY_UNTIL_KEY, 0.0) if session is not None else 0.0
+        # read methods are served from the shared result cache until a
+        # write bumps the data version (see query_cache.py)
+        self.result_cache = get_result_cache() if use_cache else None
+        # per-method latency and row counts; a no-op unless enabled
+        # in secrets (see query_stats.py)
+        self.query_stats = get_query_stats()
+        # optional local SQLite copy that serves reads (see read_replica.py)
+        self.replica = get_replica()
+
+    def _get_pool(self):
+        # pool is created lazily on the first query, not at page import
+        if self.pool is None:
+            self.pool = get_pool()
+        return self.pool
+
+    # function returns the pool reads should use right now
+    def _get_read_pool(self):
+        if self._reads_use_primary():
+            return self._get_pool()
+        if self.read_pool is None:
+            self.read_pool = get_read_pool()
+        return self.read_pool
+
+    # function is True while this session is inside its read-your-writes window
+    def _reads_use_primary(self):
+        return self.primary_until > time.monotonic()
+
+    # function sends this session's reads to the primary for a while
+    # after it wrote
+    def _pin_reads_to_primary(self):
+        self.primary_until = time.monotonic() + READ_YOUR_WRITES_SECONDS
+        session = _session_state()
+        if session is not None:
+            session[_PRIMARY_UNTIL_KEY] = self.primary_until
+
+    # function returns the result cache to use for this read. Reads in the
+    # read-your-writes window skip it: a shared entry may have been filled
+    # from a replica that has not caught up with this session's write.
+    def _active_result_cache(self):
+        if self._reads_use_primary():
+            return None
+        return self.result_cache
+
+    # function runs one read query and returns every row. Identical
+    # queries (same SQL and parameters) already running in another thread
+    # are joined instead of being sent to MySQL a second time.
+    # types switches to the raw fetch path (see _run_raw_select); width
+    # returns width lists of column values instead of rows (see _fetch_columns).
+    def _fetchall(self, query, params=None, types=None, width=None):
+        key = (query, tuple(sorted(params.items())) if isinstance(params, dict) else params, types,
+               width, self._reads_use_primary())
+        try:
+            hash(key)
+        except TypeError:
+            return self._execute_select(query, params, types, width)
+        return get_single_flight().do(key, lambda: self._execute_select(query, params, types, width))
+
+    # function runs one read query and returns its values as one list per
+    # column, read straight off the cursor (see _read_columns)
+    def _fetch_columns(self, query, params, width):
+        return self._fetchall(query, params, width=width)
+
+    # function runs the read of a fetch_mode method: "rows" returns the rows,
+    # "frame" / "numpy" the typed columns, built without the row list
+    def _fetch_columnar(self, query, params, columns, fetch_mode):
+        _check_fetch_mode(fetch_mode)
+        if fetch_mode == "rows":
+            return self._fetchall(query, params)
+        return _columnar(self._fetch_columns(query, params, len(columns)), columns, fetch_mode)
+
+    # function runs one read query on a pooled connection
+    def _execute_select(self, query, params=None, types=None, width=None):
+        if self.query_stats.enabled:
+            with self.query_stats.timed(_calling_method(), query, params) as sample:
+                rows = self._run_select(query, params, types, width)
+                sample["rows"] = len(rows[0]) if width else len(rows)
+                return rows
+        return self._run_select(query, params, types, width)
+
+    # function picks where a read runs. With the read replica enabled and
+    # synced it is answered locally (values come back already typed); a
+    # query the replica cannot run falls through to MySQL. On MySQL the read
+    # goes to the read pool, or to the primary if the replica endpoint
+    # cannot be reached. There:
+    #  - types given: text protocol with raw fetch, converted per column
+    #  - positional params: a server-side prepared statement, cached per
+    #    pooled connection, so MySQL parses each SQL text once per session
+    #  - anything else (no or named params): a plain one-off cursor
+    def _run_select(self, query, params=None, types=None, width=None):
+        if self.replica is not None:
+            self.replica.refresh(self._get_pool())
+            if self.replica.ready:
+                try:
+                    if width:
+                        return self.replica.select_columns(query, params, width)
+                    return self.replica.select(query, params)
+                except sqlite3.Error:
+                    pass
+        pool = self._get_read_pool()
+        try:
+            return self._run_select_on(pool, query, params, types, width)
+        except (mysql.connector.errors.OperationalError,
+                mysql.connector.errors.InterfaceError,
+                mysql.connector.errors.PoolError):
+            if pool is self._get_pool():
+                raise
+            return self._run_select_on(self._get_pool(), query, params, types, width)
+
+    def _run_select_on(self, pool, query, params, types, width=None):
+        with pool.connection() as connection:
+            if types is not None:
+                return self._run_raw_select(connection, query, params, types)
+            if isinstance(params, (tuple, list)):
+                return self._run_prepared_select(pool, connection, query, params, width)
+            cursor = connection.cursor()
+            try:
+                cursor.execute(query, params)
+                return _read_columns(cursor, width) if width else cursor.fetchall()
+            finally:
+                cursor.close()
+
+    @staticmethod
+    def _run_prepared_select(pool, connection, query, params, width=None):
+        statements = pool.statements(connection)
+        cursor = statements.cursor(query)
+        try:
+            cursor.execute(query, params)
+            return _read_columns(cursor, width) if width else cursor.fetchall()
+        except Exception:
+            # a statement that failed part way is not reused
+            statements.discard(query)
+            raise
+
+    # function fetches rows as raw bytes (no per-value type inspection by
+    # the connector) and converts only the columns the caller uses.
+    # types has one entry per column: a converter such as int, float or
+    # _raw_str, or None to leave the column as bytes.
+    @staticmethod
+    def _run_raw_select(connection, query, params, types):
+        cursor = connection.cursor(raw=True)
+        try:
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
+        converters = [(i, convert) for i, convert in enumerate(types) if convert is not None]
+        converted = []
+        for row in rows:
+            row = list(row)
+            for i, convert in converters:
+                if row[i] is not None:
+                    row[i] = convert(row[i])
+            converted.append(tuple(row))
+        return converted
+
+    # function runs one read query on a pooled connection and returns
+    # the first row (or None)
+    def _fetchone(self, query, params=None):
+        rows = self._fetchall(query, params)
+        return rows[0] if rows else None
+
+    # function yields the rows of one read query from an unbuffered cursor,
+    # batch_size rows per round trip, so memory stays flat however large
+    # the result is. Streams always read MySQL (the read pool), never the
+    # local replica. The pooled connection is held until the generator is
+    # exhausted or closed; rows left unread are drained before it is returned.
+    def _stream(self, query, params=None, batch_size=STREAM_BATCH_SIZE):
+        with self._get_read_pool().connection() as connection:
+            cursor = connection.cursor(buffered=False)
+            finished = False
+            try:
+                cursor.execute(query, params)
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        finished = True
+                        return
+                    yield from rows
+            finally:
+                if not finished:
+                    connection.consume_results()
+                cursor.close()
+
+    # function returns the current data version. Every write path bumps it,
+    # which tells the result cache that its entries are stale.
+    def _read_data_version(self):
+        row = self._fetchone("SELECT Version FROM DataVersion WHERE VersionID = 1;")
+        return row[0] if row else 0
+
+    # function runs one or more write statements in a single transaction
+    # on a pooled connection. statements is a list of (query, params) pairs.
+    # The data version is bumped in the same transaction and the local
+    # result cache is dropped once it commits.
+    def _write(self, statements, many=False):
+        with self._get_pool().connection() as connection:
+            cursor = connection.cursor()
+            try:
+                connection.start_transaction()
+                for query, params in statements:
+                    if self.query_stats.enabled:
+                        with self.query_stats.timed(_calling_method(), query, params) as sample:
+                            self._run_write(cursor, query, params, many)
+                            sample["rows"] = max(cursor.rowcount, 0)
+                    else:
+                        self._run_write(cursor, query, params, many)
+                cursor.execute("UPDATE DataVersion SET Version = Version + 1 WHERE VersionID = 1;")
+                connection.commit()
+            except Exception:
+                connection.rollback()
+                raise
+            finally:
+                cursor.close()
+        self._pin_reads_to_primary()
+        self.invalidate_cache()
+
+    @staticmethod
+    def _run_write(cursor, query, params, many):
+        if many:
+            cursor.executemany(query, params)
+        else:
+            cursor.execute(query, params)
+
+    # function runs independent read calls at the same time and returns
+    # their results in the order given, so a page waits for its slowest
+    # query instead of the sum of all of them. calls is a list of
+    # (method, arg, ...) tuples, e.g. [(db.get_player_stats_by_id, 5), ...].
+    # Every call borrows its own pooled connection. Once all calls finish,
+    # the first failed call's exception is raised; with
+    # return_exceptions=True each exception is returned in its call's slot.
+    def fetch_many(self, calls, return_exceptions=False):
+        calls = [(call[0], call[1:]) for call in calls]
+        if len(calls) <= 1:
+            results = []
+            for method, args in calls:
+                try:
+                    results.append(method(*args))
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    results.append(e)
+            return results
+
+        futures = [get_executor().submit(method, *args) for method, args in calls]
+        results = []
+        first_error = None
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(e)
+                if first_error is None:
+                    first_error = e
+        if first_error is not None and not return_exceptions:
+            raise first_error
+        return results
+
+    # function drops every cached read result, e.g. after an ingest
+    # script was run from the Admin page, and makes the read replica
+    # check MySQL for new rows on the next read
+    def invalidate_cache(self):
+        if self.result_cache is not None:
+            self.result_cache.invalidate()
+        if self.replica is not None:
+            self.replica.mark_stale()
+
+    # function brings the read replica up to date now; full=True copies
+    # every table again even if DataVersion has not moved. Returns its status.
+    def sync_replica(self, full=False):
+        if self.replica is None:
+            return {}
+        if full:
+            self.replica.refresh(self._get_pool(), force=True)
+        else:
+            self.replica.mark_stale()
+            self.replica.refresh(self._get_pool())
+        if self.result_cache is not None:
+            self.result_cache.invalidate()
+        return self.replica.status()
+
+    # function returns the read replica's sync state ({} when disabled)
+    def replica_status(self):
+        if self.replica is None:
+            return {}
+        return self.replica.status()
+
+    # function returns hit/miss counters of the shared result cache
+    def cache_stats(self):
+        if self.result_cache is None:
+            return {}
+        return self.result_cache.stats()
+
+    # function returns how many queries were executed and how many
+    # identical concurrent calls were coalesced onto them
+    def single_flight_stats(self):
+        return get_single_flight().stats()
+
+    # function returns per-method query timings (calls, rows, p50/p95/p99)
+    # collected while query stats are enabled, slowest total first
+    def query_timings(self):
+        return self.query_stats.summary()
+
+    # function appends the current query timings to a JSON-lines file
+    # and returns its path
+    def dump_query_timings(self, path=None):
+        return self.query_stats.dump(path)
 
     # function to simply execute a DDL or DML query.
     # commits query, returns no results. 
     # best used for insert/update/delete queries with no parameters
     def modify_query(self, query):
-        self.cursor.execute(query)
-        self.connection.commit()
+        self._write([(query, None)])
 
     # function to simply execute a DDL or DML query with parameters
     # commits query, returns no results. 
     # best used for insert/update/delete queries with named placeholders
     def modify_query_params(self, query, dictionary):
-        self.cursor.execute(query, dictionary)
-        self.connection.commit()
+        self._write([(query, dictionary)])
 
     # function to simply execute a DQL query
     # does not commit, returns results
     # best used for select queries with no parameters
+    @read_through
     def select_query(self, query):
-        result = self.cursor.execute(query)
-        return result.fetchall()
+        return self._fetchall(query)
     
     # function to simply execute a DQL query with parameters
     # does not commit, returns results
     # best used for select queries with named placeholders
+    @read_through
     def select_query_params(self, query, dictionary):
-        result = self.cursor.execute(query, dictionary)
-        return result.fetchall()
+        return self._fetchall(query, dictionary)
 
     # function to return the value of the first row's 
     # first attribute of some select query.
     # best used for querying a single aggregate select 
     # query with no parameters
+    @read_through
     def single_record(self, query):
-        self.cursor.execute(query)
-        return self.cursor.fetchone()[0]
+        return self._fetchone(query)[0]
     
     # function to return the value of the first row's 
     # first attribute of some select query.
     # best used for querying a single aggregate select 
     # query with named placeholders
+    @read_through
     def single_record_params(self, query, dictionary):
-        self.cursor.execute(query, dictionary)
-        return self.cursor.fetchone()[0]
+        return self._fetchone(query, dictionary)[0]
     
     # function to return a single attribute for all records 
     # from some table.
     # best used for select statements with no parameters
+    @read_through
     def single_attribute(self, query):
-        self.cursor.execute(query)
-        results = self.cursor.fetchall()
+        results = self._fetchall(query)
         results = [i[0] for i in results]
         results.remove(None)
         return results
@@ -82,28 +570,34 @@ class db_operations():
     # function to return a single attribute for all records 
     # from some table.
     # best used for select statements with named placeholders
+    @read_through
     def single_attribute_params(self, query, dictionary):
-        self.cursor.execute(query,dictionary)
-        results = self.cursor.fetchall()
+        results = self._fetchall(query, dictionary)
         results = [i[0] for i in results]
         return results
     
     # function for bulk inserting records
     # best used for inserting many records with parameters
     def bulk_insert(self, query, data):
-        self.cursor.executemany(query, data)
-        self.connection.commit()
+        self._write([(query, data)], many=True)
 
-    # destructor that closes connection with DB
+    # connections belong to the shared pool and are returned after every
+    # query, so there is nothing left to close per instance
     def destructor(self):
-        self.cursor.close()
-        self.connection.close()
+        pass
 
     def get_yesterdays_games(self):
         """
         Returns rows as:
         (game_date, home_team, away_team, home_pts, away_pts)
+
+        "Yesterday" is taken from the app timezone, and the date is part of
+        the cache key so the result rolls over at midnight.
         """
+        return self._get_scores_on(app_today() - datetime.timedelta(days=1))
+
+    @read_through
+    def _get_scores_on(self, day):
         query = """
             SELECT 
                 DATE(g.Date) AS game_date,
@@ -116,22 +610,22 @@ class db_operations():
                 ON g.HomeTeamID = ht.TeamID
             INNER JOIN Team at 
                 ON g.AwayTeamID = at.TeamID
-            WHERE DATE(g.Date) = CURDATE() - INTERVAL 1 DAY
+            WHERE g.Date >= %s AND g.Date < %s
             ORDER BY g.Date, home_team;
         """
-        self.cursor.execute(query)
-        return self.cursor.fetchall()
+        return self._fetchall(query, day_bounds(day))
     
+    @read_through
     def get_team_roster(self, team_name):
         query = """
-        SELECT CONCAT(FirstName, ' ', LastName) AS PlayerName, Age, Position, Number AS JerseyNumber
+        SELECT FullName AS PlayerName, Age, Position, Number AS JerseyNumber
         FROM Player
         WHERE TeamID = (SELECT TeamID FROM Team WHERE Name = %s)
         ORDER BY PlayerName;
         """
-        self.cursor.execute(query, (team_name,))
-        return self.cursor.fetchall()
+        return self._fetchall(query, (team_name,))
 
+    @read_through
     def get_team_recent_games(self, team_name):
         query = """
         SELECT DATE(g.Date) AS GameDate, ht.Name AS HomeTeam, at.Name AS AwayTeam, g.HomeTeamScore AS HomeTeamScore, g.AwayTeamScore AS AwayTeamScore
@@ -140,13 +634,14 @@ class db_operations():
             ON g.HomeTeamID = ht.TeamID
         INNER JOIN Team at
             ON g.AwayTeamID = at.TeamID
-        WHERE ht.Name = %s OR at.Name = %s
+        WHERE g.HomeTeamID = (SELECT TeamID FROM Team WHERE Name = %s)
+           OR g.AwayTeamID = (SELECT TeamID FROM Team WHERE Name = %s)
         ORDER BY g.Date DESC
         LIMIT 5;
         """
-        self.cursor.execute(query, (team_name, team_name))
-        return self.cursor.fetchall()
+        return self._fetchall(query, (team_name, team_name))
 
+    @read_through
     def get_team_bio(self, team_name):
         query = """
         SELECT 
@@ -165,80 +660,86 @@ class db_operations():
             ON Team.VenueID = Venue.VenueID
         WHERE Team.Name = %s;
         """
-        self.cursor.execute(query, (team_name,))
-        return self.cursor.fetchone()
+        return self._fetchone(query, (team_name,))
     
+    @read_through
     def get_team_record(self, team_name):
         query = """
             SELECT
                 -- Wins
-                Wins,
+                s.Wins,
 
                 -- Losses
-                Losses
-            FROM vstandings
-            WHERE Name = %s;
-        """
-        
-        # pass same team name 4 times
-        self.cursor.execute(query, (team_name,))
-        return self.cursor.fetchone()
+                s.Losses
+            FROM TeamSeasonSummary s
+            INNER JOIN Team t
+                ON s.TeamID = t.TeamID
+            WHERE t.Name = %s;
+        """
+        return self._fetchone(query, (team_name,))
     
+    @read_through
     def get_team_home_record(self, team_name):
         query = """
             SELECT
-                SUM(IF(Game.HomeTeamScore > Game.AwayTeamScore, 1, 0)) AS HomeWins,
-                SUM(IF(Game.HomeTeamScore < Game.AwayTeamScore, 1, 0)) AS HomeLosses
-            FROM Game
-            WHERE Game.HomeTeamID = (SELECT TeamID FROM Team WHERE Name = %s);
+                s.HomeWins,
+                s.HomeLosses
+            FROM TeamSeasonSummary s
+            INNER JOIN Team t
+                ON s.TeamID = t.TeamID
+            WHERE t.Name = %s;
         """
-        self.cursor.execute(query, (team_name,))
-        return self.cursor.fetchone()
+        return self._fetchone(query, (team_name,))
     
+    @read_through
     def get_team_away_record(self, team_name):
         query = """
             SELECT
-                SUM(IF(Game.AwayTeamScore > Game.HomeTeamScore, 1, 0)) AS AwayWins,
-                SUM(IF(Game.AwayTeamScore < Game.HomeTeamScore, 1, 0)) AS AwayLosses
-            FROM Game
-            WHERE Game.AwayTeamID = (SELECT TeamID FROM Team WHERE Name = %s);
+                s.AwayWins,
+                s.AwayLosses
+            FROM TeamSeasonSummary s
+            INNER JOIN Team t
+                ON s.TeamID = t.TeamID
+            WHERE t.Name = %s;
         """
-        self.cursor.execute(query, (team_name,))
-        return self.cursor.fetchone()
+        return self._fetchone(query, (team_name,))
 
+    @read_through
     def get_head_to_head_record(self, team_name, opponent_name):
         query = """
-            SELECT
-                SUM(
-                    IF(
-                        (Game.HomeTeamID = team1.TeamID AND Game.AwayTeamID = team2.TeamID AND Game.HomeTeamScore > Game.AwayTeamScore)
-                        OR
-                        (Game.AwayTeamID = team1.TeamID AND Game.HomeTeamID = team2.TeamID AND Game.AwayTeamScore > Game.HomeTeamScore),
-                    1, 0)
-                ) AS Wins,
-
-                SUM(
-                    IF(
-                        (Game.HomeTeamID = team1.TeamID AND Game.AwayTeamID = team2.TeamID AND Game.HomeTeamScore < Game.AwayTeamScore)
-                        OR
-                        (Game.AwayTeamID = team1.TeamID AND Game.HomeTeamID = team2.TeamID AND Game.AwayTeamScore < Game.HomeTeamScore),
-                    1, 0)
-                ) AS Losses
-
-            FROM Game
-            INNER JOIN Team team1
-                ON team1.Name = %s 
+            SELECT h.Wins, h.Losses
+            FROM Team team1
             INNER JOIN Team team2
                 ON team2.Name = %s
-            WHERE
-                (Game.HomeTeamID = team1.TeamID AND Game.AwayTeamID = team2.TeamID)
-            OR
-                (Game.HomeTeamID = team2.TeamID AND Game.AwayTeamID = team1.TeamID);
+            INNER JOIN HeadToHead h
+                ON h.TeamID = team1.TeamID AND h.OpponentID = team2.TeamID
+            WHERE team1.Name = %s;
         """
 
-        self.cursor.execute(query, (team_name, opponent_name))
-        return self.cursor.fetchone()
-    
+        return self._fetchone(query, (opponent_name, team_name))
+
+    # function returns the team's record against every other team in one
+    # primary-key range read of HeadToHead, A-Z by opponent. Opponents not
+    # played yet come back with zeros.
+    @read_through
+    def get_head_to_head(self, team_id, fetch_mode="rows"):
+        query = """
+            SELECT
+                o.Name,
+                COALESCE(h.Wins, 0),
+                COALESCE(h.Losses, 0),
+                COALESCE(h.GamesPlayed, 0),
+                h.PointsFor / NULLIF(h.GamesPlayed, 0),
+                h.PointsAgainst / NULLIF(h.GamesPlayed, 0)
+            FROM Team o
+            LEFT JOIN HeadToHead h
+                ON h.TeamID = %s AND h.OpponentID = o.TeamID
+            WHERE o.TeamID != 31 AND o.TeamID != %s
+            ORDER BY o.Name ASC;
+        """
+        return self._fetch_columnar(query, (team_id, team_id), HEAD_TO_HEAD_COLUMNS, fetch_mode)
+
+    @read_through
     def get_all_teams(self, team_name = ""):
         query = """
         SELECT Name
@@ -246,33 +747,115 @@ class db_operations():
         WHERE Team.TeamID != 31 AND Team.Name != %s
         ORDER BY Team.Name ASC;
         """
-        self.cursor.execute(query, (team_name,))
-        rows = self.cursor.fetchall()
+        rows = self._fetchall(query, (team_name,))
 
     # Flatten rows like [('Boston Celtics',)] → ['Boston Celtics']
         return [row[0] for row in rows]
     
+    @read_through
     def get_team_score(self, team_name):
         query = """
             SELECT
                 -- PPG: average points scored by this team
-                AVG(
-                    IF(Game.HomeTeamID = t.TeamID, Game.HomeTeamScore, Game.AwayTeamScore)
-                ) AS PPG,
+                s.PointsFor / NULLIF(s.GamesPlayed, 0) AS PPG,
 
                 -- Opponent PPG: average points allowed
-                AVG(
-                    IF(Game.HomeTeamID = t.TeamID, Game.AwayTeamScore, Game.HomeTeamScore)
-                ) AS OppPPG
+                s.PointsAgainst / NULLIF(s.GamesPlayed, 0) AS OppPPG
+
+            FROM TeamSeasonSummary s
+            INNER JOIN Team t
+                ON s.TeamID = t.TeamID
+            WHERE t.Name = %s;
+        """
+        return self._fetchone(query, (team_name,))
 
-            FROM Game
-            INNER JOIN Team t ON t.Name = %s
-            WHERE Game.HomeTeamID = t.TeamID
-            OR Game.AwayTeamID = t.TeamID;
+    # function returns {Abbreviation: TeamID} for the real teams
+    @read_through
+    def get_team_ids(self):
+        query = """
+        SELECT Abbreviation, TeamID
+        FROM Team
+        WHERE TeamID != 31;
         """
-        self.cursor.execute(query, (team_name,))
-        return self.cursor.fetchone()
+        return dict(self._fetchall(query))
+
+    # function returns every section of the Teams detail view in one round
+    # trip: bio, season/home/away records and scoring come from one row, and
+    # the roster, last five games and opponent list ride along as JSON
+    # arrays. Returns a TeamDashboard, or None for an unknown team.
+    @read_through
+    def get_team_dashboard(self, team_id):
+        query = """
+        SELECT
+            t.Name,
+            t.Abbreviation,
+            t.City,
+            t.State,
+            t.Conference,
+            t.Division,
+            CONCAT(c.FirstName, ' ', c.LastName) AS CoachName,
+            v.Name AS VenueName,
+            s.Wins,
+            s.Losses,
+            s.HomeWins,
+            s.HomeLosses,
+            s.AwayWins,
+            s.AwayLosses,
+            s.PointsFor / NULLIF(s.GamesPlayed, 0) AS PPG,
+            s.PointsAgainst / NULLIF(s.GamesPlayed, 0) AS OppPPG,
+            (
+                SELECT JSON_ARRAYAGG(JSON_ARRAY(p.FullName, p.Age, p.Position, p.Number))
+                FROM Player p
+                WHERE p.TeamID = %s
+            ) AS Roster,
+            (
+                SELECT JSON_ARRAYAGG(JSON_ARRAY(DATE(r.Date), ht.Name, at.Name, r.HomeTeamScore, r.AwayTeamScore))
+                FROM (
+                    SELECT Date, HomeTeamID, AwayTeamID, HomeTeamScore, AwayTeamScore
+                    FROM Game
+                    WHERE HomeTeamID = %s OR AwayTeamID = %s
+                    ORDER BY Date DESC
+                    LIMIT 5
+                ) r
+                INNER JOIN Team ht
+                    ON r.HomeTeamID = ht.TeamID
+                INNER JOIN Team at
+                    ON r.AwayTeamID = at.TeamID
+            ) AS RecentGames
+        FROM Team t
+        INNER JOIN HeadCoach c
+            ON t.CoachID = c.CoachID
+        INNER JOIN Venue v
+            ON t.VenueID = v.VenueID
+        LEFT JOIN TeamSeasonSummary s
+            ON t.TeamID = s.TeamID
+        WHERE t.TeamID = %s;
+        """
+        row = self._fetchone(query, (team_id, team_id, team_id, team_id))
+        if row is None:
+            return None
+
+        bio = tuple(row[0:8])
+        has_summary = row[8] is not None
+        # JSON_ARRAYAGG has no ORDER BY, so each list is sorted here
+        roster = sorted((tuple(p) for p in _json_rows(row[16])), key=lambda p: p[0] or "")
+        recent_games = sorted(
+            ((datetime.date.fromisoformat(g[0]), *g[1:]) for g in _json_rows(row[17])),
+            key=lambda g: g[0],
+            reverse=True,
+        )
+        return TeamDashboard(
+            team_id=team_id,
+            bio=bio,
+            record=(row[8], row[9]) if has_summary else None,
+            home_record=(row[10], row[11]) if has_summary else None,
+            away_record=(row[12], row[13]) if has_summary else None,
+            scores=(row[14], row[15]) if row[14] is not None else None,
+            roster=roster,
+            recent_games=recent_games,
+        )
     
+    @read_through
     def get_games_by_date(self, date):
         query = """
         SELECT 
@@ -287,24 +870,121 @@ class db_operations():
             ON g.HomeTeamID = ht.TeamID
         INNER JOIN Team at
             ON g.AwayTeamID = at.TeamID
-        WHERE DATE(g.Date) = %s
+        WHERE g.Date >= %s AND g.Date < %s
         ORDER BY g.Date DESC;
         """
-        self.cursor.execute(query, (date,))
-        return self.cursor.fetchall()
-    
-    def get_boxscore(self, game_id: int):
+        return self._fetchall(query, day_bounds(date))
+
+    # function returns one page of the full game history, newest first,
+    # as (rows, next_key). Rows match get_games_by_date. Pass next_key back
+    # as `after` for the following page; it is None on the last page.
+    # Seeks on (Date, GameID) through idx_game_date, so every page costs
+    # the same however deep it is.
+    @read_through
+    def get_games_page(self, after=None, limit=DEFAULT_PAGE_SIZE):
+        query = """
+        SELECT
+            g.GameID AS GameID,
+            DATE(g.Date) AS GameDate,
+            ht.Name AS HomeTeam,
+            at.Name AS AwayTeam,
+            g.HomeTeamScore AS HomeTeamScore,
+            g.AwayTeamScore AS AwayTeamScore,
+            g.Date,
+            g.GameID
+        FROM Game g
+        INNER JOIN Team ht
+            ON g.HomeTeamID = ht.TeamID
+        INNER JOIN Team at
+            ON g.AwayTeamID = at.TeamID
+        {seek}
+        ORDER BY g.Date DESC, g.GameID DESC
+        LIMIT %s;
+        """
+        if after is None:
+            rows = self._fetchall(query.format(seek=""), (limit + 1,))
+        else:
+            seek = "WHERE g.Date < %s OR (g.Date = %s AND g.GameID < %s)"
+            last_date, last_game_id = after
+            rows = self._fetchall(query.format(seek=seek), (last_date, last_date, last_game_id, limit + 1))
+        return _keyset_page(rows, limit, 2)
+
+    # function yields every game, oldest first, with the get_games_by_date
+    # row shape. For exports; see _stream.
+    def stream_games(self, batch_size=STREAM_BATCH_SIZE):
+        query = """
+        SELECT
+            g.GameID AS GameID,
+            DATE(g.Date) AS GameDate,
+            ht.Name AS HomeTeam,
+            at.Name AS AwayTeam,
+            g.HomeTeamScore AS HomeTeamScore,
+            g.AwayTeamScore AS AwayTeamScore
+        FROM Game g
+        INNER JOIN Team ht
+            ON g.HomeTeamID = ht.TeamID
+        INNER JOIN Team at
+            ON g.AwayTeamID = at.TeamID
+        ORDER BY g.Date, g.GameID;
+        """
+        return self._stream(query, batch_size=batch_size)
+
+    # function returns one page of a player's game log, newest first, as
+    # (rows, next_key) like get_games_page. Rows are
+    # (GameID, GameDate, HomeTeam, AwayTeam, Minutes, Points, Rebounds,
+    #  Assists, Blocks, Steals, Turnovers, Fouls).
+    @read_through
+    def get_player_game_log_page(self, player_id, after=None, limit=DEFAULT_PAGE_SIZE):
+        query = """
+        SELECT
+            g.GameID,
+            DATE(g.Date) AS GameDate,
+            ht.Name AS HomeTeam,
+            at.Name AS AwayTeam,
+            s.Minutes,
+            s.Points,
+            s.Rebounds,
+            s.Assists,
+            s.Blocks,
+            s.Steals,
+            s.Turnovers,
+            s.Fouls,
+            g.Date,
+            g.GameID
+        FROM PlayerGameStats s
+        INNER JOIN Game g
+            ON s.GameID = g.GameID
+        INNER JOIN Team ht
+            ON g.HomeTeamID = ht.TeamID
+        INNER JOIN Team at
+            ON g.AwayTeamID = at.TeamID
+        WHERE s.PlayerID = %s {seek}
+        ORDER BY g.Date DESC, g.GameID DESC
+        LIMIT %s;
+        """
+        if after is None:
+            rows = self._fetchall(query.format(seek=""), (player_id, limit + 1))
+        else:
+            seek = "AND (g.Date < %s OR (g.Date = %s AND g.GameID < %s))"
+            last_date, last_game_id = after
+            rows = self._fetchall(query.format(seek=seek),
+                                  (player_id, last_date, last_date, last_game_id, limit + 1))
+        return _keyset_page(rows, limit, 2)
+
+    @read_through
+    def get_boxscore(self, game_id: int, fetch_mode="rows"):
         """
         Return per-player boxscore for a given game_id.
     
         Rows come back as:
           (TeamName, PlayerName, Minutes, Points, Rebounds, Assists,
            Blocks, Steals, Turnovers, Fouls)
+        fetch_mode="frame" or "numpy" returns the columns of BOXSCORE_COLUMNS.
         """
         query = """
             SELECT
                 t.Name AS TeamName,
-                CONCAT(p.FirstName, ' ', p.LastName) AS PlayerName,
+                p.FullName AS PlayerName,
                 s.Minutes AS Minutes,
                 s.Points AS Points,
                 s.Rebounds AS Rebounds,
@@ -316,28 +996,31 @@ class db_operations():
             FROM PlayerGameStats AS s
             INNER JOIN Player AS p
                 ON s.PlayerID = p.PlayerID
+            -- the team the player played for in this game; rows loaded before
+            -- TeamID was recorded fall back to the player's current team
             INNER JOIN Team AS t
-                ON p.TeamID = t.TeamID
+                ON t.TeamID = COALESCE(s.TeamID, p.TeamID)
             WHERE s.GameID = %s
             ORDER BY t.Name, s.Minutes DESC;
         """
         try:
-            self.cursor.execute(query, (game_id,))
-            return self.cursor.fetchall()
+            return self._fetch_columnar(query, (game_id,), BOXSCORE_COLUMNS, fetch_mode)
         except mysql.connector.Error as e:
             # TEMP: helps debug on Streamlit Cloud
             print(f"Error in get_boxscore for GameID {game_id}: {e}")
-            return []
+            if fetch_mode == "rows":
+                return []
+            return _columnar([[] for _ in BOXSCORE_COLUMNS], BOXSCORE_COLUMNS, fetch_mode)
 
     # includes all teams and free agent team to be able to add a free agent to the database
+    @read_through
     def get_teams(self):
         query = """
         SELECT Name
         FROM Team
         ORDER BY Name ASC;
         """
-        self.cursor.execute(query)
-        teams = self.cursor.fetchall()
+        teams = self._fetchall(query)
 
         return [team[0] for team in teams]
     
@@ -347,90 +1030,138 @@ class db_operations():
             INSERT INTO Player (TeamID, FirstName, LastName, Age, Position, Number, HeightInches, WeightPounds)
             VALUES ((SELECT TeamID FROM Team WHERE Name = %s), %s, %s, %s, %s, %s, %s, %s);
             """
-            self.cursor.execute(query, (team_name, first_name, last_name, age, position, number, height, weight))
-            self.connection.commit()
+            self._write([(query, (team_name, first_name, last_name, age, position, number, height, weight))])
             return True
         except Exception as e:
             print(f"Error inserting player: {e}")
             return False
     
-    def get_conference_standings(self, conference):
+    @read_through
+    def get_conference_standings(self, conference, fetch_mode="rows"):
         query = """
             SELECT 
-                Name,
-                Wins,
-                Losses,
-                WinPercentage
-            FROM vstandings
-            WHERE Conference = %s
-            ORDER BY WinPercentage DESC;
+                t.Name,
+                s.Wins,
+                s.Losses,
+                s.WinPercentage
+            FROM TeamSeasonSummary s
+            INNER JOIN Team t
+                ON s.TeamID = t.TeamID
+            WHERE t.Conference = %s
+            ORDER BY s.WinPercentage DESC;
         """
-        self.cursor.execute(query, (conference,))
-        return self.cursor.fetchall()
+        return self._fetch_columnar(query, (conference,), STANDINGS_COLUMNS, fetch_mode)
 
-    def get_league_standings(self):
+    @read_through
+    def get_league_standings(self, fetch_mode="rows"):
         query = """
             SELECT 
-                Name,
-                Wins,
-                Losses,
-                WinPercentage
-            FROM vstandings
-            ORDER BY WinPercentage DESC;
-        """
-        self.cursor.execute(query)
-        return self.cursor.fetchall() # list of tuples like [('Boston Celtics', 50, 32, 0.625), ('Brooklyn Nets', 48, 34, 0.585), ...]
+                t.Name,
+                s.Wins,
+                s.Losses,
+                s.WinPercentage
+            FROM TeamSeasonSummary s
+            INNER JOIN Team t
+                ON s.TeamID = t.TeamID
+            ORDER BY s.WinPercentage DESC;
+        """
+        # rows are tuples like ('Boston Celtics', 50, 32, 0.625)
+        return self._fetch_columnar(query, None, STANDINGS_COLUMNS, fetch_mode)
     
+    @read_through
     def get_divisions(self):
         query = """
         SELECT DISTINCT Division
         FROM Team
         WHERE TeamID != 31;
         """
-        self.cursor.execute(query)
-        return self.cursor.fetchall()
+        return self._fetchall(query)
     
-    def get_division_standings(self, division):
+    @read_through
+    def get_division_standings(self, division, fetch_mode="rows"):
         query = """
         SELECT 
-                Name,
-                Wins,
-                Losses,
-                WinPercentage
-            FROM vstandings
-            WHERE Division = %s
-            ORDER BY WinPercentage DESC;
+                t.Name,
+                s.Wins,
+                s.Losses,
+                s.WinPercentage
+            FROM TeamSeasonSummary s
+            INNER JOIN Team t
+                ON s.TeamID = t.TeamID
+            WHERE t.Division = %s
+            ORDER BY s.WinPercentage DESC;
         """
-        self.cursor.execute(query, (division,))
-        return self.cursor.fetchall()
+        return self._fetch_columnar(query, (division,), STANDINGS_COLUMNS, fetch_mode)
 
-    def get_all_players(self):
+    @read_through
+    # fetch_mode="frame" or "numpy" returns the columns of ALL_PLAYERS_COLUMNS
+    def get_all_players(self, fetch_mode="rows"):
+        # averages come from the precomputed PlayerSeasonTotals sums
         query = """
         SELECT 
             Player.PlayerID, 
-            CONCAT(Player.FirstName, ' ', Player.LastName) AS Name, 
+            Player.FullName AS Name, 
             Team.Name AS Team, 
             Player.Position, 
-            ROUND(AVG(PlayerGameStats.Points), 1) AS Points, 
-            ROUND(AVG(PlayerGameStats.Rebounds), 1) AS Rebounds, 
-            ROUND(AVG(PlayerGameStats.Assists), 1) AS Assists, 
-            ROUND(AVG(PlayerGameStats.Blocks), 1) AS Blocks, 
-            ROUND(AVG(PlayerGameStats.Steals), 1) AS Steals, 
-            ROUND(AVG(PlayerGameStats.Turnovers), 1) AS Turnovers, 
-            ROUND(AVG(PlayerGameStats.Fouls), 1) AS Fouls
-        FROM PlayerGameStats
-        INNER JOIN Player ON PlayerGameStats.PlayerID = Player.PlayerID
+            ROUND(PlayerSeasonTotals.Points / PlayerSeasonTotals.GamesPlayed, 1) AS Points, 
+            ROUND(PlayerSeasonTotals.Rebounds / PlayerSeasonTotals.GamesPlayed, 1) AS Rebounds, 
+            ROUND(PlayerSeasonTotals.Assists / PlayerSeasonTotals.GamesPlayed, 1) AS Assists, 
+            ROUND(PlayerSeasonTotals.Blocks / PlayerSeasonTotals.GamesPlayed, 1) AS Blocks, 
+            ROUND(PlayerSeasonTotals.Steals / PlayerSeasonTotals.GamesPlayed, 1) AS Steals, 
+            ROUND(PlayerSeasonTotals.Turnovers / PlayerSeasonTotals.GamesPlayed, 1) AS Turnovers, 
+            ROUND(PlayerSeasonTotals.Fouls / PlayerSeasonTotals.GamesPlayed, 1) AS Fouls
+        FROM PlayerSeasonTotals
+        INNER JOIN Player ON PlayerSeasonTotals.PlayerID = Player.PlayerID
         INNER JOIN Team ON Player.TeamID = Team.TeamID
-        GROUP BY Player.PlayerID
-        ORDER BY Points DESC;
+        WHERE PlayerSeasonTotals.GamesPlayed > 0
+        ORDER BY PlayerSeasonTotals.PointsPerGame DESC;
         """
-        self.cursor.execute(query)
-        return self.cursor.fetchall()
+        if fetch_mode == "rows":
+            return self._fetchall(query, types=ALL_PLAYERS_TYPES)
+        return self._fetch_columnar(query, None, ALL_PLAYERS_COLUMNS, fetch_mode)
+
+    # function returns one page of get_all_players, best scorers first, as
+    # (rows, next_key) like get_games_page. Seeks on the indexed
+    # (PointsPerGame, PlayerID) pair, so deep pages cost the same as page 1.
+    @read_through
+    def get_all_players_page(self, after=None, limit=DEFAULT_PAGE_SIZE):
+        query = """
+        SELECT 
+            Player.PlayerID, 
+            Player.FullName AS Name, 
+            Team.Name AS Team, 
+            Player.Position, 
+            PlayerSeasonTotals.PointsPerGame AS Points, 
+            ROUND(PlayerSeasonTotals.Rebounds / PlayerSeasonTotals.GamesPlayed, 1) AS Rebounds, 
+            ROUND(PlayerSeasonTotals.Assists / PlayerSeasonTotals.GamesPlayed, 1) AS Assists, 
+            ROUND(PlayerSeasonTotals.Blocks / PlayerSeasonTotals.GamesPlayed, 1) AS Blocks, 
+            ROUND(PlayerSeasonTotals.Steals / PlayerSeasonTotals.GamesPlayed, 1) AS Steals, 
+            ROUND(PlayerSeasonTotals.Turnovers / PlayerSeasonTotals.GamesPlayed, 1) AS Turnovers, 
+            ROUND(PlayerSeasonTotals.Fouls / PlayerSeasonTotals.GamesPlayed, 1) AS Fouls,
+            PlayerSeasonTotals.PointsPerGame,
+            PlayerSeasonTotals.PlayerID
+        FROM PlayerSeasonTotals
+        INNER JOIN Player ON PlayerSeasonTotals.PlayerID = Player.PlayerID
+        INNER JOIN Team ON Player.TeamID = Team.TeamID
+        WHERE PlayerSeasonTotals.GamesPlayed > 0 {seek}
+        ORDER BY PlayerSeasonTotals.PointsPerGame DESC, PlayerSeasonTotals.PlayerID DESC
+        LIMIT %s;
+        """
+        if after is None:
+            rows = self._fetchall(query.format(seek=""), (limit + 1,))
+        else:
+            seek = """AND (PlayerSeasonTotals.PointsPerGame < %s
+                 OR (PlayerSeasonTotals.PointsPerGame = %s AND PlayerSeasonTotals.PlayerID < %s))"""
+            last_points, last_player_id = after
+            rows = self._fetchall(query.format(seek=seek),
+                                  (last_points, last_points, last_player_id, limit + 1))
+        return _keyset_page(rows, limit, 2)
     
+    @read_through
     def get_player_info(self, player_id):
         query = """
         SELECT
-            CONCAT(Player.FirstName, ' ', Player.LastName) AS Name,
+            Player.FullName AS Name,
             (SELECT Team.Name FROM Team WHERE Team.TeamID = Player.TeamID) AS TeamName,
             Player.Position,
             Player.Age,
@@ -440,40 +1171,66 @@ class db_operations():
         FROM Player
         WHERE Player.PlayerID = %s;
         """
-        self.cursor.execute(query, (player_id,))
-
-        return self.cursor.fetchone()
+        return self._fetchone(query, (player_id,))
 
+    @read_through
     def get_players(self):
         query = """
-        SELECT CONCAT(FirstName, ' ', LastName) AS Name
+        SELECT FullName AS Name
         FROM Player
         ORDER BY Name ASC;
         """
-        self.cursor.execute(query)
-        players = self.cursor.fetchall()
+        players = self._fetchall(query)
         return [player[0] for player in players]
+
+    # returns (PlayerID, Name) pairs ordered by name so pages can show
+    # names but pass IDs to the *_by_id methods
+    @read_through
+    def get_player_options(self):
+        query = """
+        SELECT PlayerID, FullName AS Name
+        FROM Player
+        ORDER BY Name ASC, PlayerID ASC;
+        """
+        return self._fetchall(query)
     
     def change_player_team(self, player_name, team_name):
         query = """
         UPDATE Player
         SET TeamID = (SELECT TeamID FROM Team WHERE Name = %s)
-        WHERE CONCAT(FirstName, ' ', LastName) = %s;
+        WHERE FullName = %s;
+        """
+        self._write([(query, (team_name, player_name))])
+        return True
+
+    def change_player_team_by_id(self, player_id, team_name):
+        query = """
+        UPDATE Player
+        SET TeamID = (SELECT TeamID FROM Team WHERE Name = %s)
+        WHERE PlayerID = %s;
         """
-        self.cursor.execute(query, (team_name, player_name))
-        self.connection.commit()
+        self._write([(query, (team_name, player_id))])
         return True
     
     def change_player_age(self, player_name, age):
         query = """
         UPDATE Player
         SET Age = %s
-        WHERE CONCAT(FirstName, ' ', LastName) = %s;
+        WHERE FullName = %s;
         """
-        self.cursor.execute(query, (age, player_name))
-        self.connection.commit()
+        self._write([(query, (age, player_name))])
+        return True
+
+    def change_player_age_by_id(self, player_id, age):
+        query = """
+        UPDATE Player
+        SET Age = %s
+        WHERE PlayerID = %s;
+        """
+        self._write([(query, (age, player_id))])
         return True
     
+    @read_through
     def get_positions(self):
         query = """
         SELECT DISTINCT Position
@@ -481,125 +1238,305 @@ class db_operations():
         WHERE Position IS NOT NULL
         ORDER BY Position ASC;
         """
-        self.cursor.execute(query)
-        positions = self.cursor.fetchall()
+        positions = self._fetchall(query)
         return [position[0] for position in positions]
 
     def change_player_position(self, player_name, position):
         query = """
         UPDATE Player
         SET Position = %s
-        WHERE CONCAT(FirstName, ' ', LastName) = %s;
+        WHERE FullName = %s;
+        """
+        self._write([(query, (position, player_name))])
+        return True
+
+    def change_player_position_by_id(self, player_id, position):
+        query = """
+        UPDATE Player
+        SET Position = %s
+        WHERE PlayerID = %s;
         """
-        self.cursor.execute(query, (position, player_name))
-        self.connection.commit()
+        self._write([(query, (position, player_id))])
         return True
     
     def change_player_number(self, player_name, number):
         query = """
         UPDATE Player
         SET Number = %s
-        WHERE CONCAT(FirstName, ' ', LastName) = %s;
+        WHERE FullName = %s;
+        """
+        self._write([(query, (number, player_name))])
+        return True
+
+    def change_player_number_by_id(self, player_id, number):
+        query = """
+        UPDATE Player
+        SET Number = %s
+        WHERE PlayerID = %s;
         """
-        self.cursor.execute(query, (number, player_name))
-        self.connection.commit()
+        self._write([(query, (number, player_id))])
         return True
     
     def change_player_height(self, player_name, height):
         query = """
         UPDATE Player
         SET HeightInches = %s
-        WHERE CONCAT(FirstName, ' ', LastName) = %s;
+        WHERE FullName = %s;
         """
-        self.cursor.execute(query, (height, player_name))
-        self.connection.commit()
+        self._write([(query, (height, player_name))])
+        return True
+
+    def change_player_height_by_id(self, player_id, height):
+        query = """
+        UPDATE Player
+        SET HeightInches = %s
+        WHERE PlayerID = %s;
+        """
+        self._write([(query, (height, player_id))])
         return True
     
     def change_player_weight(self, player_name, weight):
         query = """
         UPDATE Player
         SET WeightPounds = %s
-        WHERE CONCAT(FirstName, ' ', LastName) = %s;
+        WHERE FullName = %s;
         """
-        self.cursor.execute(query, (weight, player_name))
-        self.connection.commit()
+        self._write([(query, (weight, player_name))])
+        return True
+
+    def change_player_weight_by_id(self, player_id, weight):
+        query = """
+        UPDATE Player
+        SET WeightPounds = %s
+        WHERE PlayerID = %s;
+        """
+        self._write([(query, (weight, player_id))])
         return True
     
     def delete_player(self, player_name):
+        delete_stats_query = """
+        DELETE PlayerGameStats
+        FROM PlayerGameStats
+        INNER JOIN Player
+            ON PlayerGameStats.PlayerID = Player.PlayerID
+        WHERE Player.FullName = %s;
+        """
+        delete_totals_query = """
+        DELETE PlayerSeasonTotals
+        FROM PlayerSeasonTotals
+        INNER JOIN Player
+            ON PlayerSeasonTotals.PlayerID = Player.PlayerID
+        WHERE Player.FullName = %s;
+        """
+        delete_splits_query = """
+        DELETE PlayerOpponentSplit
+        FROM PlayerOpponentSplit
+        INNER JOIN Player
+            ON PlayerOpponentSplit.PlayerID = Player.PlayerID
+        WHERE Player.FullName = %s;
+        """
+        delete_matchups_query = """
+        DELETE PlayerMatchup
+        FROM PlayerMatchup
+        INNER JOIN Player
+            ON Player.PlayerID IN (PlayerMatchup.PlayerID, PlayerMatchup.OpponentPlayerID)
+        WHERE Player.FullName = %s;
+        """
+        delete_player_query = """
+        DELETE FROM Player
+        WHERE FullName = %s;
+        """
+        self._write([
+            (delete_matchups_query, (player_name,)),
+            (delete_stats_query, (player_name,)),
+            (delete_totals_query, (player_name,)),
+            (delete_splits_query, (player_name,)),
+            (delete_player_query, (player_name,)),
+        ])
+        return True
+
+    def delete_player_by_id(self, player_id):
         delete_stats_query = """
         DELETE FROM PlayerGameStats
-        WHERE PlayerID = (SELECT PlayerID FROM Player WHERE CONCAT(FirstName, ' ', LastName) = %s);
+        WHERE PlayerID = %s;
+        """
+        delete_totals_query = """
+        DELETE FROM PlayerSeasonTotals
+        WHERE PlayerID = %s;
+        """
+        delete_splits_query = """
+        DELETE FROM PlayerOpponentSplit
+        WHERE PlayerID = %s;
+        """
+        delete_matchups_query = """
+        DELETE FROM PlayerMatchup
+        WHERE PlayerID = %s OR OpponentPlayerID = %s;
         """
         delete_player_query = """
         DELETE FROM Player
-        WHERE CONCAT(FirstName, ' ', LastName) = %s;
+        WHERE PlayerID = %s;
         """
-        self.cursor.execute(delete_stats_query, (player_name,))
-        self.cursor.execute(delete_player_query, (player_name,))
-        self.connection.commit()
+        self._write([
+            (delete_matchups_query, (player_id, player_id)),
+            (delete_stats_query, (player_id,)),
+            (delete_totals_query, (player_id,)),
+            (delete_splits_query, (player_id,)),
+            (delete_player_query, (player_id,)),
+        ])
         return True
+
+    # averages against one opponent come from the precomputed
+    # PlayerOpponentSplit sums; GamesPlayed is 0 when they have not met
+    @read_through
     def get_player_team_performance(self, player_name, team_name):
         query = """
         SELECT
-            COUNT(*) AS GamesPlayed,
-            AVG(PlayerGameStats.Points) AS Points,
-            AVG(PlayerGameStats.Rebounds) AS Rebounds,
-            AVG(PlayerGameStats.Assists) AS Assists,
-            AVG(PlayerGameStats.Blocks) AS Blocks,
-            AVG(PlayerGameStats.Steals) AS Steals,
-            AVG(PlayerGameStats.Turnovers) AS Turnovers,
-            AVG(PlayerGameStats.Fouls) AS Fouls
-        FROM PlayerGameStats
-        INNER JOIN Player
-            ON PlayerGameStats.PlayerID = Player.PlayerID
-        INNER JOIN Game
-            ON PlayerGameStats.GameID = Game.GameID
-        WHERE (CONCAT(Player.FirstName, ' ', Player.LastName) = %s AND Game.HomeTeamID = (SELECT TeamID FROM Team WHERE Name = %s) AND Game.AwayTeamID = Player.TeamID)
-        OR (CONCAT(Player.FirstName, ' ', Player.LastName) = %s AND Game.AwayTeamID = (SELECT TeamID FROM Team WHERE Name = %s) AND Game.HomeTeamID = Player.TeamID);
+            COALESCE(s.GamesPlayed, 0) AS GamesPlayed,
+            s.Points / NULLIF(s.GamesPlayed, 0) AS Points,
+            s.Rebounds / NULLIF(s.GamesPlayed, 0) AS Rebounds,
+            s.Assists / NULLIF(s.GamesPlayed, 0) AS Assists,
+            s.Blocks / NULLIF(s.GamesPlayed, 0) AS Blocks,
+            s.Steals / NULLIF(s.GamesPlayed, 0) AS Steals,
+            s.Turnovers / NULLIF(s.GamesPlayed, 0) AS Turnovers,
+            s.Fouls / NULLIF(s.GamesPlayed, 0) AS Fouls
+        FROM Player p
+        INNER JOIN Team t
+            ON t.Name = %s
+        LEFT JOIN PlayerOpponentSplit s
+            ON s.PlayerID = p.PlayerID AND s.OpponentTeamID = t.TeamID
+        WHERE p.FullName = %s;
         """
-        self.cursor.execute(query, (player_name, team_name, player_name, team_name))
-        return self.cursor.fetchone()
-    
+        return self._fetchone(query, (team_name, player_name))
+
+    @read_through
+    def get_player_team_performance_by_id(self, player_id, team_name):
+        query = """
+        SELECT
+            COALESCE(s.GamesPlayed, 0) AS GamesPlayed,
+            s.Points / NULLIF(s.GamesPlayed, 0) AS Points,
+            s.Rebounds / NULLIF(s.GamesPlayed, 0) AS Rebounds,
+            s.Assists / NULLIF(s.GamesPlayed, 0) AS Assists,
+            s.Blocks / NULLIF(s.GamesPlayed, 0) AS Blocks,
+            s.Steals / NULLIF(s.GamesPlayed, 0) AS Steals,
+            s.Turnovers / NULLIF(s.GamesPlayed, 0) AS Turnovers,
+            s.Fouls / NULLIF(s.GamesPlayed, 0) AS Fouls
+        FROM Team t
+        LEFT JOIN PlayerOpponentSplit s
+            ON s.PlayerID = %s AND s.OpponentTeamID = t.TeamID
+        WHERE t.Name = %s;
+        """
+        return self._fetchone(query, (player_id, team_name))
+
+    # function returns the player's averages against every opponent faced,
+    # in one primary-key range read of PlayerOpponentSplit, A-Z by opponent
+    @read_through
+    def get_player_opponent_splits(self, player_id, fetch_mode="rows"):
+        query = """
+        SELECT
+            t.Name,
+            s.GamesPlayed,
+            ROUND(s.Points / s.GamesPlayed, 1),
+            ROUND(s.Rebounds / s.GamesPlayed, 1),
+            ROUND(s.Assists / s.GamesPlayed, 1),
+            ROUND(s.Blocks / s.GamesPlayed, 1),
+            ROUND(s.Steals / s.GamesPlayed, 1),
+            ROUND(s.Turnovers / s.GamesPlayed, 1),
+            ROUND(s.Fouls / s.GamesPlayed, 1)
+        FROM PlayerOpponentSplit s
+        INNER JOIN Team t
+            ON s.OpponentTeamID = t.TeamID
+        WHERE s.PlayerID = %s AND s.GamesPlayed > 0
+        ORDER BY t.Name ASC;
+        """
+        return self._fetch_columnar(query, (player_id,), PLAYER_SPLIT_COLUMNS, fetch_mode)
+
+    # head-to-head averages for games both players played on opposite
+    # sides, found through the PlayerMatchup index
+    @read_through
     def get_player_performance(self, player1_name, player2_name):
         query = """
         SELECT
             COUNT(*) AS GamesPlayed,
-            AVG(PlayerGameStats.Points) AS Points,
-            AVG(PlayerGameStats.Rebounds) AS Rebounds,
-            AVG(PlayerGameStats.Assists) AS Assists,
-            AVG(PlayerGameStats.Blocks) AS Blocks,
-            AVG(PlayerGameStats.Steals) AS Steals,
-            AVG(PlayerGameStats.Turnovers) AS Turnovers,
-            AVG(PlayerGameStats.Fouls) AS Fouls
-        FROM PlayerGameStats
-        INNER JOIN Player
-            ON PlayerGameStats.PlayerID = Player.PlayerID
-        INNER JOIN Game
-            ON PlayerGameStats.GameID = Game.GameID
-        WHERE (CONCAT(Player.FirstName, ' ', Player.LastName) = %s AND Game.HomeTeamID = Player.TeamID AND Game.AwayTeamID = (SELECT TeamID FROM Player WHERE CONCAT(FirstName, ' ', LastName) = %s))
-        OR (CONCAT(Player.FirstName, ' ', Player.LastName) = %s AND Game.AwayTeamID = Player.TeamID AND Game.HomeTeamID = (SELECT TeamID FROM Player WHERE CONCAT(FirstName, ' ', LastName) = %s));
+            AVG(s.Points) AS Points,
+            AVG(s.Rebounds) AS Rebounds,
+            AVG(s.Assists) AS Assists,
+            AVG(s.Blocks) AS Blocks,
+            AVG(s.Steals) AS Steals,
+            AVG(s.Turnovers) AS Turnovers,
+            AVG(s.Fouls) AS Fouls
+        FROM Player p1
+        INNER JOIN Player p2
+            ON p2.FullName = %s
+        INNER JOIN PlayerMatchup m
+            ON m.PlayerID = p1.PlayerID AND m.OpponentPlayerID = p2.PlayerID
+        INNER JOIN PlayerGameStats s
+            ON s.GameID = m.GameID AND s.PlayerID = m.PlayerID
+        WHERE p1.FullName = %s;
         """
-        self.cursor.execute(query, (player1_name, player2_name, player1_name, player2_name))
-        return self.cursor.fetchone()
-    
-    def get_player_stats(self, player_name):
+        return self._fetchone(query, (player2_name, player1_name))
+
+    def get_player_performance_by_id(self, player1_id, player2_id):
+        return self.get_player_matchup(player1_id, player2_id)[0]
+
+    # function returns both players' head-to-head averages from one range
+    # read of PlayerMatchup, as (player1_row, player2_row) in the
+    # get_player_performance row shape
+    @read_through
+    def get_player_matchup(self, player1_id, player2_id):
         query = """
         SELECT
             COUNT(*) AS GamesPlayed,
-            AVG(PlayerGameStats.Points) AS Points,
-            AVG(PlayerGameStats.Rebounds) AS Rebounds,
-            AVG(PlayerGameStats.Assists) AS Assists,
-            AVG(PlayerGameStats.Blocks) AS Blocks,
-            AVG(PlayerGameStats.Steals) AS Steals,
-            AVG(PlayerGameStats.Turnovers) AS Turnovers,
-            AVG(PlayerGameStats.Fouls) AS Fouls
-        FROM PlayerGameStats
-        INNER JOIN Player 
-            ON PlayerGameStats.PlayerID = Player.PlayerID
-        WHERE CONCAT(Player.FirstName, ' ', Player.LastName) = %s;
+            AVG(a.Points), AVG(a.Rebounds), AVG(a.Assists), AVG(a.Blocks),
+            AVG(a.Steals), AVG(a.Turnovers), AVG(a.Fouls),
+            AVG(b.Points), AVG(b.Rebounds), AVG(b.Assists), AVG(b.Blocks),
+            AVG(b.Steals), AVG(b.Turnovers), AVG(b.Fouls)
+        FROM PlayerMatchup m
+        INNER JOIN PlayerGameStats a
+            ON a.GameID = m.GameID AND a.PlayerID = m.PlayerID
+        INNER JOIN PlayerGameStats b
+            ON b.GameID = m.GameID AND b.PlayerID = m.OpponentPlayerID
+        WHERE m.PlayerID = %s AND m.OpponentPlayerID = %s;
+        """
+        row = self._fetchone(query, (player1_id, player2_id))
+        return (row[0], *row[1:8]), (row[0], *row[8:15])
+
+    @read_through
+    def get_player_stats(self, player_name):
+        query = """
+        SELECT
+            COALESCE(PlayerSeasonTotals.GamesPlayed, 0) AS GamesPlayed,
+            PlayerSeasonTotals.Points / NULLIF(PlayerSeasonTotals.GamesPlayed, 0) AS Points,
+            PlayerSeasonTotals.Rebounds / NULLIF(PlayerSeasonTotals.GamesPlayed, 0) AS Rebounds,
+            PlayerSeasonTotals.Assists / NULLIF(PlayerSeasonTotals.GamesPlayed, 0) AS Assists,
+            PlayerSeasonTotals.Blocks / NULLIF(PlayerSeasonTotals.GamesPlayed, 0) AS Blocks,
+            PlayerSeasonTotals.Steals / NULLIF(PlayerSeasonTotals.GamesPlayed, 0) AS Steals,
+            PlayerSeasonTotals.Turnovers / NULLIF(PlayerSeasonTotals.GamesPlayed, 0) AS Turnovers,
+            PlayerSeasonTotals.Fouls / NULLIF(PlayerSeasonTotals.GamesPlayed, 0) AS Fouls
+        FROM Player
+        LEFT JOIN PlayerSeasonTotals
+            ON Player.PlayerID = PlayerSeasonTotals.PlayerID
+        WHERE Player.FullName = %s;
+        """
+        return self._fetchone(query, (player_name,))
+
+    @read_through
+    def get_player_stats_by_id(self, player_id):
+        query = """
+        SELECT
+            COALESCE(PlayerSeasonTotals.GamesPlayed, 0) AS GamesPlayed,
+            PlayerSeasonTotals.Points / NULLIF(PlayerSeasonTotals.GamesPlayed, 0) AS Points,
+            PlayerSeasonTotals.Rebounds / NULLIF(PlayerSeasonTotals.GamesPlayed, 0) AS Rebounds,
+            PlayerSeasonTotals.Assists / NULLIF(PlayerSeasonTotals.GamesPlayed, 0) AS Assists,
+            PlayerSeasonTotals.Blocks / NULLIF(PlayerSeasonTotals.GamesPlayed, 0) AS Blocks,
+            PlayerSeasonTotals.Steals / NULLIF(PlayerSeasonTotals.GamesPlayed, 0) AS Steals,
+            PlayerSeasonTotals.Turnovers / NULLIF(PlayerSeasonTotals.GamesPlayed, 0) AS Turnovers,
+            PlayerSeasonTotals.Fouls / NULLIF(PlayerSeasonTotals.GamesPlayed, 0) AS Fouls
+        FROM Player
+        LEFT JOIN PlayerSeasonTotals
+            ON Player.PlayerID = PlayerSeasonTotals.PlayerID
+        WHERE Player.PlayerID = %s;
         """
-        self.cursor.execute(query, (player_name,))
-        return self.cursor.fetchone()
+        return self._fetchone(query, (player_id,))
 
 
 
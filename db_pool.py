@@ -0,0 +1,238 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from contextlib import contextmanager
+
+import mysql.connector
+import streamlit as st
+
+# module holds one bounded pool of MySQL connections per process.
+# Streamlit imports this module once, so every session and every rerun
+# borrows from the same pool instead of opening a new TLS connection.
+
+DEFAULT_POOL_SIZE = 8
+PREPARED_PER_CONNECTION = 32    # server-side statements kept open per connection
+ACQUIRE_TIMEOUT = 10    # seconds a caller waits for a free connection
+PING_AFTER_IDLE = 30    # seconds idle before a connection is health-checked
+
+_pool = None
+_pool_lock = threading.Lock()
+_read_pool = None
+_executor = None
+_executor_lock = threading.Lock()
+
+
+class StatementCache():
+    # server-side prepared statements for one pooled connection, keyed by
+    # SQL text. Each statement is a prepared cursor that MySQL parsed once;
+    # executing it again only sends the parameters (binary protocol).
+    # A connection is lent to one caller at a time, so no lock is needed.
+    def __init__(self, connection, max_statements=PREPARED_PER_CONNECTION):
+        self.connection = connection
+        self.max_statements = max_statements
+        self._cursors = OrderedDict()
+
+    # returns the prepared cursor for query, preparing it on first use
+    def cursor(self, query):
+        cursor = self._cursors.get(query)
+        if cursor is not None:
+            self._cursors.move_to_end(query)
+            return cursor
+        cursor = self.connection.cursor(prepared=True)
+        self._cursors[query] = cursor
+        while len(self._cursors) > self.max_statements:
+            _, oldest = self._cursors.popitem(last=False)
+            self._close_cursor(oldest)
+        return cursor
+
+    # drops one statement, e.g. after it failed mid-execute
+    def discard(self, query):
+        cursor = self._cursors.pop(query, None)
+        if cursor is not None:
+            self._close_cursor(cursor)
+
+    def clear(self):
+        cursors, self._cursors = self._cursors, OrderedDict()
+        for cursor in cursors.values():
+            self._close_cursor(cursor)
+
+    @staticmethod
+    def _close_cursor(cursor):
+        try:
+            cursor.close()
+        except Exception:
+            pass
+
+
+class ConnectionPool():
+    def __init__(self, config, size=DEFAULT_POOL_SIZE,
+                 acquire_timeout=ACQUIRE_TIMEOUT, ping_after_idle=PING_AFTER_IDLE):
+        self.config = config
+        self.size = size
+        self.acquire_timeout = acquire_timeout
+        self.ping_after_idle = ping_after_idle
+        # one slot per connection that may exist at the same time
+        self._slots = threading.BoundedSemaphore(size)
+        # idle connections as (connection, last_used) pairs, most recent last
+        self._idle = []
+        self._idle_lock = threading.Lock()
+        # prepared statements per live connection, keyed by id(connection)
+        self._statements = {}
+
+    # opens a brand new connection; reads run in autocommit mode so a
+    # pooled connection never holds an old snapshot between borrows
+    def _connect(self):
+        connection = mysql.connector.connect(**self.config)
+        connection.autocommit = True
+        return connection
+
+    # function makes sure an idle connection is still usable before
+    # handing it out. Recently used connections are trusted without a ping.
+    def _health_check(self, connection, last_used):
+        if time.monotonic() - last_used < self.ping_after_idle:
+            return connection
+        try:
+            session = connection.connection_id
+            connection.ping(reconnect=True, attempts=2, delay=0)
+            connection.autocommit = True
+            if connection.connection_id != session:
+                # a reconnect opened a new session; its prepared statements are gone
+                self._forget_statements(connection)
+            return connection
+        except mysql.connector.Error:
+            self._close_quietly(connection)
+            return self._connect()
+
+    def _close_quietly(self, connection):
+        self._forget_statements(connection)
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    # returns the prepared-statement cache of a borrowed connection
+    def statements(self, connection):
+        with self._idle_lock:
+            cache = self._statements.get(id(connection))
+            if cache is None:
+                cache = self._statements[id(connection)] = StatementCache(connection)
+        return cache
+
+    def _forget_statements(self, connection):
+        with self._idle_lock:
+            cache = self._statements.pop(id(connection), None)
+        if cache is not None:
+            cache.clear()
+
+    def _checkout(self):
+        with self._idle_lock:
+            entry = self._idle.pop() if self._idle else None
+        if entry is None:
+            return self._connect()
+        return self._health_check(*entry)
+
+    def _checkin(self, connection):
+        with self._idle_lock:
+            self._idle.append((connection, time.monotonic()))
+
+    # context manager that lends a connection to exactly one caller.
+    # Blocks up to acquire_timeout when every connection is in use.
+    # Connections that raised a connection-level error are thrown away
+    # instead of being returned to the pool.
+    @contextmanager
+    def connection(self):
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            raise mysql.connector.errors.PoolError(
+                f"No free database connection after {self.acquire_timeout}s "
+                f"(pool size {self.size})"
+            )
+        connection = None
+        try:
+            connection = self._checkout()
+            yield connection
+        except (mysql.connector.errors.OperationalError,
+                mysql.connector.errors.InterfaceError):
+            if connection is not None:
+                self._close_quietly(connection)
+                connection = None
+            raise
+        finally:
+            if connection is not None:
+                if connection.in_transaction:
+                    try:
+                        connection.rollback()
+                    except mysql.connector.Error:
+                        self._close_quietly(connection)
+                        connection = None
+                if connection is not None:
+                    self._checkin(connection)
+            self._slots.release()
+
+    # closes every idle connection; borrowed ones close when returned
+    def close_all(self):
+        with self._idle_lock:
+            idle, self._idle = self._idle, []
+        for connection, _ in idle:
+            self._close_quietly(connection)
+
+
+# function builds connection parameters from Streamlit secrets. With
+# replica=True the [db.replica] section overrides the primary's settings,
+# so it usually only needs host and port.
+def _config_from_secrets(replica=False):
+    cfg = dict(st.secrets["db"])
+    if replica:
+        cfg.update(st.secrets["db"]["replica"])
+    return {
+        "host": cfg["host"],
+        "port": int(cfg["port"]),   # port is often stored as a string in secrets
+        "user": cfg["user"],
+        "password": cfg["password"],
+        "database": cfg["database"],
+        # C extension when installed; silently falls back to pure Python
+        "use_pure": False,
+    }
+
+
+# function returns the process-wide pool for the primary, creating it on
+# first use. Every write goes here.
+def get_pool():
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                size = int(st.secrets["db"].get("pool_size", DEFAULT_POOL_SIZE))
+                _pool = ConnectionPool(_config_from_secrets(), size=size)
+    return _pool
+
+
+# function returns the pool reads should use: a second pool for the MySQL
+# replica when secrets have a [db.replica] section, otherwise the primary's.
+#   [db.replica]
+#   host = "127.0.0.1"
+#   port = 3307
+def get_read_pool():
+    global _read_pool
+    if "replica" not in st.secrets["db"]:
+        return get_pool()
+    if _read_pool is None:
+        with _pool_lock:
+            if _read_pool is None:
+                cfg = st.secrets["db"]["replica"]
+                size = int(cfg.get("pool_size", st.secrets["db"].get("pool_size", DEFAULT_POOL_SIZE)))
+                _read_pool = ConnectionPool(_config_from_secrets(replica=True), size=size)
+    return _read_pool
+
+
+# function returns the process-wide thread pool used to run independent
+# reads at the same time. It has one worker per pooled connection, so
+# parallel reads never queue for a connection they could not get anyway.
+def get_executor():
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=get_pool().size,
+                                               thread_name_prefix="hoophub-read")
+    return _executor
@@ -0,0 +1,160 @@
+"""
+Schema Migration Runner
+-----------------------
+Applies the numbered SQL files in Migrations/ (001_*.sql, 002_*.sql, ...)
+that the database has not run yet, in order, and records each one in the
+SchemaMigrations table.
+MySQL commits DDL statements immediately, so a migration that fails part
+way is not rolled back: the runner stops at it and leaves it unrecorded.
+Fix the database by hand, then run again.
+
+A database created from HoopHubSchema.sql already records every migration.
+For a database upgraded by hand before this runner existed, mark what it
+already has with --baseline.
+
+Usage:
+python migrate.py                 apply pending migrations
+python migrate.py --status        list applied and pending migrations
+python migrate.py --baseline 010  record 001-010 as applied without running them
+"""
+
+import argparse
+import os
+import re
+from datetime import datetime
+
+import certifi
+import mysql.connector
+import streamlit as st
+
+# ==================== CONFIGURATION ====================
+cfg = st.secrets["db"]
+
+DB_CONFIG = {
+    "host": cfg["host"],
+    "port": int(cfg["port"]),
+    "user": cfg["user"],
+    "password": cfg["password"],
+    "database": cfg["database"],
+    "ssl_ca": certifi.where(),  # Aiven requires SSL; this keeps Streamlit happy
+}
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Migrations")
+MIGRATION_FILE = re.compile(r"^(\d+)_(\w+)\.sql$")
+
+CREATE_TRACKING_TABLE = """
+    CREATE TABLE IF NOT EXISTS SchemaMigrations(
+        Version INTEGER PRIMARY KEY NOT NULL,
+        Name VARCHAR(255) NOT NULL,
+        AppliedAt DATETIME NOT NULL
+    )
+"""
+
+
+# function returns [(version, name, path)] for every migration file, oldest first
+def find_migrations(directory=MIGRATIONS_DIR):
+    migrations = []
+    for filename in os.listdir(directory):
+        match = MIGRATION_FILE.match(filename)
+        if match:
+            migrations.append((int(match.group(1)), match.group(2), os.path.join(directory, filename)))
+    migrations.sort()
+    versions = [version for version, _, _ in migrations]
+    if len(versions) != len(set(versions)):
+        raise ValueError(f"Duplicate migration numbers in {directory}")
+    return migrations
+
+
+# function splits a migration file into statements. Migrations end every
+# statement with ";" at the end of a line and keep "--" comments on their
+# own lines, so no SQL parsing is needed.
+def split_statements(sql):
+    lines = [line for line in sql.splitlines() if not line.lstrip().startswith("--")]
+    statements = re.split(r";\s*$", "\n".join(lines), flags=re.MULTILINE)
+    return [statement.strip() for statement in statements if statement.strip()]
+
+
+def applied_versions(cursor):
+    cursor.execute("SELECT Version FROM SchemaMigrations")
+    return {row[0] for row in cursor.fetchall()}
+
+
+def record(cursor, version, name):
+    cursor.execute(
+        "INSERT INTO SchemaMigrations (Version, Name, AppliedAt) VALUES (%s, %s, %s)",
+        (version, name, datetime.now()),
+    )
+
+
+# ==================== RUN ====================
+def main():
+    parser = argparse.ArgumentParser(description="Apply pending HoopHub schema migrations.")
+    parser.add_argument("--status", action="store_true", help="list migrations without applying any")
+    parser.add_argument("--baseline", type=int, metavar="VERSION",
+                        help="record migrations up to VERSION as applied without running them")
+    args = parser.parse_args()
+
+    try:
+        db = mysql.connector.connect(**DB_CONFIG)
+        db.autocommit = False
+        cursor = db.cursor()
+        print("✓ Connected to database")
+    except Exception as e:
+        print(f"✗ Database connection failed: {e}")
+        return 1
+
+    try:
+        cursor.execute(CREATE_TRACKING_TABLE)
+        migrations = find_migrations()
+        applied = applied_versions(cursor)
+
+        if args.status:
+            for version, name, _ in migrations:
+                state = "applied" if version in applied else "pending"
+                print(f"  {version:03d} {name:<40} {state}")
+            return 0
+
+        if args.baseline is not None:
+            marked = 0
+            for version, name, _ in migrations:
+                if version <= args.baseline and version not in applied:
+                    record(cursor, version, name)
+                    marked += 1
+            db.commit()
+            print(f"✓ Recorded {marked} migration(s) up to {args.baseline:03d} as applied")
+            return 0
+
+        pending = [m for m in migrations if m[0] not in applied]
+        if not pending:
+            print("✓ Schema is up to date")
+            return 0
+
+        for version, name, path in pending:
+            print(f"Applying {version:03d}_{name}...")
+            with open(path, encoding="utf-8") as f:
+                statements = split_statements(f.read())
+            try:
+                for statement in statements:
+                    cursor.execute(statement)
+                record(cursor, version, name)
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                print(f"🚨 ERROR: {version:03d}_{name} failed, stopping here.")
+                print(f"Details: {e}")
+                print("DDL statements before the failure may already be applied.")
+                return 1
+            print(f"  ✓ {len(statements)} statement(s)")
+
+        # schema changed under the app: drop its cached reads
+        cursor.execute("UPDATE DataVersion SET Version = Version + 1 WHERE VersionID = 1")
+        db.commit()
+        print(f"\n✓ Applied {len(pending)} migration(s)")
+        return 0
+    finally:
+        cursor.close()
+        db.close()
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,222 @@
+import functools
+import threading
+import time
+from collections import OrderedDict
+
+# module holds the process-wide read-through cache used by db_operations.
+# Entries are keyed by method name and arguments and are only valid for
+# one "data version": every write path bumps the DataVersion row in the
+# database, and a changed version clears the whole cache.
+# It also holds the single-flight group that lets identical queries running
+# at the same time share one database round trip.
+
+DEFAULT_MAX_ENTRIES = 512
+# seconds between DataVersion checks. 0 checks on every cached read, so a
+# write from another process (the ingest scripts, RebuildSummaries.py,
+# BackfillStatTeams.py) is never served stale once it has committed; the
+# check is one primary-key read. Writes made by this process invalidate
+# without it. With the local read replica on, the version is read from the
+# replica, so cached and uncached reads both follow its refresh_interval.
+VERSION_CHECK_INTERVAL = 0
+
+_result_cache = None
+_result_cache_lock = threading.Lock()
+
+
+def _copy(value):
+    # callers get their own list (or DataFrame / dict of columns) so
+    # mutating it cannot poison shared results
+    if isinstance(value, list):
+        return list(value)
+    if isinstance(value, dict):
+        return dict(value)
+    if hasattr(value, "columns") and hasattr(value, "copy"):
+        return value.copy(deep=False)
+    return value
+
+
+class LRUCache():
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+
+    # returns (hit, value) and marks the entry as most recently used
+    def get(self, key):
+        if key not in self._entries:
+            return False, None
+        self._entries.move_to_end(key)
+        return True, self._entries[key]
+
+    # stores value and evicts the least recently used entry when full
+    def put(self, key, value):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class ResultCache():
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, check_interval=VERSION_CHECK_INTERVAL):
+        self.entries = LRUCache(max_entries)
+        self.check_interval = check_interval
+        self.version = None
+        self.checked_at = 0.0
+        # bumped on every clear so a result computed before an
+        # invalidation is never stored after it
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    # function compares the cached data version with the database, at most
+    # once per check_interval (every call at the default 0). read_version is
+    # called without holding the lock.
+    def sync_version(self, read_version):
+        now = time.monotonic()
+        with self._lock:
+            if self.version is not None and now - self.checked_at < self.check_interval:
+                return
+        version = read_version()
+        with self._lock:
+            if version != self.version:
+                self.entries.clear()
+                self.generation += 1
+                self.version = version
+            self.checked_at = now
+
+    def get(self, key):
+        with self._lock:
+            hit, value = self.entries.get(key)
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+            return hit, value
+
+    def put(self, key, value, generation):
+        with self._lock:
+            if generation == self.generation:
+                self.entries.put(key, value)
+
+    # drops every entry and forces the next read to re-check the version
+    def invalidate(self):
+        with self._lock:
+            self.entries.clear()
+            self.generation += 1
+            self.version = None
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self.entries),
+                "max_entries": self.entries.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "version": self.version,
+            }
+
+
+class _InFlightQuery():
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight():
+    # coalesces identical queries that are running at the same time:
+    # the first caller executes, later callers with the same key wait
+    # for it and share its result (or its exception)
+    def __init__(self):
+        self._in_flight = {}
+        self._lock = threading.Lock()
+        self.executed = 0
+        self.coalesced = 0
+
+    def do(self, key, fn):
+        with self._lock:
+            call = self._in_flight.get(key)
+            leader = call is None
+            if leader:
+                call = _InFlightQuery()
+                self._in_flight[key] = call
+                self.executed += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return _copy(call.result)
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            call.done.set()
+        return _copy(call.result)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "executed": self.executed,
+                "coalesced": self.coalesced,
+                "in_flight": len(self._in_flight),
+            }
+
+
+_single_flight = SingleFlight()
+
+
+# function returns the process-wide single-flight group for queries
+def get_single_flight():
+    return _single_flight
+
+
+# function returns the process-wide result cache, creating it on first use
+def get_result_cache(max_entries=DEFAULT_MAX_ENTRIES):
+    global _result_cache
+    if _result_cache is None:
+        with _result_cache_lock:
+            if _result_cache is None:
+                _result_cache = ResultCache(max_entries)
+    return _result_cache
+
+
+# decorator for db_operations read methods. Serves repeated calls with the
+# same arguments from the result cache without touching the database.
+def read_through(method):
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        cache = self._active_result_cache()
+        if cache is None:
+            return method(self, *args, **kwargs)
+        key = (name, args, tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            return method(self, *args, **kwargs)
+
+        cache.sync_version(self._read_data_version)
+        hit, value = cache.get(key)
+        if hit:
+            return _copy(value)
+        generation = cache.generation
+        value = method(self, *args, **kwargs)
+        cache.put(key, value, generation)
+        return _copy(value)
+
+    return wrapper
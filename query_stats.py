@@ -0,0 +1,153 @@
+import json
+import logging
+import math
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import streamlit as st
+
+# module holds the process-wide query instrumentation used by db_operations.
+# When enabled, every statement sent to MySQL is timed and recorded under
+# the db_operations method that issued it, together with the number of
+# rows it returned (reads) or affected (writes). Statements slower than
+# slow_query_ms are logged with their SQL and parameters.
+# When disabled, db_operations only checks the enabled flag, so the
+# instrumentation costs one attribute lookup per query.
+#
+# Configured from an optional [query_stats] section in Streamlit secrets:
+#   enabled = true
+#   slow_query_ms = 250
+#   dump_path = "logs/query_stats.jsonl"
+
+DEFAULT_SLOW_QUERY_MS = 500
+# latencies kept per method for the percentiles; older samples roll off
+SAMPLE_WINDOW = 2048
+DEFAULT_DUMP_PATH = "logs/query_stats.jsonl"
+
+logger = logging.getLogger("hoophub.slow_queries")
+
+_query_stats = None
+_query_stats_lock = threading.Lock()
+
+
+# function returns the nearest-rank percentile of an already sorted list
+def _percentile(ordered, pct):
+    if not ordered:
+        return None
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return round(ordered[rank - 1], 3)
+
+
+class MethodStats():
+    def __init__(self, window=SAMPLE_WINDOW):
+        self.calls = 0
+        self.errors = 0
+        self.slow = 0
+        self.rows = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.samples = deque(maxlen=window)
+
+    def record(self, elapsed_ms, rows, failed, slow):
+        self.calls += 1
+        self.errors += 1 if failed else 0
+        self.slow += 1 if slow else 0
+        self.rows += rows
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.samples.append(elapsed_ms)
+
+    def summary(self):
+        ordered = sorted(self.samples)
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "slow": self.slow,
+            "rows": self.rows,
+            "avg_rows": round(self.rows / self.calls, 1) if self.calls else 0,
+            "total_ms": round(self.total_ms, 3),
+            "avg_ms": round(self.total_ms / self.calls, 3) if self.calls else 0,
+            "p50_ms": _percentile(ordered, 50),
+            "p95_ms": _percentile(ordered, 95),
+            "p99_ms": _percentile(ordered, 99),
+            "max_ms": round(self.max_ms, 3),
+        }
+
+
+class QueryStats():
+    def __init__(self, enabled=False, slow_query_ms=DEFAULT_SLOW_QUERY_MS,
+                 window=SAMPLE_WINDOW, dump_path=DEFAULT_DUMP_PATH):
+        self.enabled = enabled
+        # None turns slow-query logging off while still collecting timings
+        self.slow_query_ms = slow_query_ms
+        self.window = window
+        self.dump_path = dump_path
+        self._methods = {}
+        self._lock = threading.Lock()
+
+    def record(self, method, query, params, elapsed_ms, rows=0, error=None):
+        slow = self.slow_query_ms is not None and elapsed_ms >= self.slow_query_ms
+        with self._lock:
+            stats = self._methods.get(method)
+            if stats is None:
+                stats = self._methods[method] = MethodStats(self.window)
+            stats.record(elapsed_ms, rows, error is not None, slow)
+        if slow:
+            logger.warning(
+                "slow query in %s: %.1f ms, %d rows\nSQL: %s\nparams: %r",
+                method, elapsed_ms, rows, " ".join(query.split()), params,
+            )
+
+    # context manager that times one statement. The caller stores the
+    # row count in sample["rows"] before the block ends.
+    @contextmanager
+    def timed(self, method, query, params):
+        sample = {"rows": 0}
+        error = None
+        start = time.perf_counter()
+        try:
+            yield sample
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self.record(method, query, params, elapsed_ms, sample["rows"], error)
+
+    # function returns one summary dict per method, slowest total first
+    def summary(self):
+        with self._lock:
+            rows = [dict(method=name, **stats.summary()) for name, stats in self._methods.items()]
+        return sorted(rows, key=lambda row: row["total_ms"], reverse=True)
+
+    # function appends the current summary to a JSON-lines file, one line
+    # per method, all stamped with the same dump time. Returns the path.
+    def dump(self, path=None):
+        path = path or self.dump_path
+        dumped_at = time.strftime("%Y-%m-%dT%H:%M:%S")
+        with open(path, "a", encoding="utf-8") as f:
+            for row in self.summary():
+                f.write(json.dumps(dict(dumped_at=dumped_at, **row)) + "\n")
+        return path
+
+    def reset(self):
+        with self._lock:
+            self._methods.clear()
+
+
+# function returns the process-wide query stats, creating it on first use
+def get_query_stats():
+    global _query_stats
+    if _query_stats is None:
+        with _query_stats_lock:
+            if _query_stats is None:
+                cfg = st.secrets.get("query_stats", {})
+                slow_query_ms = cfg.get("slow_query_ms", DEFAULT_SLOW_QUERY_MS)
+                _query_stats = QueryStats(
+                    enabled=bool(cfg.get("enabled", False)),
+                    slow_query_ms=float(slow_query_ms) if slow_query_ms is not None else None,
+                    dump_path=cfg.get("dump_path", DEFAULT_DUMP_PATH),
+                )
+    return _query_stats
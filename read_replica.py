@@ -0,0 +1,334 @@
+import datetime
+import decimal
+import functools
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+
+import streamlit as st
+
+# module keeps an embedded SQLite copy of the MySQL data on the app host
+# so db_operations can answer SELECTs locally. Writes still go to MySQL.
+# The copy is refreshed whenever the MySQL DataVersion changes (checked at
+# most every refresh_interval seconds, and right away after a write or an
+# ingest run from the Admin page):
+#  - every table is copied in full, read from one consistent MySQL snapshot.
+#    The whole dataset is a few hundred KB, so a full copy is cheap, and it
+#    sees every kind of change: backfilled games below the newest GameID,
+#    deleted players' stats and UPDATEs such as BackfillStatTeams.py's
+#  - before the copy commits, each table's row count and checksum are
+#    compared with MySQL's; a mismatch rolls the copy back
+# If MySQL cannot be reached the replica keeps serving what it has.
+#
+# Configured from an optional [replica] section in Streamlit secrets:
+#   enabled = true
+#   path = "hoophub_replica.sqlite3"
+#   refresh_interval = 5
+
+DEFAULT_PATH = "hoophub_replica.sqlite3"
+REFRESH_INTERVAL = 5    # seconds between DataVersion checks against MySQL
+FETCH_BATCH_SIZE = 500  # rows per fetchmany in select_columns
+
+# tables copied on every refresh: (table, primary key columns)
+REPLICA_TABLES = [
+    ("HeadCoach", ("CoachID",)),
+    ("Venue", ("VenueID",)),
+    ("Team", ("TeamID",)),
+    ("Player", ("PlayerID",)),
+    ("TeamSeasonSummary", ("TeamID",)),
+    ("HeadToHead", ("TeamID", "OpponentID")),
+    ("PlayerSeasonTotals", ("PlayerID",)),
+    ("PlayerOpponentSplit", ("PlayerID", "OpponentTeamID")),
+    ("DataVersion", ("VersionID",)),
+    ("Game", ("GameID",)),
+    ("PlayerGameStats", ("GameID", "PlayerID")),
+    ("PlayerMatchup", ("GameID", "PlayerID", "OpponentPlayerID")),
+]
+# secondary indexes the app's reads rely on
+REPLICA_INDEXES = [
+    ("Game", ("Date",)),
+    ("Game", ("HomeTeamID",)),
+    ("Game", ("AwayTeamID",)),
+    ("Player", ("TeamID",)),
+    ("Player", ("FullName",)),
+    ("PlayerGameStats", ("PlayerID",)),
+    ("PlayerGameStats", ("GameID", "TeamID")),
+    ("PlayerMatchup", ("PlayerID", "OpponentPlayerID")),
+]
+
+_replica = None
+_replica_lock = threading.Lock()
+
+# SQLite stores these as text/real; MySQL hands them over as Python objects
+sqlite3.register_adapter(decimal.Decimal, float)
+sqlite3.register_adapter(datetime.datetime, lambda value: value.isoformat(" "))
+sqlite3.register_adapter(datetime.date, lambda value: value.isoformat())
+
+_DATE_TEXT = re.compile(r"^\d{4}-\d{2}-\d{2}( \d{2}:\d{2}:\d{2})?$")
+
+
+# function rewrites the MySQL dialect db_operations uses into SQLite:
+# %s / %(name)s placeholders, IF(), JSON_ARRAYAGG() and "/" (which is
+# integer division between two INTEGER columns in SQLite)
+@functools.lru_cache(maxsize=256)
+def translate(query):
+    query = re.sub(r"%\((\w+)\)s", r":\1", query)
+    query = query.replace("%s", "?")
+    query = re.sub(r"\bIF\(", "IIF(", query)
+    query = re.sub(r"\bJSON_ARRAYAGG\(", "json_group_array(", query)
+    return query.replace(" / ", " * 1.0 / ")
+
+
+# MySQL CONCAT: NULL if any argument is NULL
+def _concat(*values):
+    if any(value is None for value in values):
+        return None
+    return "".join(str(value) for value in values)
+
+
+# function turns date/datetime text back into the objects MySQL returns
+def _convert_value(value):
+    if type(value) is str and len(value) in (10, 19) and _DATE_TEXT.match(value):
+        if len(value) == 10:
+            return datetime.date.fromisoformat(value)
+        return datetime.datetime.fromisoformat(value)
+    return value
+
+
+# function maps a value from either side to the form SQLite stores, so a
+# MySQL row and its replica copy checksum the same
+def _checksum_value(value):
+    if isinstance(value, decimal.Decimal):
+        return float(value)
+    if isinstance(value, datetime.datetime):
+        return value.isoformat(" ")
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    if isinstance(value, bytearray):
+        return bytes(value)
+    return value
+
+
+# function returns an order-independent checksum of a table's rows: the
+# sum of each row's SHA-256 prefix, so MySQL's and SQLite's row order
+# (and duplicate rows) do not matter
+def _checksum(rows):
+    total = 0
+    for row in rows:
+        digest = hashlib.sha256(repr(tuple(_checksum_value(v) for v in row)).encode("utf-8"))
+        total += int.from_bytes(digest.digest()[:8], "big")
+    return f"{total % 2 ** 64:016x}"
+
+
+class ReplicaMismatch(Exception):
+    pass
+
+
+class ReplicaStore():
+    def __init__(self, path=DEFAULT_PATH, refresh_interval=REFRESH_INTERVAL):
+        self.path = path
+        self.refresh_interval = refresh_interval
+        self.checked_at = 0.0
+        self.last_error = None
+        self.last_sync = None
+        self._local = threading.local()
+        self._sync_lock = threading.Lock()
+        conn = self._connection()
+        conn.execute("CREATE TABLE IF NOT EXISTS ReplicaState (Name TEXT PRIMARY KEY, Value)")
+        row = conn.execute("SELECT Value FROM ReplicaState WHERE Name = 'DataVersion'").fetchone()
+        # MySQL DataVersion the local copy matches; None until the first sync
+        self.synced_version = row[0] if row else None
+
+    # every thread gets its own SQLite connection; WAL lets reads continue
+    # while a refresh is writing
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # autocommit; _sync opens its own transaction so table rebuilds
+            # and row copies commit or roll back together
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None,
+                                   check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.create_function("CONCAT", -1, _concat, deterministic=True)
+            self._local.conn = conn
+        return conn
+
+    # True once the replica holds a full copy and can serve reads
+    @property
+    def ready(self):
+        return self.synced_version is not None
+
+    def select(self, query, params=None):
+        if params is None:
+            params = ()
+        rows = self._connection().execute(translate(query), params).fetchall()
+        return [tuple(_convert_value(value) for value in row) for row in rows]
+
+    # function returns the result as one list per column, read batch_size
+    # rows at a time (see db_operations._read_columns)
+    def select_columns(self, query, params, width, batch_size=FETCH_BATCH_SIZE):
+        if params is None:
+            params = ()
+        cursor = self._connection().execute(translate(query), params)
+        values = [[] for _ in range(width)]
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return values
+            for column, batch in zip(values, zip(*rows)):
+                column.extend(_convert_value(value) for value in batch)
+
+    # forces the next read to check MySQL for new data
+    def mark_stale(self):
+        self.checked_at = 0.0
+
+    # function brings the replica up to date when the MySQL DataVersion
+    # moved; force=True copies even if it did not. Checks at most once per
+    # refresh_interval; a failed check (e.g. MySQL unreachable or a copy
+    # that did not verify) is remembered and reads carry on locally.
+    def refresh(self, pool, force=False):
+        now = time.monotonic()
+        if not force and now - self.checked_at < self.refresh_interval:
+            return False
+        with self._sync_lock:
+            if not force and now - self.checked_at < self.refresh_interval:
+                return False
+            try:
+                with pool.connection() as connection:
+                    cursor = connection.cursor()
+                    try:
+                        cursor.execute("SELECT Version FROM DataVersion WHERE VersionID = 1;")
+                        row = cursor.fetchone()
+                        version = row[0] if row else 0
+                        if force or version != self.synced_version:
+                            self._sync(connection, cursor)
+                    finally:
+                        cursor.close()
+                self.last_error = None
+                return True
+            except Exception as e:
+                self.last_error = f"{type(e).__name__}: {e}"
+                return False
+            finally:
+                self.checked_at = time.monotonic()
+
+    # function copies every MySQL table into the replica in one SQLite
+    # transaction. MySQL is read inside a consistent snapshot, so the
+    # tables and the DataVersion recorded with them all match one moment;
+    # a write that lands meanwhile bumps DataVersion past it and the next
+    # refresh copies again. Nothing commits locally until every table's
+    # row count and checksum match what MySQL returned.
+    def _sync(self, connection, cursor):
+        started = time.perf_counter()
+        verified = {}
+        conn = self._connection()
+        cursor.execute("START TRANSACTION WITH CONSISTENT SNAPSHOT")
+        try:
+            cursor.execute("SELECT Version FROM DataVersion WHERE VersionID = 1;")
+            row = cursor.fetchone()
+            version = row[0] if row else 0
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                for table, key in REPLICA_TABLES:
+                    columns = self._prepare_table(conn, cursor, table, key)
+                    cursor.execute(f"SELECT COUNT(*) FROM {table}")
+                    expected_count = cursor.fetchone()[0]
+                    cursor.execute(f"SELECT {', '.join(columns)} FROM {table}")
+                    rows = cursor.fetchall()
+                    conn.execute(f"DELETE FROM {table}")
+                    self._insert(conn, table, columns, rows)
+                    verified[table] = self._verify(conn, table, columns, rows, expected_count)
+
+                for table, columns in REPLICA_INDEXES:
+                    conn.execute(
+                        f"CREATE INDEX IF NOT EXISTS idx_{table}_{'_'.join(columns)} "
+                        f"ON {table} ({', '.join(columns)})"
+                    )
+                conn.execute(
+                    "INSERT OR REPLACE INTO ReplicaState (Name, Value) VALUES ('DataVersion', ?)",
+                    (version,),
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        finally:
+            connection.rollback()
+        self.synced_version = version
+        self.last_sync = {
+            "at": datetime.datetime.now().isoformat(" ", "seconds"),
+            "version": version,
+            "tables": verified,
+            "seconds": round(time.perf_counter() - started, 3),
+        }
+
+    # function checks one copied table against MySQL: the local row count
+    # must equal MySQL's COUNT(*) and the rows read back must checksum the
+    # same as the rows MySQL sent. Returns {"rows": n, "checksum": ...}.
+    @staticmethod
+    def _verify(conn, table, columns, rows, expected_count):
+        local_count = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        if local_count != expected_count or len(rows) != expected_count:
+            raise ReplicaMismatch(
+                f"{table}: MySQL has {expected_count} rows, read {len(rows)}, replica holds {local_count}"
+            )
+        expected = _checksum(rows)
+        local = _checksum(conn.execute(f"SELECT {', '.join(columns)} FROM {table}"))
+        if local != expected:
+            raise ReplicaMismatch(f"{table}: replica checksum {local} != MySQL checksum {expected}")
+        return {"rows": local_count, "checksum": local}
+
+    # function creates the local table with MySQL's current columns. When
+    # the MySQL table gained or lost columns the local one is rebuilt.
+    @staticmethod
+    def _prepare_table(conn, cursor, table, key):
+        cursor.execute(f"SELECT * FROM {table} LIMIT 0")
+        cursor.fetchall()
+        columns = [d[0] for d in cursor.description]
+        existing = [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+        if existing != columns:
+            conn.execute(f"DROP TABLE IF EXISTS {table}")
+            # untyped columns keep whatever type MySQL sent; NOCASE matches
+            # MySQL's case-insensitive string comparisons
+            definitions = ", ".join(f"{column} COLLATE NOCASE" for column in columns)
+            conn.execute(f"CREATE TABLE {table} ({definitions}, PRIMARY KEY ({', '.join(key)}))")
+        return columns
+
+    @staticmethod
+    def _insert(conn, table, columns, rows):
+        if rows:
+            placeholders = ", ".join("?" * len(columns))
+            conn.executemany(
+                f"INSERT OR REPLACE INTO {table} ({', '.join(columns)}) VALUES ({placeholders})",
+                rows,
+            )
+
+    def status(self):
+        return {
+            "path": os.path.abspath(self.path),
+            "ready": self.ready,
+            "synced_version": self.synced_version,
+            "last_sync": self.last_sync,
+            "last_error": self.last_error,
+        }
+
+
+# function returns the process-wide replica, or None when it is not
+# enabled in secrets
+def get_replica():
+    global _replica
+    if _replica is None:
+        with _replica_lock:
+            if _replica is None:
+                cfg = st.secrets.get("replica", {})
+                if not cfg.get("enabled", False):
+                    return None
+                _replica = ReplicaStore(
+                    path=cfg.get("path", DEFAULT_PATH),
+                    refresh_interval=float(cfg.get("refresh_interval", REFRESH_INTERVAL)),
+                )
+    return _replica